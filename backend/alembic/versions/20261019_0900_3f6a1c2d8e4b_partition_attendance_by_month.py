@@ -0,0 +1,93 @@
+"""Partition attendance by month
+
+Revision ID: 3f6a1c2d8e4b
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+Recreates attendance as a table range partitioned on date, with one
+partition per month that has rows, the current month and the next
+MONTHS_AHEAD months, plus a default partition, and copies the rows over.
+The primary key becomes (id, date), as it has to include the partition key.
+Writes to attendance wait while the rows are copied.
+
+Databases created by scripts/init_db.py are already partitioned and are
+left as they are.
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6a1c2d8e4b'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+
+def _relkind(table: str):
+    """'r' for a plain table, 'p' for a partitioned one, None if missing."""
+    return op.get_bind().execute(
+        sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+    ).scalar()
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_partitions(table: str, parent: str, column: str) -> None:
+    """Partition `parent` (to be renamed `table`) for every month `table` has rows in, and the coming months."""
+    months = set(op.get_bind().execute(
+        sa.text(f"SELECT DISTINCT CAST(date_trunc('month', {column}) AS date) FROM {table}")
+    ).scalars())
+    month = date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD + 1):
+        months.add(month)
+        month = _next_month(month)
+
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {parent} DEFAULT")
+    for month in sorted(months):
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {parent}"
+            f" FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+
+
+def _create_indexes() -> None:
+    op.create_unique_constraint('unique_employee_date', 'attendance', ['employee_id', 'date'])
+    op.create_foreign_key('attendance_employee_id_fkey', 'attendance', 'employees', ['employee_id'], ['id'])
+    op.create_index('ix_attendance_id', 'attendance', ['id'])
+    op.create_index('ix_attendance_employee_id', 'attendance', ['employee_id'])
+    op.create_index('ix_attendance_date', 'attendance', ['date'])
+
+
+def upgrade() -> None:
+    if _relkind('attendance') != 'r':
+        return
+    op.execute("LOCK TABLE attendance IN SHARE MODE")
+    op.execute("CREATE TABLE attendance_partitioned (LIKE attendance INCLUDING DEFAULTS) PARTITION BY RANGE (date)")
+    _create_partitions('attendance', 'attendance_partitioned', 'date')
+    op.execute("INSERT INTO attendance_partitioned SELECT * FROM attendance")
+    op.drop_table('attendance')
+    op.rename_table('attendance_partitioned', 'attendance')
+
+    op.create_primary_key('attendance_pkey', 'attendance', ['id', 'date'])
+    _create_indexes()
+    op.execute("ANALYZE attendance")
+
+
+def downgrade() -> None:
+    if _relkind('attendance') != 'p':
+        return
+    op.execute("LOCK TABLE attendance IN SHARE MODE")
+    op.execute("CREATE TABLE attendance_unpartitioned (LIKE attendance INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO attendance_unpartitioned SELECT * FROM attendance")
+    op.drop_table('attendance')
+    op.rename_table('attendance_unpartitioned', 'attendance')
+
+    op.create_primary_key('attendance_pkey', 'attendance', ['id'])
+    _create_indexes()
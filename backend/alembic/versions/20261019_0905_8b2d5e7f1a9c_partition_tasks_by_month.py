@@ -0,0 +1,113 @@
+"""Partition tasks by month
+
+Revision ID: 8b2d5e7f1a9c
+Revises: 3f6a1c2d8e4b
+Create Date: 2026-10-19 09:05:00.000000
+
+Recreates tasks as a table range partitioned on due_date, with one
+partition per month that has rows, the current month and the next
+MONTHS_AHEAD months, plus a default partition, and copies the rows over.
+
+A partitioned table's primary key and unique indexes must include the
+partition key, so:
+- the primary key becomes (id, due_date)
+- task_number keeps a plain index; generate_task_number assigns it
+- foreign keys to tasks.id (task_labels, task_comments, notifications and
+  tasks.parent_task_id) are dropped; the ORM relationships on Task delete
+  comments and labels and clear notifications.task_id instead
+
+Writes to tasks wait while the rows are copied. Downgrading restores the
+foreign keys, which fails if rows point at deleted tasks.
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2d5e7f1a9c'
+down_revision = '3f6a1c2d8e4b'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+
+def _relkind(table: str):
+    """'r' for a plain table, 'p' for a partitioned one, None if missing."""
+    return op.get_bind().execute(
+        sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+    ).scalar()
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_partitions(table: str, parent: str, column: str) -> None:
+    """Partition `parent` (to be renamed `table`) for every month `table` has rows in, and the coming months."""
+    months = set(op.get_bind().execute(
+        sa.text(f"SELECT DISTINCT CAST(date_trunc('month', {column}) AS date) FROM {table}")
+    ).scalars())
+    month = date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD + 1):
+        months.add(month)
+        month = _next_month(month)
+
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {parent} DEFAULT")
+    for month in sorted(months):
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {parent}"
+            f" FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+
+
+def _create_indexes(unique_task_number: bool) -> None:
+    op.create_foreign_key('tasks_assigned_to_fkey', 'tasks', 'employees', ['assigned_to'], ['id'])
+    op.create_foreign_key('tasks_assigned_by_fkey', 'tasks', 'users', ['assigned_by'], ['id'])
+    op.create_foreign_key('tasks_created_by_fkey', 'tasks', 'users', ['created_by'], ['id'])
+    op.create_index('ix_tasks_id', 'tasks', ['id'])
+    op.create_index('ix_tasks_task_number', 'tasks', ['task_number'], unique=unique_task_number)
+    op.create_index('ix_tasks_status', 'tasks', ['status'])
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date'])
+    op.create_index('ix_tasks_assigned_to', 'tasks', ['assigned_to'])
+    op.create_index('ix_tasks_parent_task_id', 'tasks', ['parent_task_id'])
+
+
+def upgrade() -> None:
+    if _relkind('tasks') != 'r':
+        return
+    op.execute("LOCK TABLE tasks IN SHARE MODE")
+    op.drop_constraint('task_labels_task_id_fkey', 'task_labels', type_='foreignkey')
+    op.drop_constraint('task_comments_task_id_fkey', 'task_comments', type_='foreignkey')
+    op.drop_constraint('notifications_task_id_fkey', 'notifications', type_='foreignkey')
+
+    op.execute("CREATE TABLE tasks_partitioned (LIKE tasks INCLUDING DEFAULTS) PARTITION BY RANGE (due_date)")
+    _create_partitions('tasks', 'tasks_partitioned', 'due_date')
+    op.execute("INSERT INTO tasks_partitioned SELECT * FROM tasks")
+    op.drop_table('tasks')
+    op.rename_table('tasks_partitioned', 'tasks')
+
+    op.create_primary_key('tasks_pkey', 'tasks', ['id', 'due_date'])
+    _create_indexes(unique_task_number=False)
+    op.execute("ANALYZE tasks")
+
+
+def downgrade() -> None:
+    if _relkind('tasks') != 'p':
+        return
+    op.execute("LOCK TABLE tasks IN SHARE MODE")
+    op.execute("CREATE TABLE tasks_unpartitioned (LIKE tasks INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO tasks_unpartitioned SELECT * FROM tasks")
+    op.drop_table('tasks')
+    op.rename_table('tasks_unpartitioned', 'tasks')
+
+    op.create_primary_key('tasks_pkey', 'tasks', ['id'])
+    _create_indexes(unique_task_number=True)
+    op.create_foreign_key('tasks_parent_task_id_fkey', 'tasks', 'tasks', ['parent_task_id'], ['id'])
+    op.create_foreign_key('task_labels_task_id_fkey', 'task_labels', 'tasks', ['task_id'], ['id'])
+    op.create_foreign_key('task_comments_task_id_fkey', 'task_comments', 'tasks', ['task_id'], ['id'])
+    op.create_foreign_key(
+        'notifications_task_id_fkey', 'notifications', 'tasks', ['task_id'], ['id'], ondelete='SET NULL'
+    )
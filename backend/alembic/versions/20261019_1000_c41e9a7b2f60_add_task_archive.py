@@ -0,0 +1,86 @@
+"""Add task archive
+
+Revision ID: c41e9a7b2f60
+Revises: 8b2d5e7f1a9c
+Create Date: 2026-10-19 10:00:00.000000
+
+Creates archived_tasks, archived_task_comments and archived_task_labels,
+where app.services.archive moves tasks completed more than
+TASK_ARCHIVE_AFTER_DAYS ago. Downgrading drops them with the archived rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e9a7b2f60'
+down_revision = '8b2d5e7f1a9c'
+branch_labels = None
+depends_on = None
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    """An enum type the tasks tables already created."""
+    return postgresql.ENUM(name=name, create_type=False)
+
+
+def upgrade() -> None:
+    if op.get_bind().execute(sa.text("SELECT to_regclass('archived_tasks')")).scalar() is not None:
+        return
+    op.create_table(
+        'archived_tasks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('task_number', sa.String(20), nullable=False),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('task_type', _enum('tasktype'), nullable=False),
+        sa.Column('priority', _enum('taskpriority'), nullable=False),
+        sa.Column('status', _enum('taskstatus'), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('due_time', sa.Time(), nullable=True),
+        sa.Column('assigned_to', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('assigned_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('parent_task_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('is_subtask', sa.Boolean(), nullable=False),
+        sa.Column('telegram_message_id', sa.BigInteger(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_archived_tasks_due_date', 'archived_tasks', ['due_date'])
+    op.create_index('ix_archived_tasks_assigned_to', 'archived_tasks', ['assigned_to'])
+    op.create_index('ix_archived_tasks_parent_task_id', 'archived_tasks', ['parent_task_id'])
+
+    op.create_table(
+        'archived_task_comments',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            'task_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('archived_tasks.id', ondelete='CASCADE'), nullable=False,
+        ),
+        sa.Column('comment_by_employee_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('comment_by_user_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('comment_text', sa.Text(), nullable=False),
+        sa.Column('comment_type', _enum('commenttype'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_archived_task_comments_task_id', 'archived_task_comments', ['task_id'])
+
+    op.create_table(
+        'archived_task_labels',
+        sa.Column(
+            'task_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('archived_tasks.id', ondelete='CASCADE'), primary_key=True,
+        ),
+        sa.Column('label_id', postgresql.UUID(as_uuid=True), primary_key=True),
+    )
+    op.create_index('ix_archived_task_labels_label_id', 'archived_task_labels', ['label_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('archived_task_labels')
+    op.drop_table('archived_task_comments')
+    op.drop_table('archived_tasks')
@@ -0,0 +1,37 @@
+"""Add task_numbers
+
+Revision ID: 5d7c3b9e0a12
+Revises: c41e9a7b2f60
+Create Date: 2026-10-19 11:00:00.000000
+
+Partitioning tasks dropped the unique index on task_number (it would have
+to include due_date). task_numbers holds every issued number instead;
+generate_task_number claims numbers in it. Backfilled from tasks and
+archived_tasks; existing duplicates are kept as they are.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7c3b9e0a12'
+down_revision = 'c41e9a7b2f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().execute(sa.text("SELECT to_regclass('task_numbers')")).scalar() is not None:
+        return
+    op.create_table(
+        'task_numbers',
+        sa.Column('task_number', sa.String(20), primary_key=True),
+    )
+    op.execute(
+        "INSERT INTO task_numbers (task_number)"
+        " SELECT task_number FROM tasks UNION SELECT task_number FROM archived_tasks"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('task_numbers')
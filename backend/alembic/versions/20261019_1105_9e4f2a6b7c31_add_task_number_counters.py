@@ -0,0 +1,40 @@
+"""Add task_number_counters
+
+Revision ID: 9e4f2a6b7c31
+Revises: 5d7c3b9e0a12
+Create Date: 2026-10-19 11:05:00.000000
+
+generate_task_number counted tasks to pick the next number, which went
+backwards as tasks were deleted or archived. task_number_counters keeps
+the last number per prefix ("T2026-", "T2026-001-S"), seeded from the
+highest issued number in task_numbers.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4f2a6b7c31'
+down_revision = '5d7c3b9e0a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().execute(sa.text("SELECT to_regclass('task_number_counters')")).scalar() is not None:
+        return
+    op.create_table(
+        'task_number_counters',
+        sa.Column('prefix', sa.String(20), primary_key=True),
+        sa.Column('last_value', sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO task_number_counters (prefix, last_value)"
+        " SELECT regexp_replace(task_number, '[0-9]+$', ''), max(CAST(substring(task_number FROM '[0-9]+$') AS integer))"
+        " FROM task_numbers WHERE task_number ~ '[0-9]+$'"
+        " GROUP BY 1"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('task_number_counters')
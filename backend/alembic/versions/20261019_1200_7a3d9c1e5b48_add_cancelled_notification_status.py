@@ -0,0 +1,28 @@
+"""Add cancelled notification status
+
+Revision ID: 7a3d9c1e5b48
+Revises: 9e4f2a6b7c31
+Create Date: 2026-10-19 12:00:00.000000
+
+Task messages that were held (coalesced or deferred until check-in) are
+marked CANCELLED when their task is closed or reassigned before delivery.
+Also adds the COALESCED and DEFERRED values to databases created before them.
+PostgreSQL can't drop enum values, so downgrading leaves them in place.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7a3d9c1e5b48'
+down_revision = '9e4f2a6b7c31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for value in ('COALESCED', 'DEFERRED', 'CANCELLED'):
+        op.execute(f"ALTER TYPE notificationstatus ADD VALUE IF NOT EXISTS '{value}'")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE notifications SET status = 'FAILED' WHERE status = 'CANCELLED'")
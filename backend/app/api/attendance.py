@@ -3,34 +3,52 @@ Attendance management API endpoints.
 """
 from typing import List
 from datetime import date, datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.etag import make_etag, etag_matches, etag_headers, not_modified
+from app.core.projection import schema_columns, fetch_rows
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.attendance import Attendance, AttendanceStatus
 from app.models.employee import Employee
+from app.models.resource_version import Resource
 from app.schemas.attendance import (
     AttendanceResponse,
     AttendanceCreate,
     AttendanceUpdate,
     AttendanceSummary,
 )
+from app.services.events import publish_attendance_event
+from app.services.notifications import release_on_check_in
+from app.services.resource_versions import get_resource_versions
 
 router = APIRouter()
 
+# Columns selected by the read-only history endpoint
+ATTENDANCE_COLUMNS = schema_columns(Attendance, AttendanceResponse)
+
 
 @router.get("/today", response_model=AttendanceSummary)
 async def get_today_attendance(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get today's attendance summary."""
     today = date.today()
 
+    versions = get_resource_versions(db, Resource.ATTENDANCE, Resource.EMPLOYEES)
+    etag = make_etag("attendance-today", today, versions)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+
     # Get total active employees
     total_employees = db.query(Employee).filter(Employee.is_active == True).count()
 
@@ -43,7 +61,7 @@ async def get_today_attendance(
     present = sum(1 for a in attendance_records if a.status == AttendanceStatus.PRESENT)
     absent = sum(1 for a in attendance_records if a.status == AttendanceStatus.ABSENT)
     half_day = sum(1 for a in attendance_records if a.status == AttendanceStatus.HALF_DAY)
-    on_leave = sum(1 for a in attendance_records if a.status == AttendanceStatus.ON_LEAVE)
+    on_leave = sum(1 for a in attendance_records if a.status == AttendanceStatus.LEAVE)
 
     not_marked = total_employees - len(attendance_records)
 
@@ -63,23 +81,22 @@ async def get_attendance_history(
     start_date: date | None = None,
     end_date: date | None = None,
     employee_id: UUID | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get attendance history with optional filtering."""
-    query = db.query(Attendance)
+    stmt = select(*ATTENDANCE_COLUMNS)
 
     if start_date:
-        query = query.filter(Attendance.date >= start_date)
+        stmt = stmt.where(Attendance.date >= start_date)
 
     if end_date:
-        query = query.filter(Attendance.date <= end_date)
+        stmt = stmt.where(Attendance.date <= end_date)
 
     if employee_id:
-        query = query.filter(Attendance.employee_id == employee_id)
+        stmt = stmt.where(Attendance.employee_id == employee_id)
 
-    attendance = query.order_by(Attendance.date.desc()).all()
-    return attendance
+    return ORJSONResponse(fetch_rows(db, stmt.order_by(Attendance.date.desc())))
 
 
 @router.post("/mark", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
@@ -112,6 +129,9 @@ async def mark_attendance(
         existing.status = attendance_data.status
         existing.marked_at = datetime.utcnow()
         existing.auto_marked = False
+        db.flush()
+        publish_attendance_event(db, existing)
+        release_on_check_in(db, existing)
         db.commit()
         db.refresh(existing)
         return existing
@@ -126,6 +146,9 @@ async def mark_attendance(
     )
 
     db.add(attendance)
+    db.flush()
+    publish_attendance_event(db, attendance)
+    release_on_check_in(db, attendance)
     db.commit()
     db.refresh(attendance)
 
@@ -156,6 +179,9 @@ async def update_attendance(
     attendance.marked_at = datetime.utcnow()
     attendance.auto_marked = False
 
+    db.flush()
+    publish_attendance_event(db, attendance)
+    release_on_check_in(db, attendance)
     db.commit()
     db.refresh(attendance)
 
@@ -167,7 +193,7 @@ async def get_attendance_report(
     start_date: date = Query(...),
     end_date: date = Query(...),
     employee_id: UUID | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Generate attendance report for a date range."""
@@ -193,7 +219,7 @@ async def get_attendance_report(
             "present": sum(1 for a in attendance_records if a.status == AttendanceStatus.PRESENT),
             "absent": sum(1 for a in attendance_records if a.status == AttendanceStatus.ABSENT),
             "half_day": sum(1 for a in attendance_records if a.status == AttendanceStatus.HALF_DAY),
-            "on_leave": sum(1 for a in attendance_records if a.status == AttendanceStatus.ON_LEAVE),
+            "on_leave": sum(1 for a in attendance_records if a.status == AttendanceStatus.LEAVE),
         },
         "auto_marked_count": sum(1 for a in attendance_records if a.auto_marked),
         "records": attendance_records,
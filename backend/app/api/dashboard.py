@@ -2,27 +2,52 @@
 Dashboard statistics API endpoints.
 """
 from datetime import date
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, raiseload
 
 from app.core.database import get_db
+from app.core.etag import content_etag, etag_matches, etag_headers, not_modified
+from app.core.invalidation import LocalCache
+from app.core.responses import TrustedSerializer
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.employee import Employee
 from app.models.attendance import Attendance, AttendanceStatus
 from app.models.task import Task, TaskStatus
+from app.schemas.task import TaskResponse
 
 router = APIRouter()
 
+TASK_SERIALIZER = TrustedSerializer(TaskResponse)
+
+# (etag, body) per day, evicted on any task, attendance or employee commit
+STATS_CACHE = LocalCache("dashboard-stats", watches=["tasks", "attendance", "employees"])
+
 
 @router.get("/stats")
 async def get_dashboard_stats(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get dashboard overview statistics."""
     today = date.today()
 
+    cached = STATS_CACHE.get(today)
+    if cached is None:
+        generation = STATS_CACHE.generation
+        cached = compute_dashboard_stats(db, today)
+        STATS_CACHE.put(today, cached, generation)
+
+    etag, body = cached
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return ORJSONResponse(body, headers=etag_headers(etag))
+
+
+def compute_dashboard_stats(db: Session, today: date):
+    """Compute dashboard statistics and their ETag."""
     # Attendance statistics
     total_employees = db.query(Employee).filter(Employee.is_active == True).count()
 
@@ -47,13 +72,14 @@ async def get_dashboard_stats(
     # Recent tasks (last 10)
     recent_tasks = (
         db.query(Task)
+        .options(raiseload("*"))
         .filter(Task.is_subtask == False)
         .order_by(Task.created_at.desc())
         .limit(10)
         .all()
     )
 
-    return {
+    body = {
         "attendance": {
             "today_present": today_present,
             "today_absent": today_absent,
@@ -66,5 +92,6 @@ async def get_dashboard_stats(
             "completed": completed,
             "overdue": overdue,
         },
-        "recent_tasks": recent_tasks,
+        "recent_tasks": TASK_SERIALIZER.dump_many(recent_tasks),
     }
+    return content_etag(body), body
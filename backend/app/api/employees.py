@@ -1,15 +1,19 @@
 """
 Employee management API endpoints.
 """
-from typing import List
+from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload, raiseload
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.projection import schema_columns, parse_fields, fetch_rows
+from app.core.responses import TrustedSerializer
 from app.core.security import get_current_user
 from app.models.user import User
-from app.models.employee import Employee, EmployeeLabel
+from app.models.employee import Employee, EmployeeLabel, employee_label_assignments
 from app.schemas.employee import (
     EmployeeResponse,
     EmployeeCreate,
@@ -21,22 +25,63 @@ from app.schemas.employee import (
 
 router = APIRouter()
 
+EMPLOYEE_SERIALIZER = TrustedSerializer(EmployeeResponse)
+LABEL_COLUMNS = schema_columns(EmployeeLabel, EmployeeLabelResponse)
+
+
+def attach_labels(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Attach label dicts to projected employee rows with a single query."""
+    labels_by_employee = {row["id"]: [] for row in rows}
+    if not labels_by_employee:
+        return
+
+    stmt = (
+        select(employee_label_assignments.c.employee_id, *LABEL_COLUMNS)
+        .join(EmployeeLabel, EmployeeLabel.id == employee_label_assignments.c.label_id)
+        .where(employee_label_assignments.c.employee_id.in_(labels_by_employee))
+    )
+    for label in fetch_rows(db, stmt):
+        labels_by_employee[label.pop("employee_id")].append(label)
+
+    for row in rows:
+        row["labels"] = labels_by_employee[row["id"]]
+
 
 # Employee endpoints
 @router.get("/", response_model=List[EmployeeResponse])
 async def get_employees(
     is_active: bool | None = None,
+    fields: str | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all employees with optional filtering."""
-    query = db.query(Employee)
+    """
+    Get all employees with optional filtering.
+    `fields` selects a sparse fieldset, e.g. `?fields=id,name,labels`.
+    """
+    requested = parse_fields(fields, EmployeeResponse)
+    if requested:
+        # Projection: always select the id to attach labels, drop it if not requested
+        columns = schema_columns(Employee, EmployeeResponse, requested)
+        if "id" not in requested:
+            columns.insert(0, Employee.id)
+
+        stmt = select(*columns)
+        if is_active is not None:
+            stmt = stmt.where(Employee.is_active == is_active)
+
+        rows = fetch_rows(db, stmt)
+        if "labels" in requested:
+            attach_labels(db, rows)
+
+        return ORJSONResponse([{name: row[name] for name in requested} for row in rows])
+
+    query = db.query(Employee).options(selectinload(Employee.labels), raiseload("*"))
 
     if is_active is not None:
         query = query.filter(Employee.is_active == is_active)
 
-    employees = query.all()
-    return employees
+    return EMPLOYEE_SERIALIZER.response(query.all())
 
 
 @router.get("/{employee_id}", response_model=EmployeeResponse)
@@ -46,7 +91,12 @@ async def get_employee(
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific employee by ID."""
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
+    employee = (
+        db.query(Employee)
+        .options(selectinload(Employee.labels), raiseload("*"))
+        .filter(Employee.id == employee_id)
+        .first()
+    )
 
     if not employee:
         raise HTTPException(
@@ -168,7 +218,7 @@ async def delete_employee(
 @router.get("/{employee_id}/tasks")
 async def get_employee_tasks(
     employee_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all tasks assigned to a specific employee."""
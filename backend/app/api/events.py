@@ -0,0 +1,116 @@
+"""
+Live event stream API endpoints.
+Pushes task and attendance changes to the dashboard over Server-Sent Events.
+"""
+import asyncio
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Cookie, Header, Query, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+
+from app.api.auth import get_current_user, security
+from app.core.database import SessionLocal
+from app.services.events import EventCursor, event_broker, replay_events
+
+router = APIRouter()
+
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT_INTERVAL = 15
+
+# Client reconnect delay sent with the stream, in milliseconds
+RETRY_MS = 3000
+
+
+def format_event(message: dict, cursor: EventCursor) -> str:
+    """Format an event message as an SSE frame; its SSE ID is the stream's cursor after it."""
+    return (
+        f"id: {cursor}\n"
+        f"event: {message['type']}\n"
+        f"data: {orjson.dumps(message).decode()}\n\n"
+    )
+
+
+def authenticate_and_replay(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    access_token_cookie: Optional[str],
+    cursor: Optional[EventCursor],
+) -> list:
+    """
+    Authenticate and load missed events with a short-lived session.
+    The stream itself must not hold a pooled connection open.
+    """
+    db = SessionLocal()
+    try:
+        get_current_user(credentials, access_token_cookie, db)
+        return replay_events(db, cursor.last_id, cursor.missing) if cursor is not None else []
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    last_event_id: Optional[str] = Query(None),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    access_token_cookie: Optional[str] = Cookie(None, alias="access_token"),
+):
+    """
+    Stream task and attendance events.
+    Browsers resume automatically through the `Last-Event-ID` header; pass
+    `?last_event_id=` to resume a fresh connection. The ID is a cursor
+    (see app.services.events), not just the last event's ID.
+    """
+    resume_from = last_event_id_header if last_event_id_header is not None else last_event_id
+    try:
+        cursor = EventCursor.parse(resume_from) if resume_from else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Last-Event-ID"
+        )
+
+    # Subscribe before replaying so nothing committed in between is missed
+    subscription = event_broker.subscribe()
+    try:
+        backlog = await run_in_threadpool(
+            authenticate_and_replay, credentials, access_token_cookie, cursor
+        )
+    except Exception:
+        event_broker.unsubscribe(subscription)
+        raise
+
+    async def event_stream():
+        position = cursor or EventCursor()
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            replayed = set()
+            for message in backlog:
+                replayed.add(message["id"])
+                position.advance(message["id"])
+                yield format_event(message, position)
+
+            while not subscription.overflowed or not subscription.queue.empty():
+                if await request.is_disconnected():
+                    break
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message["id"] not in replayed:
+                    position.advance(message["id"])
+                    yield format_event(message, position)
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
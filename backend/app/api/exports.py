@@ -0,0 +1,94 @@
+"""
+Historical data export API endpoints (admin only).
+"""
+import logging
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+
+from app.core.database import read_session
+from app.core.security import get_current_admin
+from app.models.user import User
+from app.services.parquet_export import EXPORT_TABLES, export_available, export_parquet, list_partitions
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# One export at a time per process; partitions are resumed, not shared
+_export_lock = threading.Lock()
+_export_state: Dict[str, Any] = {
+    "running": False,
+    "started_at": None,
+    "finished_at": None,
+    "partitions": [],
+    "error": None,
+}
+
+
+def _run_export(tables: List[str], force: bool) -> None:
+    """Run an export in the background (on a replica, if any), recording progress in _export_state."""
+    db = read_session()
+    try:
+        export_parquet(
+            db,
+            tables=tables,
+            force=force,
+            on_partition=lambda result: _export_state["partitions"].append(asdict(result)),
+        )
+    except Exception as exc:
+        logger.exception("Parquet export failed")
+        _export_state["error"] = str(exc)
+    finally:
+        db.close()
+        _export_state["running"] = False
+        _export_state["finished_at"] = datetime.utcnow().isoformat()
+        _export_lock.release()
+
+
+@router.post("/parquet", status_code=status.HTTP_202_ACCEPTED)
+async def start_parquet_export(
+    background_tasks: BackgroundTasks,
+    tables: Optional[List[str]] = Query(None, alias="table"),
+    force: bool = False,
+    current_user: User = Depends(get_current_admin),
+):
+    """
+    Start a Parquet export of tasks, comments, attendance and notifications
+    (or the given tables). Months already exported are skipped unless
+    force is set, so a failed export picks up where it stopped.
+    """
+    if not export_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Parquet export requires pyarrow"
+        )
+    unknown = sorted(set(tables or ()) - set(EXPORT_TABLES))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown tables: {', '.join(unknown)}"
+        )
+    if not _export_lock.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An export is already running"
+        )
+
+    _export_state.update(
+        running=True,
+        started_at=datetime.utcnow().isoformat(),
+        finished_at=None,
+        partitions=[],
+        error=None,
+    )
+    background_tasks.add_task(_run_export, tables or list(EXPORT_TABLES), force)
+    return _export_state
+
+
+@router.get("/parquet")
+async def get_parquet_export(current_user: User = Depends(get_current_admin)):
+    """Get the state of the last export and the months exported per table."""
+    return {**_export_state, "exported": list_partitions()}
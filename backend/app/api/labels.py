@@ -3,10 +3,11 @@ Employee label management API endpoints.
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.responses import TrustedSerializer
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.employee import EmployeeLabel
@@ -18,6 +19,8 @@ from app.schemas.employee import (
 
 router = APIRouter()
 
+LABEL_SERIALIZER = TrustedSerializer(EmployeeLabelResponse)
+
 
 @router.get("/", response_model=List[EmployeeLabelResponse])
 async def get_labels(
@@ -25,8 +28,7 @@ async def get_labels(
     current_user: User = Depends(get_current_user),
 ):
     """Get all employee labels."""
-    labels = db.query(EmployeeLabel).all()
-    return labels
+    return LABEL_SERIALIZER.response(db.query(EmployeeLabel).options(raiseload("*")).all())
 
 
 @router.get("/{label_id}", response_model=EmployeeLabelResponse)
@@ -0,0 +1,95 @@
+"""
+Reference data sync API endpoints.
+Serves employees, labels and routines as versioned snapshots and deltas.
+"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.database import get_db
+from app.core.responses import TrustedSerializer
+from app.core.security import get_current_user
+from app.models.user import User
+from app.models.employee import Employee, EmployeeLabel
+from app.models.routine import Routine
+from app.models.reference import ReferenceVersion, ReferenceEntity
+from app.schemas.reference import ReferenceDelta, ReferenceDeleted
+from app.services.reference import current_reference_version
+
+router = APIRouter()
+
+REFERENCE_SERIALIZER = TrustedSerializer(ReferenceDelta)
+
+
+def reference_response(**fields) -> ORJSONResponse:
+    """Build a reference delta response from trusted ORM objects."""
+    return ORJSONResponse(REFERENCE_SERIALIZER.dump(ReferenceDelta.model_construct(**fields)))
+
+
+@router.get("/", response_model=ReferenceDelta)
+async def get_reference_data(
+    since: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get reference data changed since a version.
+    `since=0` returns a full snapshot; pass the returned `version` on the next poll.
+    """
+    version = current_reference_version(db)
+
+    if since == 0:
+        return reference_response(
+            version=version,
+            full=True,
+            employees=db.query(Employee).options(selectinload(Employee.labels)).all(),
+            labels=db.query(EmployeeLabel).all(),
+            routines=db.query(Routine).options(selectinload(Routine.labels)).all(),
+        )
+
+    if since >= version:
+        return reference_response(version=version)
+
+    changes = db.query(ReferenceVersion).filter(ReferenceVersion.version > since).all()
+
+    changed = {entity_type: [] for entity_type in ReferenceEntity}
+    deleted = {entity_type: [] for entity_type in ReferenceEntity}
+    for change in changes:
+        target = deleted if change.is_deleted else changed
+        target[change.entity_type].append(change.entity_id)
+
+    employees = []
+    if changed[ReferenceEntity.EMPLOYEE]:
+        employees = (
+            db.query(Employee)
+            .options(selectinload(Employee.labels))
+            .filter(Employee.id.in_(changed[ReferenceEntity.EMPLOYEE]))
+            .all()
+        )
+
+    labels = []
+    if changed[ReferenceEntity.LABEL]:
+        labels = db.query(EmployeeLabel).filter(
+            EmployeeLabel.id.in_(changed[ReferenceEntity.LABEL])
+        ).all()
+
+    routines = []
+    if changed[ReferenceEntity.ROUTINE]:
+        routines = (
+            db.query(Routine)
+            .options(selectinload(Routine.labels))
+            .filter(Routine.id.in_(changed[ReferenceEntity.ROUTINE]))
+            .all()
+        )
+
+    return reference_response(
+        version=version,
+        employees=employees,
+        labels=labels,
+        routines=routines,
+        deleted=ReferenceDeleted.model_construct(
+            employees=deleted[ReferenceEntity.EMPLOYEE],
+            labels=deleted[ReferenceEntity.LABEL],
+            routines=deleted[ReferenceEntity.ROUTINE],
+        ),
+    )
@@ -0,0 +1,132 @@
+"""
+Owner daily report API endpoints.
+"""
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db, get_read_db
+from app.core.etag import etag_matches, etag_headers, not_modified
+from app.core.security import get_current_user
+from app.models.user import User
+from app.models.rollup import SketchDimension
+from app.services import analytics, rollups
+from app.services.completion_times import completion_time_percentiles
+from app.services.reports import get_daily_report
+
+router = APIRouter()
+
+# Default analytics window, ending today
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366 * 2
+
+MAX_ROLLING_WINDOW = 90
+
+
+@router.get("/daily")
+async def get_daily_report_endpoint(
+    request: Request,
+    report_date: Optional[date] = Query(None, alias="date"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get a day's owner report (default today): attendance, task status,
+    overdue and in-progress tasks, top performers and the rendered
+    Telegram messages. Read from the primary: the payload is cached for
+    every client, and a lagging replica would cache a stale report.
+    """
+    etag, payload = get_daily_report(db, report_date or date.today())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return ORJSONResponse(payload, headers=etag_headers(etag))
+
+
+def _date_range(start_date: Optional[date], end_date: Optional[date]):
+    """Resolve an analytics date range, defaulting to the last DEFAULT_RANGE_DAYS."""
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date"
+        )
+    if (end_date - start_date).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {MAX_RANGE_DAYS} days"
+        )
+    return start_date, end_date
+
+
+@router.get("/completion-rate")
+async def get_completion_rate(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    employee_id: Optional[UUID] = None,
+    label_id: Optional[UUID] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get tasks due, completed and completed on time per day."""
+    start_date, end_date = _date_range(start_date, end_date)
+    return ORJSONResponse(rollups.completion_rate(db, start_date, end_date, employee_id, label_id))
+
+
+@router.get("/employee-performance")
+async def get_employee_performance(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    label_id: Optional[UUID] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get completion and on-time rates and average completion time per employee."""
+    start_date, end_date = _date_range(start_date, end_date)
+    return ORJSONResponse(rollups.employee_performance(db, start_date, end_date, label_id))
+
+
+@router.get("/overdue-trends")
+async def get_overdue_trends(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    employee_id: Optional[UUID] = None,
+    label_id: Optional[UUID] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get tasks left open past their due date and tasks completed late, per day."""
+    start_date, end_date = _date_range(start_date, end_date)
+    return ORJSONResponse(rollups.overdue_trends(db, start_date, end_date, employee_id, label_id))
+
+
+@router.get("/completion-time")
+async def get_completion_time(
+    group_by: SketchDimension = SketchDimension.EMPLOYEE,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get p50/p90 completion time (creation to completion) per employee or label."""
+    start_date, end_date = _date_range(start_date, end_date)
+    return ORJSONResponse(completion_time_percentiles(db, group_by, start_date, end_date))
+
+
+@router.get("/trends")
+async def get_trends(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    window: int = Query(7, ge=1, le=MAX_ROLLING_WINDOW),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get daily task and attendance series with trailing-window rates, and
+    per-employee completion rates over the range.
+    """
+    start_date, end_date = _date_range(start_date, end_date)
+    return ORJSONResponse(analytics.trends(db, start_date, end_date, window))
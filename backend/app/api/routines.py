@@ -3,10 +3,11 @@ Routine management API endpoints.
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from uuid import UUID
 
 from app.core.database import get_db
+from app.core.responses import TrustedSerializer
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.routine import Routine
@@ -19,6 +20,8 @@ from app.schemas.routine import (
 
 router = APIRouter()
 
+ROUTINE_SERIALIZER = TrustedSerializer(RoutineResponse)
+
 
 @router.get("/", response_model=List[RoutineResponse])
 async def get_routines(
@@ -27,13 +30,12 @@ async def get_routines(
     current_user: User = Depends(get_current_user),
 ):
     """Get all routines with optional filtering."""
-    query = db.query(Routine)
+    query = db.query(Routine).options(selectinload(Routine.labels), raiseload("*"))
 
     if is_active is not None:
         query = query.filter(Routine.is_active == is_active)
 
-    routines = query.order_by(Routine.created_at.desc()).all()
-    return routines
+    return ROUTINE_SERIALIZER.response(query.order_by(Routine.created_at.desc()).all())
 
 
 @router.get("/{routine_id}", response_model=RoutineResponse)
@@ -43,7 +45,12 @@ async def get_routine(
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific routine by ID."""
-    routine = db.query(Routine).filter(Routine.id == routine_id).first()
+    routine = (
+        db.query(Routine)
+        .options(selectinload(Routine.labels), raiseload("*"))
+        .filter(Routine.id == routine_id)
+        .first()
+    )
 
     if not routine:
         raise HTTPException(
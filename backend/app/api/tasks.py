@@ -3,15 +3,22 @@ Task management API endpoints.
 """
 from typing import List
 from datetime import date, datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, raiseload
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.etag import make_etag, etag_matches, etag_headers, not_modified
+from app.core.projection import schema_columns, parse_fields, fetch_rows
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.task import Task, TaskStatus, TaskComment, CommentType
+from app.models.archive import ArchivedTask, ArchivedTaskComment
 from app.models.employee import Employee, EmployeeLabel
+from app.models.resource_version import Resource
+from app.models.event import EventType
 from app.schemas.task import (
     TaskResponse,
     TaskCreate,
@@ -19,80 +26,98 @@ from app.schemas.task import (
     TaskCommentResponse,
     TaskCommentCreate,
 )
+from app.services import tasks as task_service
+from app.services.archive import task_history
+from app.services.events import publish_task_event
+from app.services.notifications import notify_task_assigned, notify_task_completed
+from app.services.resource_versions import get_resource_versions
 
 router = APIRouter()
 
-
-def generate_task_number(db: Session, parent_task: Task | None = None) -> str:
-    """Generate a unique task number."""
-    year = datetime.now().year
-
-    if parent_task:
-        # For subtasks: T2024-001-S1, T2024-001-S2, etc.
-        subtask_count = db.query(Task).filter(
-            Task.parent_task_id == parent_task.id
-        ).count()
-        return f"{parent_task.task_number}-S{subtask_count + 1}"
-    else:
-        # For main tasks: T2024-001, T2024-002, etc.
-        task_count = db.query(Task).filter(
-            Task.is_subtask == False,
-            Task.task_number.like(f"T{year}-%")
-        ).count()
-        return f"T{year}-{task_count + 1:03d}"
+# Columns selected by the read-only list endpoints
+TASK_COLUMNS = schema_columns(Task, TaskResponse)
 
 
 @router.get("/", response_model=List[TaskResponse])
 async def get_tasks(
+    request: Request,
     status: TaskStatus | None = None,
     employee_id: UUID | None = None,
     priority: str | None = None,
     date: date | None = None,
-    db: Session = Depends(get_db),
+    fields: str | None = None,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all tasks with optional filtering."""
-    query = db.query(Task).filter(Task.is_subtask == False)
+    """
+    Get all tasks with optional filtering.
+    `fields` selects a sparse fieldset, e.g. `?fields=id,task_number,title,status`.
+    Tasks due on an archived `date` are read from the archive as well.
+    """
+    etag = make_etag("tasks", get_resource_versions(db, Resource.TASKS), request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    requested = parse_fields(fields, TaskResponse)
+    history = task_history(db, date, date) if date else None
+    if history and history.archived:
+        tasks = history.tasks.c
+        columns = schema_columns(history.tasks, TaskResponse, requested)
+    else:
+        tasks = Task
+        columns = schema_columns(Task, TaskResponse, requested) if requested else TASK_COLUMNS
+    stmt = select(*columns).where(tasks.is_subtask == False)
 
     if status:
-        query = query.filter(Task.status == status)
+        stmt = stmt.where(tasks.status == status)
 
     if employee_id:
-        query = query.filter(Task.assigned_to == employee_id)
+        stmt = stmt.where(tasks.assigned_to == employee_id)
 
     if priority:
-        query = query.filter(Task.priority == priority)
+        stmt = stmt.where(tasks.priority == priority)
 
     if date:
-        query = query.filter(Task.due_date == date)
+        stmt = stmt.where(tasks.due_date == date)
 
-    tasks = query.order_by(Task.created_at.desc()).all()
-    return tasks
+    rows = fetch_rows(db, stmt.order_by(tasks.created_at.desc()))
+    return ORJSONResponse(rows, headers=etag_headers(etag))
 
 
 @router.get("/overdue", response_model=List[TaskResponse])
 async def get_overdue_tasks(
-    db: Session = Depends(get_db),
+    request: Request,
+    fields: str | None = None,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all overdue tasks."""
+    """
+    Get all overdue tasks.
+    `fields` selects a sparse fieldset, e.g. `?fields=task_number,title,due_time`.
+    """
     today = date.today()
-    tasks = db.query(Task).filter(
+    etag = make_etag("tasks-overdue", today, get_resource_versions(db, Resource.TASKS), request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    requested = parse_fields(fields, TaskResponse)
+    columns = schema_columns(Task, TaskResponse, requested) if requested else TASK_COLUMNS
+    stmt = select(*columns).where(
         Task.due_date < today,
         Task.status.notin_([TaskStatus.COMPLETED])
-    ).all()
+    )
 
-    return tasks
+    return ORJSONResponse(fetch_rows(db, stmt), headers=etag_headers(etag))
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get a specific task by ID."""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """Get a specific task by ID, archived or not."""
+    task = db.query(Task).filter(Task.id == task_id).first() or db.get(ArchivedTask, task_id)
 
     if not task:
         raise HTTPException(
@@ -111,7 +136,7 @@ async def create_task(
 ):
     """Create a new task."""
     # Generate task number
-    task_number = generate_task_number(db)
+    task_number = task_service.generate_task_number(db)
 
     # Create task
     task = Task(
@@ -137,6 +162,11 @@ async def create_task(
         task.labels = labels
 
     db.add(task)
+    db.flush()
+    publish_task_event(db, EventType.TASK_CREATED, task)
+    if task.assigned_to:
+        publish_task_event(db, EventType.TASK_ASSIGNED, task)
+        notify_task_assigned(db, task)
     db.commit()
     db.refresh(task)
 
@@ -175,6 +205,9 @@ async def update_task(
     if task_data.assigned_to and task.status == TaskStatus.PENDING:
         task.status = TaskStatus.ASSIGNED
         task.assigned_by = current_user.id
+        db.flush()
+        publish_task_event(db, EventType.TASK_ASSIGNED, task)
+        notify_task_assigned(db, task)
 
     db.commit()
     db.refresh(task)
@@ -231,6 +264,9 @@ async def assign_task(
     task.assigned_by = current_user.id
     task.status = TaskStatus.ASSIGNED
 
+    db.flush()
+    publish_task_event(db, EventType.TASK_ASSIGNED, task)
+    notify_task_assigned(db, task)
     db.commit()
     db.refresh(task)
 
@@ -255,6 +291,9 @@ async def complete_task(
     task.status = TaskStatus.COMPLETED
     task.completed_at = datetime.utcnow()
 
+    db.flush()
+    publish_task_event(db, EventType.TASK_COMPLETED, task)
+    notify_task_completed(db, task)
     db.commit()
     db.refresh(task)
 
@@ -277,30 +316,19 @@ async def create_subtask(
             detail="Parent task not found"
         )
 
-    # Generate subtask number
-    task_number = generate_task_number(db, parent_task)
-
-    # Create subtask
-    subtask = Task(
-        task_number=task_number,
+    # Unassigned subtasks are the owner's to resolve
+    subtask = task_service.create_subtask(
+        db,
+        parent_task,
         title=subtask_data.title,
         description=subtask_data.description,
         task_type=subtask_data.task_type,
         priority=subtask_data.priority,
-        status=TaskStatus.PENDING,
         due_date=subtask_data.due_date,
         due_time=subtask_data.due_time,
-        assigned_to=subtask_data.assigned_to or current_user.id,  # Assign to owner by default
-        assigned_by=current_user.id,
+        assigned_to=subtask_data.assigned_to,
         created_by=current_user.id,
-        parent_task_id=parent_task.id,
-        is_subtask=True,
     )
-
-    # Mark parent task as blocked
-    parent_task.status = TaskStatus.BLOCKED
-
-    db.add(subtask)
     db.commit()
     db.refresh(subtask)
 
@@ -311,11 +339,15 @@ async def create_subtask(
 @router.get("/{task_id}/comments", response_model=List[TaskCommentResponse])
 async def get_task_comments(
     task_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get all comments for a task."""
+    """Get all comments for a task, archived or not."""
     task = db.query(Task).filter(Task.id == task_id).first()
+    model = TaskComment
+    if not task:
+        task = db.get(ArchivedTask, task_id)
+        model = ArchivedTaskComment
 
     if not task:
         raise HTTPException(
@@ -323,9 +355,9 @@ async def get_task_comments(
             detail="Task not found"
         )
 
-    comments = db.query(TaskComment).filter(
-        TaskComment.task_id == task_id
-    ).order_by(TaskComment.created_at.desc()).all()
+    comments = db.query(model).options(raiseload("*")).filter(
+        model.task_id == task_id
+    ).order_by(model.created_at.desc()).all()
 
     return comments
 
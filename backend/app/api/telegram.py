@@ -0,0 +1,53 @@
+"""
+Telegram webhook API endpoint.
+Acknowledges updates immediately; processing happens in the update
+dispatcher so Telegram never waits on the database.
+
+Updates from one chat stay ordered only within a process, so the webhook
+should be served by a single worker (it only parses and enqueues), or
+registered with max_connections=1.
+"""
+import hmac
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.core.config import settings
+from app.services.telegram_bot import update_dispatcher
+
+router = APIRouter()
+
+
+@router.post("/webhook")
+async def telegram_webhook(request: Request):
+    """
+    Receive a Telegram update. Requires TELEGRAM_WEBHOOK_SECRET, sent by
+    Telegram in X-Telegram-Bot-Api-Secret-Token.
+    Answers 503 when the chat's queue is full; Telegram then retries the
+    update later, which applies backpressure instead of buffering without bound.
+    """
+    # Without a secret anyone could post updates as any linked employee
+    if not settings.TELEGRAM_WEBHOOK_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telegram webhook is not configured"
+        )
+    secret = request.headers.get("x-telegram-bot-api-secret-token", "")
+    if not hmac.compare_digest(secret, settings.TELEGRAM_WEBHOOK_SECRET):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid webhook secret"
+        )
+
+    try:
+        update = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid update"
+        )
+
+    if not update_dispatcher.submit(update):
+        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, headers={"Retry-After": "1"})
+
+    return {"ok": True}
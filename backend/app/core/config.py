@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     DB_NAME: str = "team_tasks"
     DB_USER: str = "postgres"
     DB_PASSWORD: str
+    DB_REPLICA_HOSTS: list[str] = []  # host or host:port of streaming replicas, for read-only endpoints
+    DB_READ_YOUR_WRITES_WINDOW: int = 5  # Seconds a write marker keeps a client's reads off lagging replicas
 
     # Security
     SECRET_KEY: str
@@ -29,6 +31,14 @@ class Settings(BaseSettings):
     # Telegram
     TELEGRAM_BOT_TOKEN: str
     TELEGRAM_OWNER_CHAT_ID: str
+    TELEGRAM_API_BASE_URL: str = "https://api.telegram.org"  # Point at scripts/fake_telegram_api.py to test
+    TELEGRAM_GLOBAL_RATE: float = 30.0  # Messages per second across all chats
+    TELEGRAM_CHAT_RATE: float = 1.0  # Messages per second to a single chat
+    TELEGRAM_WEBHOOK_SECRET: Optional[str] = None  # secret_token passed to setWebhook; the webhook is disabled without it
+    TELEGRAM_UPDATE_SHARDS: int = 8  # Concurrent update workers; one chat always maps to one
+    TELEGRAM_UPDATE_QUEUE_SIZE: int = 256  # Updates buffered per shard before the webhook answers 503
+    CONVERSATION_TTL: int = 900  # Seconds a bot conversation waits for the next reply
+    CONVERSATION_FLUSH_INTERVAL: float = 1.0  # Seconds between write-behind flushes of conversation state
 
     # Timezone
     TZ: str = "Asia/Kolkata"
@@ -36,6 +46,46 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
+    # Query budget (SQL statements per request, reported via X-Query-Count)
+    QUERY_COUNT_HEADER: bool = False
+    MAX_QUERIES_PER_REQUEST: Optional[int] = None
+
+    # Response compression (gzip, plus brotli when installed)
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # Notification delivery worker
+    NOTIFICATION_BATCH_SIZE: int = 50
+    NOTIFICATION_POLL_INTERVAL: float = 5.0
+    NOTIFICATION_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_CLAIM_TIMEOUT: int = 300  # Seconds before an unfinished claim is retried
+    NOTIFICATION_COALESCE_WINDOW: int = 15  # Seconds task messages wait to be merged into a digest
+    NOTIFICATION_DEFER_UNTIL_CHECK_IN: bool = True  # Hold task messages until the employee is present
+
+    # Owner daily reports and analytics rollups (scripts/run_report_scheduler.py), times in TZ
+    REPORT_ATTENDANCE_TIME: str = "10:00"
+    REPORT_MIDDAY_TIME: str = "14:00"
+    REPORT_END_OF_DAY_TIME: str = "19:00"
+    DASHBOARD_URL: Optional[str] = None  # Linked from report messages when set
+    OVERDUE_CHECK_TIME: str = "00:05"  # Open tasks due before today are marked overdue
+    ROLLUP_TIME: str = "00:30"  # Nightly append of yesterday to the analytics rollups
+    ROLLUP_REFRESH_INTERVAL: int = 15  # Minutes between recomputes of days with late edits
+
+    # Monthly partitions of tasks and attendance, created by scripts/run_report_scheduler.py
+    PARTITION_MAINTENANCE_TIME: str = "00:15"  # Daily, in TZ
+    PARTITION_MONTHS_AHEAD: int = 3  # Months created ahead of the current one
+
+    # Archival of completed tasks (app.services.archive), run by scripts/run_report_scheduler.py
+    TASK_ARCHIVE_TIME: str = "01:00"  # Daily, in TZ
+    TASK_ARCHIVE_AFTER_DAYS: int = 90  # Days after completion a task is archived
+    TASK_ARCHIVE_BATCH_SIZE: int = 500  # Top-level tasks moved per transaction
+
+    # Parquet export of historical data (scripts/export_parquet.py, needs pyarrow)
+    EXPORT_DIR: str = "exports"  # One <table>/month=YYYY-MM/ directory per exported month
+    EXPORT_BATCH_SIZE: int = 50000  # Rows per record batch; bounds export memory
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -47,6 +97,15 @@ class Settings(BaseSettings):
         """Construct database URL from individual components."""
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def replica_database_urls(self) -> list[str]:
+        """Database URLs of the read replicas (same database and credentials as the primary)."""
+        urls = []
+        for replica in self.DB_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            urls.append(f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{host}:{port or self.DB_PORT}/{self.DB_NAME}")
+        return urls
+
     @property
     def async_database_url(self) -> str:
         """Construct async database URL."""
@@ -1,11 +1,26 @@
 """
 Database configuration and session management.
 Handles SQLAlchemy engine creation and session management.
+
+Read-only endpoints can take get_read_db instead of get_db to read from a
+streaming replica (DB_REPLICA_HOSTS). A successful write hands the client a
+signed write marker (cookie and X-Last-Write header) holding the primary's
+WAL position; for DB_READ_YOUR_WRITES_WINDOW seconds, reads that carry it go
+to the primary until the replica has replayed that far, so the client sees
+its own changes despite replication lag, whichever API instance serves it.
 """
-from sqlalchemy import create_engine
+import hashlib
+import hmac
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, List, Optional
 
 from app.core.config import settings
 
@@ -18,13 +33,69 @@ engine = create_engine(
     echo=settings.DEBUG
 )
 
+# Read replicas, used in turn; sessions on them are read-only
+replica_engines: List[Engine] = [
+    create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        echo=settings.DEBUG,
+        execution_options={"postgresql_readonly": True},
+    )
+    for url in settings.replica_database_urls
+]
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+_replica_sessions = itertools.cycle(
+    [sessionmaker(autocommit=False, autoflush=False, bind=replica) for replica in replica_engines] or [SessionLocal]
+)
+
 # Create Base class for models
 Base = declarative_base()
 
 
+class QueryCounter:
+    """Mutable count of SQL statements executed in a context."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+_query_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Increment the active query counter, if any."""
+    counter = _query_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+for _engine in (engine, *replica_engines):
+    event.listen(_engine, "before_cursor_execute", _count_query)
+
+
+@contextmanager
+def count_queries() -> Generator[QueryCounter, None, None]:
+    """
+    Count SQL statements executed in the current context.
+
+    Usage:
+        with count_queries() as counter:
+            ...
+        assert counter.count <= 3
+    """
+    counter = QueryCounter()
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
@@ -42,12 +113,90 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def read_session() -> Session:
+    """
+    Session for read-only work on the next replica, or on the primary when
+    no replicas are configured. Replicas lag the primary slightly.
+    """
+    return next(_replica_sessions)()
+
+
+# Name of the write marker a client carries, as a cookie or a request header
+WRITE_MARKER_COOKIE = "last_write"
+WRITE_MARKER_HEADER = "X-Last-Write"
+
+# Separate key so write markers can never be confused with other signatures
+_write_marker_key = hmac.new(settings.SECRET_KEY.encode(), b"read-your-writes", hashlib.sha256).digest()
+
+
+def _sign_write_marker(payload: str) -> str:
+    return hmac.new(_write_marker_key, payload.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def write_marker() -> Optional[str]:
+    """
+    Marker for a client that just wrote: the primary's current WAL position
+    and when the read-your-writes window ends, signed so clients can't forge
+    it. None when no replicas are configured.
+
+    The marker carries all the state, so any API instance can honour it.
+    """
+    if not replica_engines:
+        return None
+    with engine.connect() as connection:
+        lsn = connection.execute(text("SELECT pg_current_wal_lsn()")).scalar()
+    payload = f"{lsn}.{int(time.time()) + settings.DB_READ_YOUR_WRITES_WINDOW}"
+    return f"{payload}.{_sign_write_marker(payload)}"
+
+
+def write_marker_lsn(marker: Optional[str]) -> Optional[str]:
+    """The WAL position in a valid, unexpired write marker, else None."""
+    if not marker:
+        return None
+    payload, _, signature = marker.rpartition(".")
+    if not hmac.compare_digest(signature, _sign_write_marker(payload)):
+        return None
+    lsn, _, expires = payload.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return None
+    return lsn
+
+
+def replica_caught_up(db: Session, lsn: str) -> bool:
+    """Whether the replica behind a session has replayed the WAL up to lsn."""
+    return bool(db.execute(
+        text("SELECT pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn)"), {"lsn": lsn}
+    ).scalar())
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency for read-only endpoints: a replica session, or a primary one
+    when no replicas are configured or the client's last write (its write
+    marker) hasn't been replayed on the replica yet.
+
+    Usage:
+        @app.get("/reports")
+        def read_reports(db: Session = Depends(get_read_db)):
+            ...
+    """
+    db = read_session()
+    lsn = write_marker_lsn(request.headers.get(WRITE_MARKER_HEADER) or request.cookies.get(WRITE_MARKER_COOKIE))
+    if lsn is not None and replica_engines and not replica_caught_up(db, lsn):
+        db.close()
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def init_db() -> None:
     """
     Initialize database tables.
     Creates all tables defined in models.
     """
     # Import all models here to ensure they're registered with Base
-    from app.models import user, employee, task, routine, attendance
+    from app.models import user, employee, task, routine, attendance, notification, reference, resource_version, event
 
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,83 @@
+"""
+DDSketch quantile sketch.
+Values are counted in logarithmic bins, so any quantile comes back within a
+fixed relative error of the true value. Two sketches merge exactly by
+adding bin counts, which lets stored per-day sketches answer any date range,
+and a value can be removed again by decrementing its bin.
+"""
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+# 1% relative error: 1 second to 30 days fits in about 760 bins
+RELATIVE_ACCURACY = 0.01
+
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+
+# Smaller values (including zero and negative) share the lowest bin
+MIN_VALUE = 1.0
+
+
+def bin_index(value: float) -> int:
+    """Bin a value is counted in."""
+    return math.ceil(math.log(max(value, MIN_VALUE)) / LOG_GAMMA)
+
+
+def bin_value(index: int) -> float:
+    """Representative value of a bin, within RELATIVE_ACCURACY of its members."""
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class DDSketch:
+    """Mergeable quantile sketch over positive values."""
+
+    __slots__ = ("bins", "count")
+
+    def __init__(self, bins: Optional[Iterable[Tuple[int, int]]] = None) -> None:
+        self.bins: Dict[int, int] = {}
+        self.count = 0
+        for index, count in bins or ():
+            self.add_bin(index, count)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Count a value (a negative count removes it)."""
+        self.add_bin(bin_index(value), count)
+
+    def add_bin(self, index: int, count: int) -> None:
+        total = self.bins.get(index, 0) + count
+        if total > 0:
+            self.bins[index] = total
+        else:
+            self.bins.pop(index, None)
+        self.count += count
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """Add another sketch's counts to this one."""
+        bins = self.bins
+        for index, count in other.bins.items():
+            bins[index] = bins.get(index, 0) + count
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None for an empty sketch
+        """
+        if self.count <= 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                return bin_value(index)
+        return bin_value(max(self.bins))
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,61 @@
+"""
+HTTP conditional request helpers (ETag / If-None-Match).
+Polled endpoints derive a weak ETag from cheap version signals and answer
+304 Not Modified before running their heavy query. Endpoints that cache a
+rendered body tag it by content instead (content_etag).
+"""
+import hashlib
+from typing import Any, Dict
+
+import orjson
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from version signals and request parameters.
+
+    Args:
+        parts: Values that change whenever the response body would change
+
+    Returns:
+        Weak ETag header value
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def content_etag(body: Any) -> str:
+    """
+    Build a weak ETag from a JSON body's content.
+
+    Use for cached bodies: resource versions are bumped just after a change
+    commits, so a version read alongside the new data could otherwise be
+    cached with it and keep answering 304 to clients holding the old body.
+    """
+    digest = hashlib.blake2b(orjson.dumps(body), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # Weak comparison: ignore W/ prefixes on both sides
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Headers that let clients revalidate a response with If-None-Match."""
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response for an ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
@@ -0,0 +1,196 @@
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+Flushes of tracked models queue a NOTIFY in the writing transaction; every
+worker's listener evicts the matching keys from its in-process caches once
+the transaction commits. No external broker is involved.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.pubsub import notify, pg_listener
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# Namespace of each tracked table; keys are primary keys as strings
+TRACKED_TABLES = {
+    "tasks": "tasks",
+    "attendance": "attendance",
+    "employees": "employees",
+    "employee_labels": "labels",
+    "routines": "routines",
+    "users": "users",
+    "task_comments": "comments",
+}
+
+# Above this many keys a namespace is invalidated as a whole (NOTIFY payloads max out at 8000 bytes)
+MAX_KEYS_PER_MESSAGE = 100
+
+ALL_KEYS = "*"
+
+
+class LocalCache:
+    """
+    In-process cache evicted by the invalidation bus.
+    Entries are only served while this worker's LISTEN connection is up;
+    without it, evictions from other workers could be missed.
+
+    Usage:
+        cache = LocalCache("dashboard", watches=["tasks", "attendance"])
+        generation = cache.generation
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value, generation)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        watches: Iterable[str],
+        by_key: bool = False,
+        max_age: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            name: Cache name, for debugging
+            watches: Namespaces whose changes evict entries
+            by_key: Evict only the changed keys instead of the whole cache
+            max_age: Optional safety-net lifetime of an entry, in seconds
+        """
+        self.name = name
+        self.watches = set(watches)
+        self.by_key = by_key
+        self.max_age = max_age
+        self.generation = 0
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        for namespace in self.watches:
+            on_evict(namespace, self.invalidate)
+
+    def get(self, key: Any) -> Any:
+        """Get a cached value, or None."""
+        if not pg_listener.connected:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.max_age is not None and time.monotonic() - stored_at > self.max_age:
+            return None
+        return value
+
+    def put(self, key: Any, value: Any, generation: int) -> None:
+        """
+        Store a value computed while the cache was at `generation`.
+        Skipped if an invalidation arrived in the meantime, since the value
+        may predate it.
+        """
+        with self._lock:
+            if generation == self.generation and pg_listener.connected:
+                self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Evict some keys, or everything if keys is None."""
+        with self._lock:
+            self.generation += 1
+            if keys is None or not self.by_key:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Evict everything."""
+        self.invalidate()
+
+
+EvictionHandler = Callable[[Optional[Iterable[str]]], None]
+
+_handlers: Dict[str, List[EvictionHandler]] = {}
+
+
+def on_evict(namespace: str, handler: EvictionHandler) -> None:
+    """
+    Call handler(keys) whenever keys of a namespace change on any worker.
+    keys is None when the whole namespace (or everything) must be dropped.
+    """
+    _handlers.setdefault(namespace, []).append(handler)
+
+
+def evict(namespace: str, keys: Optional[Iterable[str]] = None) -> None:
+    """Evict keys of a namespace from every local cache watching it."""
+    for handler in _handlers.get(namespace, ()):
+        handler(keys)
+
+
+def clear_all() -> None:
+    """Evict everything, e.g. after notifications may have been missed."""
+    for handlers in _handlers.values():
+        for handler in handlers:
+            handler(None)
+
+
+def publish_invalidation(session: Session, namespace: str, keys: Optional[Iterable[str]] = None) -> None:
+    """
+    Invalidate keys on every worker when the session's transaction commits.
+    Use for writes the flush hook cannot see, e.g. Core UPDATE statements.
+    """
+    _pending(session).setdefault(namespace, set()).update(keys if keys is not None else [ALL_KEYS])
+    _notify(session, {namespace: keys})
+
+
+def _pending(session: Session) -> Dict[str, Set[str]]:
+    return session.info.setdefault("pending_invalidations", {})
+
+
+def _notify(session: Session, changes: Dict[str, Optional[Iterable[str]]]) -> None:
+    """Queue one NOTIFY for a set of changes in the session's transaction."""
+    message = {}
+    for namespace, keys in changes.items():
+        keys = sorted(keys) if keys is not None else None
+        if keys is None or len(keys) > MAX_KEYS_PER_MESSAGE:
+            keys = [ALL_KEYS]
+        message[namespace] = keys
+    notify(session.connection(), INVALIDATION_CHANNEL, orjson.dumps(message).decode())
+
+
+def _handle_notification(payload: str) -> None:
+    """Listener callback: evict what another (or this) worker changed."""
+    for namespace, keys in orjson.loads(payload).items():
+        evict(namespace, None if ALL_KEYS in keys else keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _publish_flushed_changes(session: Session, flush_context) -> None:
+    """Queue invalidations for every tracked row touched by this flush."""
+    changes: Dict[str, Set[str]] = {}
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        namespace = TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+        if namespace is not None:
+            changes.setdefault(namespace, set()).add(str(obj.id))
+
+    if changes:
+        for namespace, keys in changes.items():
+            _pending(session).setdefault(namespace, set()).update(keys)
+        _notify(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_changes(session: Session) -> None:
+    """Evict locally right away instead of waiting for our own NOTIFY."""
+    for namespace, keys in session.info.pop("pending_invalidations", {}).items():
+        evict(namespace, None if ALL_KEYS in keys else keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session) -> None:
+    session.info.pop("pending_invalidations", None)
+
+
+pg_listener.subscribe(INVALIDATION_CHANNEL, _handle_notification)
+pg_listener.on_connect(clear_all)
@@ -0,0 +1,241 @@
+"""
+ASGI middleware for the application.
+"""
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import WRITE_MARKER_COOKIE, WRITE_MARKER_HEADER, count_queries, write_marker
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Bodies at least this large are compressed off the event loop
+THREADPOOL_COMPRESSION_SIZE = 64 * 1024
+
+# Content types that are streamed or already compressed
+UNCOMPRESSIBLE_TYPES = ("text/event-stream", "image/", "video/", "audio/", "application/zip",
+                        "application/gzip", "application/vnd.apache.parquet")
+
+
+class QueryCountMiddleware:
+    """
+    Count SQL statements per request.
+    Adds an X-Query-Count header when QUERY_COUNT_HEADER is enabled and logs
+    requests that exceed MAX_QUERIES_PER_REQUEST.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+
+            async def send_with_count(message: Message) -> None:
+                # The endpoint and response serialization are done once headers go out
+                if message["type"] == "http.response.start":
+                    limit = settings.MAX_QUERIES_PER_REQUEST
+                    if limit is not None and counter.count > limit:
+                        logger.error(
+                            "Query budget exceeded: %s %s ran %d queries (limit %d)",
+                            scope["method"], scope["path"], counter.count, limit,
+                        )
+                    if settings.QUERY_COUNT_HEADER:
+                        headers = MutableHeaders(scope=message)
+                        headers["X-Query-Count"] = str(counter.count)
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
+
+
+# Methods that can write; a successful one hands the client a new write marker
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class ReadYourWritesMiddleware:
+    """
+    Give clients whose writes succeeded a write marker, as a cookie and an
+    X-Last-Write header to send back, so get_read_db keeps their next reads
+    off a replica that hasn't caught up with the write.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message: Message) -> None:
+            # The write is committed once the endpoint returns, so the WAL position covers it
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                marker = await run_in_threadpool(write_marker)
+                if marker is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers[WRITE_MARKER_HEADER] = marker
+                    headers.append(
+                        "set-cookie",
+                        f"{WRITE_MARKER_COOKIE}={marker}; Max-Age={settings.DB_READ_YOUR_WRITES_WINDOW}; "
+                        "Path=/; HttpOnly; SameSite=Lax",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported content coding from an Accept-Encoding header.
+
+    Returns:
+        "br", "gzip" or None when the client accepts neither
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best = max(candidates, key=lambda coding: accepted.get(coding, wildcard))
+    return best if accepted.get(best, wildcard) > 0 else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with the configured level for an encoding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressedBodyCache:
+    """
+    Byte-bounded LRU cache of compressed response bodies.
+    Hot payloads (the same bytes) are compressed once, not per request.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        """Get a compressed body and mark it as recently used."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Tuple[str, str], body: bytes) -> None:
+        """Store a compressed body, evicting least recently used entries."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class CompressionMiddleware:
+    """
+    Negotiate gzip/brotli compression for responses above a size threshold.
+    Streaming responses (more than one body chunk) pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.cache = CompressedBodyCache(settings.COMPRESSION_CACHE_MAX_BYTES)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or content_type.startswith(UNCOMPRESSIBLE_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < settings.COMPRESSION_MIN_SIZE:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = await self._compressed_body(body, encoding)
+
+            headers = MutableHeaders(scope=start_message)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compressed_body(self, body: bytes, encoding: str) -> bytes:
+        """
+        Get a compressed body from the cache, compressing it on a miss.
+        Keyed on the body's hash: a weak ETag can briefly belong to two bodies.
+        """
+        key = (hashlib.blake2b(body, digest_size=16).hexdigest(), encoding)
+        compressed = self.cache.get(key)
+        if compressed is None:
+            if len(body) >= THREADPOOL_COMPRESSION_SIZE:
+                compressed = await run_in_threadpool(compress, body, encoding)
+            else:
+                compressed = compress(body, encoding)
+            self.cache.put(key, compressed)
+        return compressed
@@ -0,0 +1,76 @@
+"""
+Core-level row projection for read-only list endpoints.
+Selects only the columns a response schema needs and returns plain rows,
+skipping ORM identity-map hydration and change tracking.
+"""
+from typing import Any, Dict, List, Optional, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import Column, Select
+from sqlalchemy.orm import Session
+
+
+def schema_columns(
+    model: Any,
+    schema: Type[BaseModel],
+    fields: Optional[List[str]] = None,
+) -> List[Column]:
+    """
+    Get the table columns of a model that back the fields of a response schema.
+
+    Args:
+        model: SQLAlchemy model class, or a table or subquery with the model's columns
+        schema: Pydantic response schema
+        fields: Optional sparse fieldset (see parse_fields) to restrict the columns
+
+    Returns:
+        Table columns in schema (or fieldset) order
+    """
+    table = getattr(model, "__table__", model)
+    names = fields if fields is not None else schema.model_fields
+    return [table.c[name] for name in names if name in table.c]
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated sparse fieldset against a response schema.
+
+    Args:
+        fields: Value of the `fields` query parameter, e.g. "id,title,status"
+        schema: Pydantic response schema the fields must belong to
+
+    Returns:
+        Requested field names in order, or None when no fieldset was given
+
+    Raises:
+        HTTPException: If a field is not part of the schema
+    """
+    if not fields:
+        return None
+
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested"
+        )
+
+    return names
+
+
+def fetch_rows(db: Session, stmt: Select) -> List[Dict[str, Any]]:
+    """
+    Execute a Core select and return its rows as plain dicts.
+
+    Args:
+        db: Database session
+        stmt: Select over plain columns (no ORM entities)
+
+    Returns:
+        One dict per row keyed by column name
+    """
+    result = db.execute(stmt)
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
@@ -0,0 +1,148 @@
+"""
+Postgres LISTEN/NOTIFY fan-out.
+Each worker process holds one dedicated listening connection and dispatches
+notifications to in-process subscribers, so any number of clients share a
+single database connection instead of polling.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+import psycopg2
+from psycopg2 import sql
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before reconnecting a dropped listening connection
+RECONNECT_DELAY = 2
+MAX_RECONNECT_DELAY = 30
+
+NotificationCallback = Callable[[str], None]
+
+
+def notify(connection: Connection, channel: str, payload: str) -> None:
+    """
+    Queue a notification in the caller's transaction.
+    Postgres delivers it to listeners only when the transaction commits.
+    """
+    connection.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": payload},
+    )
+
+
+class PgListener:
+    """
+    Dedicated LISTEN connection driven by the event loop.
+    Callbacks run on the event loop and must not block.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self.dsn = dsn
+        self._callbacks: Dict[str, List[NotificationCallback]] = defaultdict(list)
+        self._connect_callbacks: List[Callable[[], None]] = []
+        self._connection = None
+        self._lost: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """Register a callback for a channel; LISTENs immediately if connected."""
+        self._callbacks[channel].append(callback)
+        if self._connection is not None and len(self._callbacks[channel]) == 1:
+            self._listen(self._connection, [channel])
+
+    def on_connect(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run after every (re)connect.
+        Notifications sent while disconnected are lost, so subscribers that
+        keep derived state should reset it here.
+        """
+        self._connect_callbacks.append(callback)
+
+    @property
+    def connected(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._connection is not None
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _connect(self):
+        """Open an autocommit connection and LISTEN on all channels."""
+        connection = psycopg2.connect(self.dsn, keepalives=1, keepalives_idle=30)
+        connection.autocommit = True
+        self._listen(connection, list(self._callbacks))
+        return connection
+
+    @staticmethod
+    def _listen(connection, channels: List[str]) -> None:
+        with connection.cursor() as cursor:
+            for channel in channels:
+                cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+
+    async def _run(self) -> None:
+        """Keep a listening connection open, reconnecting with backoff."""
+        loop = asyncio.get_running_loop()
+        delay = RECONNECT_DELAY
+        while True:
+            try:
+                connection = await run_in_threadpool(self._connect)
+            except psycopg2.Error as exc:
+                logger.warning("LISTEN connection failed, retrying in %ss: %s", delay, exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                continue
+
+            delay = RECONNECT_DELAY
+            self._connection = connection
+            self._lost = loop.create_future()
+            loop.add_reader(connection.fileno(), self._on_readable)
+            for callback in self._connect_callbacks:
+                callback()
+            try:
+                await self._lost
+                logger.warning("LISTEN connection lost, reconnecting")
+            finally:
+                loop.remove_reader(connection.fileno())
+                self._connection = None
+                connection.close()
+
+    def _on_readable(self) -> None:
+        """Drain pending notifications and dispatch them to callbacks."""
+        connection = self._connection
+        try:
+            connection.poll()
+        except psycopg2.Error:
+            if not self._lost.done():
+                self._lost.set_result(None)
+            return
+
+        while connection.notifies:
+            notification = connection.notifies.pop(0)
+            for callback in self._callbacks.get(notification.channel, ()):
+                try:
+                    callback(notification.payload)
+                except Exception:
+                    logger.exception("Notification callback failed on %s", notification.channel)
+
+
+# One listener per worker process
+pg_listener = PgListener(settings.database_url)
@@ -142,3 +142,20 @@ async def get_current_user(
         raise credentials_exception
 
     return user
+
+
+async def get_current_admin(current_user=Depends(get_current_user)):
+    """
+    Dependency that only lets owners and admins through.
+
+    Raises:
+        HTTPException: If the user is not an owner or admin
+    """
+    from app.models.user import UserRole
+
+    if current_user.role not in (UserRole.OWNER, UserRole.ADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return current_user
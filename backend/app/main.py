@@ -3,15 +3,23 @@ Main FastAPI application entry point.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.core.database import WRITE_MARKER_HEADER
+from app.core.middleware import QueryCountMiddleware, CompressionMiddleware, ReadYourWritesMiddleware
+from app.core.pubsub import pg_listener
+from app.services.conversations import conversation_store
+from app.services.events import EVENTS_CHANNEL, event_broker
+from app.services.telegram_bot import telegram_sender, update_dispatcher
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     description="Team task management system with employee tracking and Telegram bot integration",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -21,8 +29,46 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[WRITE_MARKER_HEADER],
 )
 
+# Reads after a client's writes go to the primary (see get_read_db)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Per-request SQL statement counting
+app.add_middleware(QueryCountMiddleware)
+
+# gzip/brotli compression of larger responses
+app.add_middleware(CompressionMiddleware)
+
+
+@app.on_event("startup")
+async def start_listener():
+    """Start the shared LISTEN connection for live events."""
+    pg_listener.subscribe(EVENTS_CHANNEL, event_broker.dispatch)
+    await pg_listener.start()
+
+
+@app.on_event("startup")
+async def start_update_dispatcher():
+    """Start the Telegram update workers and conversation state flushing."""
+    await conversation_store.start()
+    await update_dispatcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_update_dispatcher():
+    """Finish queued Telegram updates, save conversation state and close the bot's HTTP client."""
+    await update_dispatcher.stop()
+    await conversation_store.stop()
+    await telegram_sender.close()
+
+
+@app.on_event("shutdown")
+async def stop_listener():
+    """Close the shared LISTEN connection."""
+    await pg_listener.stop()
+
 
 @app.get("/")
 async def root():
@@ -41,7 +87,7 @@ async def health_check():
 
 
 # Include API routers
-from app.api import auth, employees, labels, tasks, routines, attendance, dashboard
+from app.api import auth, employees, labels, tasks, routines, attendance, dashboard, reports, reference, events, telegram, exports
 
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
@@ -50,3 +96,8 @@ app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
 app.include_router(routines.router, prefix="/api/routines", tags=["Routines"])
 app.include_router(attendance.router, prefix="/api/attendance", tags=["Attendance"])
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
+app.include_router(reports.router, prefix="/api/reports", tags=["Reports"])
+app.include_router(reference.router, prefix="/api/reference", tags=["Reference"])
+app.include_router(events.router, prefix="/api/events", tags=["Events"])
+app.include_router(telegram.router, prefix="/api/telegram", tags=["Telegram"])
+app.include_router(exports.router, prefix="/api/exports", tags=["Exports"])
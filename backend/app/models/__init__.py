@@ -5,9 +5,15 @@ Exports all models for easy importing.
 from app.models.user import User, UserRole
 from app.models.employee import Employee, EmployeeLabel, employee_label_assignments
 from app.models.attendance import Attendance, AttendanceStatus
-from app.models.task import Task, TaskComment, TaskType, TaskPriority, TaskStatus, CommentType, task_labels
+from app.models.task import Task, TaskComment, TaskType, TaskPriority, TaskStatus, OPEN_STATUSES, CommentType, task_labels, task_numbers, task_number_counters
 from app.models.routine import Routine, RecurrenceType, routine_labels
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationType, NotificationStatus
+from app.models.reference import ReferenceVersion, ReferenceEntity, reference_version_seq
+from app.models.resource_version import ResourceVersion, Resource
+from app.models.event import Event, EventType
+from app.models.conversation import ConversationState, ConversationStep
+from app.models.rollup import TaskDailyRollup, TaskRollupDay, CompletionTimeBin, SketchDimension
+from app.models.archive import ArchivedTask, ArchivedTaskComment, archived_task_labels
 
 __all__ = [
     # User
@@ -26,8 +32,11 @@ __all__ = [
     "TaskType",
     "TaskPriority",
     "TaskStatus",
+    "OPEN_STATUSES",
     "CommentType",
     "task_labels",
+    "task_numbers",
+    "task_number_counters",
     # Routine
     "Routine",
     "RecurrenceType",
@@ -35,4 +44,27 @@ __all__ = [
     # Notification
     "Notification",
     "NotificationType",
+    "NotificationStatus",
+    # Reference
+    "ReferenceVersion",
+    "ReferenceEntity",
+    "reference_version_seq",
+    # Resource versions
+    "ResourceVersion",
+    "Resource",
+    # Event
+    "Event",
+    "EventType",
+    # Conversation
+    "ConversationState",
+    "ConversationStep",
+    # Rollups
+    "TaskDailyRollup",
+    "TaskRollupDay",
+    "CompletionTimeBin",
+    "SketchDimension",
+    # Archive
+    "ArchivedTask",
+    "ArchivedTaskComment",
+    "archived_task_labels",
 ]
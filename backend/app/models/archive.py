@@ -0,0 +1,68 @@
+"""
+Archive models for completed tasks moved out of the hot tables.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, Date, Time, Boolean, ForeignKey, BigInteger, Enum as SQLEnum, Table
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+from app.models.task import CommentType, TaskPriority, TaskStatus, TaskType
+
+
+# Labels of archived tasks, as they were in task_labels
+archived_task_labels = Table(
+    'archived_task_labels',
+    Base.metadata,
+    Column('task_id', UUID(as_uuid=True), ForeignKey('archived_tasks.id', ondelete='CASCADE'), primary_key=True),
+    Column('label_id', UUID(as_uuid=True), primary_key=True, index=True)
+)
+
+
+class ArchivedTask(Base):
+    """
+    A completed task (and its subtasks) moved out of tasks by the archival
+    job (app.services.archive). Same columns as tasks, so history reads can
+    union the two. No foreign keys to employees, users or labels: the
+    archive outlives them.
+    """
+    __tablename__ = "archived_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    task_number = Column(String(20), nullable=False)
+    title = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    task_type = Column(SQLEnum(TaskType), nullable=False)
+    priority = Column(SQLEnum(TaskPriority), nullable=False)
+    status = Column(SQLEnum(TaskStatus), nullable=False)
+    due_date = Column(Date, nullable=False, index=True)
+    due_time = Column(Time, nullable=True)
+    assigned_to = Column(UUID(as_uuid=True), nullable=True, index=True)
+    assigned_by = Column(UUID(as_uuid=True), nullable=True)
+    created_by = Column(UUID(as_uuid=True), nullable=True)
+    parent_task_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    is_subtask = Column(Boolean, nullable=False)
+    telegram_message_id = Column(BigInteger, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ArchivedTask(task_number='{self.task_number}', title='{self.title}')>"
+
+
+class ArchivedTaskComment(Base):
+    """Comment of an archived task, as it was in task_comments."""
+    __tablename__ = "archived_task_comments"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    task_id = Column(UUID(as_uuid=True), ForeignKey('archived_tasks.id', ondelete='CASCADE'), nullable=False, index=True)
+    comment_by_employee_id = Column(UUID(as_uuid=True), nullable=True)
+    comment_by_user_id = Column(UUID(as_uuid=True), nullable=True)
+    comment_text = Column(Text, nullable=False)
+    comment_type = Column(SQLEnum(CommentType), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ArchivedTaskComment(task_id={self.task_id}, type='{self.comment_type}')>"
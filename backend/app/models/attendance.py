@@ -3,7 +3,7 @@ Attendance model for tracking employee daily attendance.
 """
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, DateTime, Date, Boolean, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import DDL, Column, DateTime, Date, Boolean, ForeignKey, Enum as SQLEnum, UniqueConstraint, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -23,12 +23,14 @@ class Attendance(Base):
     """
     Attendance records for employees.
     Tracks daily attendance with auto-marking capability.
+    Range partitioned by month on date (see app.services.partitions).
     """
     __tablename__ = "attendance"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     employee_id = Column(UUID(as_uuid=True), ForeignKey('employees.id'), nullable=False, index=True)
-    date = Column(Date, nullable=False, default=date.today, index=True)
+    # Part of the primary key because it is the partition key
+    date = Column(Date, primary_key=True, nullable=False, default=date.today, index=True)
     status = Column(SQLEnum(AttendanceStatus), nullable=False, default=AttendanceStatus.ABSENT)
     marked_at = Column(DateTime, nullable=True)
     auto_marked = Column(Boolean, default=False, nullable=False)
@@ -39,7 +41,17 @@ class Attendance(Base):
     # Unique constraint: one attendance record per employee per day
     __table_args__ = (
         UniqueConstraint('employee_id', 'date', name='unique_employee_date'),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self) -> str:
         return f"<Attendance(employee_id={self.employee_id}, date={self.date}, status='{self.status}')>"
+
+
+# Rows outside the monthly partitions land here until their month is split out
+event.listen(
+    Attendance.__table__,
+    "after_create",
+    DDL("CREATE TABLE attendance_default PARTITION OF attendance DEFAULT"),
+)
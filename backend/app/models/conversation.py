@@ -0,0 +1,32 @@
+"""
+Conversation state model: durable copy of the bot's per-chat dialog state.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, DateTime, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
+import enum
+
+from app.core.database import Base
+
+
+class ConversationStep(str, enum.Enum):
+    """Step a chat's conversation with the bot is waiting on."""
+    AWAITING_ISSUE_DESCRIPTION = "awaiting_issue_description"
+
+
+class ConversationState(Base):
+    """
+    Per-chat bot conversation state.
+    The bot works from an in-memory copy; rows are written behind in batches
+    so state survives restarts and is shared between workers.
+    """
+    __tablename__ = "conversation_states"
+
+    chat_id = Column(BigInteger, primary_key=True)
+    step = Column(SQLEnum(ConversationStep), nullable=False)
+    data = Column(JSONB, nullable=False, default=dict)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ConversationState(chat_id={self.chat_id}, step='{self.step}')>"
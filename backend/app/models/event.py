@@ -0,0 +1,36 @@
+"""
+Event model for the live task and attendance change stream.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, DateTime, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
+import enum
+
+from app.core.database import Base
+
+
+class EventType(str, enum.Enum):
+    """Event type enumeration."""
+    TASK_CREATED = "task_created"
+    TASK_ASSIGNED = "task_assigned"
+    TASK_STARTED = "task_started"
+    TASK_BLOCKED = "task_blocked"
+    TASK_COMPLETED = "task_completed"
+    TASK_OVERDUE = "task_overdue"
+    ATTENDANCE_MARKED = "attendance_marked"
+
+
+class Event(Base):
+    """
+    Published change event.
+    The id doubles as the SSE event ID clients resume from.
+    """
+    __tablename__ = "events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_type = Column(SQLEnum(EventType), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<Event(id={self.id}, type='{self.event_type}')>"
@@ -1,10 +1,10 @@
 """
-Notification model for tracking sent messages.
+Notification model: outbox of Telegram messages to employees and owner.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, Text, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Text, DateTime, ForeignKey, Integer, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
 
@@ -20,11 +20,26 @@ class NotificationType(str, enum.Enum):
     DAILY_REPORT = "daily_report"
     SUBTASK_CREATED = "subtask_created"
     BLOCKER_RESOLVED = "blocker_resolved"
+    TASK_DIGEST = "task_digest"
+
+
+class NotificationStatus(str, enum.Enum):
+    """Notification delivery status enumeration."""
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    COALESCED = "coalesced"  # Delivered as part of a digest
+    DEFERRED = "deferred"  # Held until the recipient checks in
+    CANCELLED = "cancelled"  # Task closed or reassigned before delivery
 
 
 class Notification(Base):
     """
-    Notification log for tracking sent messages to employees and owner.
+    Outbox of messages to employees and owner.
+    Rows are written in the same transaction as the change they announce and
+    delivered later by the notification worker.
+    A row without recipient_employee_id goes to the owner's chat.
     """
     __tablename__ = "notifications"
 
@@ -32,13 +47,39 @@ class Notification(Base):
     notification_type = Column(SQLEnum(NotificationType), nullable=False, index=True)
     recipient_employee_id = Column(UUID(as_uuid=True), ForeignKey('employees.id'), nullable=True, index=True)
     recipient_user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True, index=True)
+    task_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Cleared when the task is deleted
+    digest_id = Column(UUID(as_uuid=True), ForeignKey('notifications.id'), nullable=True, index=True)
     message = Column(Text, nullable=False)
-    sent_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    reply_markup = Column(JSONB, nullable=True)  # Telegram inline keyboard
+    status = Column(SQLEnum(NotificationStatus), nullable=False, default=NotificationStatus.PENDING)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Next delivery attempt
+    claimed_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True, index=True)
     read_at = Column(DateTime, nullable=True)
 
     # Relationships
     recipient_employee = relationship("Employee")
     recipient_user = relationship("User")
 
+    __table_args__ = (
+        # Worker claim queue: only undelivered rows are indexed
+        Index(
+            'ix_notifications_pending', 'available_at',
+            postgresql_where=(status == NotificationStatus.PENDING),
+        ),
+        Index(
+            'ix_notifications_sending', 'claimed_at',
+            postgresql_where=(status == NotificationStatus.SENDING),
+        ),
+        # Per-employee queue released when they mark attendance
+        Index(
+            'ix_notifications_deferred', 'recipient_employee_id',
+            postgresql_where=(status == NotificationStatus.DEFERRED),
+        ),
+    )
+
     def __repr__(self) -> str:
-        return f"<Notification(type='{self.notification_type}', sent_at={self.sent_at})>"
+        return f"<Notification(type='{self.notification_type}', status='{self.status}')>"
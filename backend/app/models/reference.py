@@ -0,0 +1,37 @@
+"""
+Reference data version model for delta sync of employees, labels and routines.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Boolean, DateTime, Sequence, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.core.database import Base
+
+
+class ReferenceEntity(str, enum.Enum):
+    """Reference entity type enumeration."""
+    EMPLOYEE = "employee"
+    LABEL = "label"
+    ROUTINE = "routine"
+
+
+# Monotonic version counter shared by the whole reference set
+reference_version_seq = Sequence("reference_version_seq")
+
+
+class ReferenceVersion(Base):
+    """
+    Latest version of each employee, label and routine.
+    One row per entity; deleted entities are kept as tombstones.
+    """
+    __tablename__ = "reference_versions"
+
+    entity_type = Column(SQLEnum(ReferenceEntity), primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(BigInteger, reference_version_seq, nullable=False, index=True)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReferenceVersion(type='{self.entity_type}', id={self.entity_id}, version={self.version})>"
@@ -0,0 +1,30 @@
+"""
+Resource version model for cheap change detection on polled endpoints.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, BigInteger, DateTime
+import enum
+
+from app.core.database import Base
+
+
+class Resource(str, enum.Enum):
+    """Versioned resource enumeration."""
+    TASKS = "tasks"
+    ATTENDANCE = "attendance"
+    EMPLOYEES = "employees"
+
+
+class ResourceVersion(Base):
+    """
+    Change counter per resource.
+    Bumped right after every change to the resource commits.
+    """
+    __tablename__ = "resource_versions"
+
+    resource = Column(String(50), primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ResourceVersion(resource='{self.resource}', version={self.version})>"
@@ -0,0 +1,82 @@
+"""
+Daily task rollup models for reporting analytics.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, Float, Boolean, Date, DateTime, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.core.database import Base
+from app.models.task import TaskStatus, TaskPriority
+
+
+class TaskDailyRollup(Base):
+    """
+    Task counts per (due date, employee, label, status, priority).
+    Rows with a NULL label_id count every task once whatever its labels;
+    rows with a label_id count the tasks carrying that label. Unassigned
+    tasks have a NULL employee_id. No foreign keys: rollups outlive
+    deleted labels and are rebuilt from tasks anyway.
+    """
+    __tablename__ = "task_daily_rollups"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False, index=True)
+    employee_id = Column(UUID(as_uuid=True), nullable=True)
+    label_id = Column(UUID(as_uuid=True), nullable=True)
+    status = Column(SQLEnum(TaskStatus), nullable=False)
+    priority = Column(SQLEnum(TaskPriority), nullable=False)
+
+    task_count = Column(Integer, nullable=False)
+    completed_on_time = Column(Integer, nullable=False)
+    completed_late = Column(Integer, nullable=False)
+    # Sum of created_at -> completed_at over completed tasks
+    completion_seconds = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_task_daily_rollups_employee_day", "employee_id", "day"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TaskDailyRollup(day={self.day}, employee_id={self.employee_id}, status='{self.status}')>"
+
+
+class TaskRollupDay(Base):
+    """
+    A due date that has rollup rows.
+    Flagged dirty when one of its tasks changes after it was rolled up, so
+    only that day is recomputed.
+    """
+    __tablename__ = "task_rollup_days"
+
+    day = Column(Date, primary_key=True)
+    dirty = Column(Boolean, nullable=False, default=True, index=True)
+    rolled_up_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<TaskRollupDay(day={self.day}, dirty={self.dirty})>"
+
+
+class SketchDimension(str, enum.Enum):
+    """What a completion time sketch is kept per."""
+    EMPLOYEE = "employee"
+    LABEL = "label"
+
+
+class CompletionTimeBin(Base):
+    """
+    One bin of a per-day completion time sketch (see app.core.ddsketch).
+    A day's sketch for an employee or label is all its bins; summing bins
+    over days merges the sketches exactly. Completions only ever add to or
+    subtract from a count, so concurrent updates need no locking.
+    """
+    __tablename__ = "completion_time_bins"
+
+    dimension = Column(SQLEnum(SketchDimension), primary_key=True)
+    day = Column(Date, primary_key=True)
+    key = Column(UUID(as_uuid=True), primary_key=True)
+    bin = Column(SmallInteger, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<CompletionTimeBin(dimension='{self.dimension}', day={self.day}, key={self.key}, bin={self.bin})>"
@@ -3,7 +3,7 @@ Task model for managing individual tasks and subtasks.
 """
 import uuid
 from datetime import datetime, date, time
-from sqlalchemy import Column, String, Text, DateTime, Date, Time, Boolean, ForeignKey, BigInteger, Enum as SQLEnum, Table
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, Date, Time, Boolean, ForeignKey, BigInteger, Enum as SQLEnum, Table, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -35,30 +35,66 @@ class TaskStatus(str, enum.Enum):
     OVERDUE = "overdue"
 
 
-# Association table for task-label many-to-many relationship
+# Statuses of tasks still waiting on their assignee
+OPEN_STATUSES = frozenset({
+    TaskStatus.PENDING,
+    TaskStatus.ASSIGNED,
+    TaskStatus.IN_PROGRESS,
+    TaskStatus.BLOCKED,
+    TaskStatus.OVERDUE,
+})
+
+
+# Association table for task-label many-to-many relationship.
+# Columns pointing at tasks have no foreign key: tasks is partitioned and its
+# primary key includes due_date, so id alone cannot be referenced.
 task_labels = Table(
     'task_labels',
     Base.metadata,
-    Column('task_id', UUID(as_uuid=True), ForeignKey('tasks.id'), primary_key=True),
+    Column('task_id', UUID(as_uuid=True), primary_key=True),
     Column('label_id', UUID(as_uuid=True), ForeignKey('employee_labels.id'), primary_key=True)
 )
 
 
+# Every task number ever issued, deleted and archived tasks included. A unique
+# index on tasks would have to include due_date, so uniqueness is kept here:
+# generate_task_number claims a number before it is used.
+task_numbers = Table(
+    'task_numbers',
+    Base.metadata,
+    Column('task_number', String(20), primary_key=True)
+)
+
+
+# Last number issued per prefix ("T2026-", "T2026-001-S"). Counting tasks
+# instead would go backwards as tasks are deleted or archived.
+task_number_counters = Table(
+    'task_number_counters',
+    Base.metadata,
+    Column('prefix', String(20), primary_key=True),
+    Column('last_value', Integer, nullable=False)
+)
+
+
 class Task(Base):
     """
     Task model for tracking work assignments.
     Supports both routine and one-time tasks, with subtask capability.
+    Range partitioned by month on due_date (see app.services.partitions).
     """
     __tablename__ = "tasks"
+    __table_args__ = {"postgresql_partition_by": "RANGE (due_date)"}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    task_number = Column(String(20), unique=True, nullable=False, index=True)
+    # Unique through task_numbers, claimed by generate_task_number
+    task_number = Column(String(20), nullable=False, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     task_type = Column(SQLEnum(TaskType), nullable=False, default=TaskType.ONE_TIME)
     priority = Column(SQLEnum(TaskPriority), nullable=False, default=TaskPriority.MEDIUM)
     status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.PENDING, index=True)
-    due_date = Column(Date, nullable=False, index=True)
+    # Part of the primary key because it is the partition key
+    due_date = Column(Date, primary_key=True, nullable=False, index=True)
     due_time = Column(Time, nullable=True)
 
     # Assignment tracking
@@ -67,7 +103,7 @@ class Task(Base):
     created_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
 
     # Subtask support
-    parent_task_id = Column(UUID(as_uuid=True), ForeignKey('tasks.id'), nullable=True, index=True)
+    parent_task_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     is_subtask = Column(Boolean, default=False, nullable=False)
 
     # Telegram tracking
@@ -84,18 +120,35 @@ class Task(Base):
     creator = relationship("User", foreign_keys=[created_by])
 
     # Self-referential relationship for subtasks
-    parent_task = relationship("Task", remote_side=[id], backref="subtasks")
+    parent_task = relationship(
+        "Task",
+        primaryjoin="Task.id == foreign(Task.parent_task_id)",
+        remote_side=[id],
+        backref="subtasks"
+    )
 
     # Comments
-    comments = relationship("TaskComment", back_populates="task", cascade="all, delete-orphan")
+    comments = relationship(
+        "TaskComment",
+        primaryjoin="Task.id == foreign(TaskComment.task_id)",
+        back_populates="task",
+        cascade="all, delete-orphan"
+    )
+
+    # Notifications outlive their task; deleting it clears their task_id
+    notifications = relationship("Notification", primaryjoin="Task.id == foreign(Notification.task_id)")
 
     # Labels
     labels = relationship(
         "EmployeeLabel",
         secondary=task_labels,
+        primaryjoin="Task.id == foreign(task_labels.c.task_id)",
+        secondaryjoin="EmployeeLabel.id == foreign(task_labels.c.label_id)",
         backref="tasks"
     )
 
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return f"<Task(task_number='{self.task_number}', title='{self.title}', status='{self.status}')>"
 
@@ -114,7 +167,7 @@ class TaskComment(Base):
     __tablename__ = "task_comments"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    task_id = Column(UUID(as_uuid=True), ForeignKey('tasks.id'), nullable=False, index=True)
+    task_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     comment_by_employee_id = Column(UUID(as_uuid=True), ForeignKey('employees.id'), nullable=True)
     comment_by_user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
     comment_text = Column(Text, nullable=False)
@@ -122,9 +175,17 @@ class TaskComment(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
-    task = relationship("Task", back_populates="comments")
+    task = relationship("Task", primaryjoin="Task.id == foreign(TaskComment.task_id)", back_populates="comments")
     employee = relationship("Employee")
     user = relationship("User")
 
     def __repr__(self) -> str:
         return f"<TaskComment(task_id={self.task_id}, type='{self.comment_type}')>"
+
+
+# Rows outside the monthly partitions land here until their month is split out
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL("CREATE TABLE tasks_default PARTITION OF tasks DEFAULT"),
+)
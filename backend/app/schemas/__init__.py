@@ -49,6 +49,10 @@ from app.schemas.routine import (
     RoutineUpdate,
     RoutineResponse,
 )
+from app.schemas.reference import (
+    ReferenceDeleted,
+    ReferenceDelta,
+)
 
 __all__ = [
     # User
@@ -93,4 +97,7 @@ __all__ = [
     "RoutineCreate",
     "RoutineUpdate",
     "RoutineResponse",
+    # Reference
+    "ReferenceDeleted",
+    "ReferenceDelta",
 ]
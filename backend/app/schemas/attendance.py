@@ -48,6 +48,7 @@ class AttendanceSummary(BaseModel):
     present: int
     absent: int
     half_day: int
-    leave: int
+    on_leave: int
+    not_marked: int
     present_employees: list[str] = []
     absent_employees: list[str] = []
@@ -43,6 +43,8 @@ class EmployeeBase(BaseModel):
 
 class EmployeeCreate(EmployeeBase):
     """Schema for creating an employee."""
+    telegram_user_id: Optional[int] = None
+    telegram_username: Optional[str] = Field(None, max_length=50)
     label_ids: Optional[List[UUID]] = []
 
 
@@ -50,6 +52,8 @@ class EmployeeUpdate(BaseModel):
     """Schema for updating an employee."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     phone: Optional[str] = Field(None, max_length=20)
+    telegram_user_id: Optional[int] = None
+    telegram_username: Optional[str] = Field(None, max_length=50)
     is_active: Optional[bool] = None
     label_ids: Optional[List[UUID]] = None
 
@@ -0,0 +1,29 @@
+"""
+Pydantic schemas for reference data delta sync.
+"""
+from pydantic import BaseModel
+from typing import List
+from uuid import UUID
+
+from app.schemas.employee import EmployeeResponse, EmployeeLabelResponse
+from app.schemas.routine import RoutineResponse
+
+
+class ReferenceDeleted(BaseModel):
+    """IDs of reference entities deleted since the requested version."""
+    employees: List[UUID] = []
+    labels: List[UUID] = []
+    routines: List[UUID] = []
+
+
+class ReferenceDelta(BaseModel):
+    """
+    Schema for reference data sync response.
+    A full snapshot when `full` is true, otherwise only rows changed since the requested version.
+    """
+    version: int
+    full: bool = False
+    employees: List[EmployeeResponse] = []
+    labels: List[EmployeeLabelResponse] = []
+    routines: List[RoutineResponse] = []
+    deleted: ReferenceDeleted = ReferenceDeleted()
@@ -7,6 +7,7 @@ from datetime import datetime, time
 from uuid import UUID
 
 from app.models.routine import RecurrenceType
+from app.schemas.employee import EmployeeLabelResponse
 
 
 class RoutineBase(BaseModel):
@@ -53,6 +54,7 @@ class RoutineResponse(RoutineBase):
     id: UUID
     is_active: bool
     created_by: Optional[UUID] = None
+    labels: List[EmployeeLabelResponse] = []
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,300 @@
+"""
+Vectorized task and attendance analytics.
+Task and attendance rows for a date range are streamed in one binary COPY
+each into NumPy arrays of small integer codes (day offset, status,
+employee index). Grouped counts, rates and rolling windows are then array
+operations, so months of history are summarized without a Python loop
+over rows.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import Date, Integer, case, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+from app.models.task import TaskStatus
+from app.services.archive import task_history
+
+# Rows decoded into arrays at a time from the COPY stream
+STREAM_CHUNK = 50_000
+
+# Codes are positions in these lists
+TASK_STATUSES = list(TaskStatus)
+ATTENDANCE_STATUSES = list(AttendanceStatus)
+
+COMPLETED = TASK_STATUSES.index(TaskStatus.COMPLETED)
+OVERDUE = TASK_STATUSES.index(TaskStatus.OVERDUE)
+OPEN = np.array([TASK_STATUSES.index(status) for status in TaskStatus if status != TaskStatus.COMPLETED])
+PRESENT = np.array([ATTENDANCE_STATUSES.index(AttendanceStatus.PRESENT), ATTENDANCE_STATUSES.index(AttendanceStatus.HALF_DAY)])
+
+# completed_day of tasks that are not completed
+NO_DAY = np.iinfo(np.int32).min
+
+
+@dataclass
+class TaskColumns:
+    """Top-level tasks due in a date range, one array element per task."""
+    start_date: date
+    days: int
+    employee_ids: List[UUID]
+    day: np.ndarray  # Due date as days after start_date
+    status: np.ndarray  # Index into TASK_STATUSES
+    employee: np.ndarray  # Index into employee_ids, -1 if unassigned
+    completed_day: np.ndarray  # Completion date as days after start_date, NO_DAY if open
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+
+@dataclass
+class AttendanceColumns:
+    """Attendance records in a date range, one array element per record."""
+    start_date: date
+    days: int
+    employee_ids: List[UUID]
+    day: np.ndarray  # Date as days after start_date
+    status: np.ndarray  # Index into ATTENDANCE_STATUSES
+    employee: np.ndarray  # Index into employee_ids
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+
+def load_employees(db: Session) -> Tuple[List[UUID], List[str]]:
+    """Employee IDs and names in index order."""
+    rows = db.execute(select(Employee.id, Employee.name).order_by(Employee.id)).all()
+    return [row.id for row in rows], [row.name for row in rows]
+
+
+def load_task_columns(db: Session, start_date: date, end_date: date, employee_ids: List[UUID]) -> TaskColumns:
+    """Stream the range's top-level tasks, archived ones included, into arrays."""
+    tasks = task_history(db, start_date, end_date).tasks.c
+    columns = _stream(db, select(
+        cast(tasks.due_date - start_date, Integer),
+        _code(tasks.status, TASK_STATUSES),
+        _employee_index(tasks.assigned_to, employee_ids),
+        func.coalesce(cast(cast(tasks.completed_at, Date) - start_date, Integer), int(NO_DAY)),
+    ).where(tasks.is_subtask == False, tasks.due_date.between(start_date, end_date)), width=4)
+    return TaskColumns(
+        start_date,
+        (end_date - start_date).days + 1,
+        employee_ids,
+        day=columns[:, 0],
+        status=columns[:, 1],
+        employee=columns[:, 2],
+        completed_day=columns[:, 3],
+    )
+
+
+def load_attendance_columns(
+    db: Session, start_date: date, end_date: date, employee_ids: List[UUID]
+) -> AttendanceColumns:
+    """Stream the range's attendance records into arrays (one query)."""
+    columns = _stream(db, select(
+        cast(Attendance.date - start_date, Integer),
+        _code(Attendance.status, ATTENDANCE_STATUSES),
+        _employee_index(Attendance.employee_id, employee_ids),
+    ).where(Attendance.date.between(start_date, end_date)), width=3)
+    return AttendanceColumns(
+        start_date,
+        (end_date - start_date).days + 1,
+        employee_ids,
+        day=columns[:, 0],
+        status=columns[:, 1],
+        employee=columns[:, 2],
+    )
+
+
+def grouped_counts(groups: np.ndarray, codes: np.ndarray, group_count: int, code_count: int) -> np.ndarray:
+    """
+    Count rows per (group, code).
+
+    Returns:
+        group_count x code_count matrix; rows with a group outside
+        0..group_count-1 are left out
+    """
+    valid = (groups >= 0) & (groups < group_count)
+    flat = groups[valid].astype(np.int64) * code_count + codes[valid]
+    return np.bincount(flat, minlength=group_count * code_count).reshape(group_count, code_count)
+
+
+def rates(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise numerator / denominator, 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=np.asarray(denominator) > 0)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum over `window` elements along the first axis (shorter at the start)."""
+    totals = np.cumsum(values, axis=0, dtype=np.float64)
+    totals[window:] = totals[window:] - totals[:-window]
+    return totals
+
+
+def task_trends(tasks: TaskColumns, today: date, window: int = 7) -> Dict[str, Any]:
+    """Daily task counts and completion rates, plain and over a trailing window."""
+    by_day = grouped_counts(tasks.day, tasks.status, tasks.days, len(TASK_STATUSES))
+    total = by_day.sum(axis=1)
+    completed = by_day[:, COMPLETED]
+
+    # Open after their due date has passed, or explicitly marked overdue
+    past = np.arange(tasks.days) < (today - tasks.start_date).days
+    overdue = np.where(past, by_day[:, OPEN].sum(axis=1), by_day[:, OVERDUE])
+
+    on_time = grouped_counts(
+        tasks.day[tasks.completed_day != NO_DAY],
+        (tasks.completed_day <= tasks.day)[tasks.completed_day != NO_DAY].astype(np.int64),
+        tasks.days,
+        2,
+    )[:, 1]
+
+    return {
+        "total": total,
+        "completed": completed,
+        "on_time": on_time,
+        "overdue": overdue,
+        "completion_rate": rates(completed, total),
+        "rolling_completion_rate": rates(rolling_sum(completed, window), rolling_sum(total, window)),
+        "rolling_overdue_rate": rates(rolling_sum(overdue, window), rolling_sum(total, window)),
+    }
+
+
+def employee_task_rates(tasks: TaskColumns) -> Dict[str, np.ndarray]:
+    """Per-employee task totals and completion rates over the whole range."""
+    by_employee = grouped_counts(tasks.employee, tasks.status, len(tasks.employee_ids), len(TASK_STATUSES))
+    total = by_employee.sum(axis=1)
+    completed = by_employee[:, COMPLETED]
+    return {"total": total, "completed": completed, "completion_rate": rates(completed, total)}
+
+
+def attendance_trends(attendance: AttendanceColumns, active_employees: int, window: int = 7) -> Dict[str, Any]:
+    """Daily attendance counts and presence rate, plain and over a trailing window."""
+    by_day = grouped_counts(attendance.day, attendance.status, attendance.days, len(ATTENDANCE_STATUSES))
+    present = by_day[:, PRESENT].sum(axis=1)
+    expected = np.full(attendance.days, active_employees)
+    return {
+        **{status.value: by_day[:, code] for code, status in enumerate(ATTENDANCE_STATUSES)},
+        "presence_rate": rates(present, expected),
+        "rolling_presence_rate": rates(rolling_sum(present, window), rolling_sum(expected, window)),
+    }
+
+
+def trends(db: Session, start_date: date, end_date: date, window: int = 7) -> Dict[str, Any]:
+    """Task and attendance trends for a date range, ready for JSON."""
+    employee_ids, names = load_employees(db)
+    active_employees = db.scalar(select(func.count()).select_from(Employee).where(Employee.is_active == True))
+    tasks = load_task_columns(db, start_date, end_date, employee_ids)
+    attendance = load_attendance_columns(db, start_date, end_date, employee_ids)
+
+    by_employee = employee_task_rates(tasks)
+    employees = [
+        {
+            "employee_id": str(employee_ids[index]),
+            "name": names[index],
+            "total": int(by_employee["total"][index]),
+            "completed": int(by_employee["completed"][index]),
+            "completion_rate": round(float(by_employee["completion_rate"][index]) * 100, 1),
+        }
+        for index in np.flatnonzero(by_employee["total"])
+    ]
+
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "window": window,
+        "dates": [date.fromordinal(start_date.toordinal() + offset).isoformat() for offset in range(tasks.days)],
+        "tasks": _series(task_trends(tasks, date.today(), window)),
+        "attendance": _series(attendance_trends(attendance, active_employees, window)),
+        "employees": employees,
+    }
+
+
+def _series(arrays: Dict[str, np.ndarray]) -> Dict[str, list]:
+    """Arrays as JSON lists; rates as percentages."""
+    return {
+        name: (np.round(values * 100, 1) if "rate" in name else values).tolist()
+        for name, values in arrays.items()
+    }
+
+
+def _code(column, members: list):
+    """Position of the column's enum value in `members`."""
+    return case(*((column == member, code) for code, member in enumerate(members)))
+
+
+def _employee_index(column, employee_ids: List[UUID]):
+    """0-based position of the column's employee in employee_ids, -1 if none."""
+    uuid_array = ARRAY(PG_UUID(as_uuid=True))
+    return func.coalesce(func.array_position(cast(literal(employee_ids, uuid_array), uuid_array), column), 0) - 1
+
+
+class BinaryCopyReader:
+    """
+    File-like target for COPY ... TO STDOUT (FORMAT binary) of non-null int4
+    columns. Rows are decoded with one np.frombuffer per chunk instead of a
+    Python object per row.
+    """
+
+    SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+    HEADER_BYTES = len(SIGNATURE) + 4 + 4  # Signature, flags, extension length
+    TRAILER = b"\xff\xff"
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        # Each row: int16 field count, then (int32 length, int32 value) per column
+        self.row_dtype = np.dtype(
+            [("fields", ">i2")] + [item for i in range(width) for item in ((f"l{i}", ">i4"), (f"v{i}", ">i4"))]
+        )
+        self._buffer = bytearray()
+        self._header_read = False
+        self._chunks: List[np.ndarray] = []
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        if len(self._buffer) >= STREAM_CHUNK * self.row_dtype.itemsize:
+            self._decode()
+        return len(data)
+
+    def result(self) -> np.ndarray:
+        """All rows as an (n, width) int32 array."""
+        self._decode()
+        if bytes(self._buffer) != self.TRAILER:
+            raise ValueError("Truncated COPY stream")
+        if not self._chunks:
+            return np.empty((0, self.width), dtype=np.int32)
+        return np.concatenate(self._chunks)
+
+    def _decode(self) -> None:
+        if not self._header_read:
+            if len(self._buffer) < self.HEADER_BYTES:
+                return
+            if not self._buffer.startswith(self.SIGNATURE):
+                raise ValueError("Not a binary COPY stream")
+            extension = int.from_bytes(self._buffer[self.HEADER_BYTES - 4:self.HEADER_BYTES], "big")
+            del self._buffer[:self.HEADER_BYTES + extension]
+            self._header_read = True
+
+        count = len(self._buffer) // self.row_dtype.itemsize
+        if count == 0:
+            return
+        rows = np.frombuffer(self._buffer, dtype=self.row_dtype, count=count)
+        if (rows["fields"] != self.width).any() or any((rows[f"l{i}"] != 4).any() for i in range(self.width)):
+            raise ValueError("Expected non-null int4 columns only")
+        self._chunks.append(np.column_stack([rows[f"v{i}"] for i in range(self.width)]).astype(np.int32))
+        del rows
+        del self._buffer[:count * self.row_dtype.itemsize]
+
+
+def _stream(db: Session, stmt, width: int) -> np.ndarray:
+    """Stream an all-int4, non-null query into an (n, width) int32 array with one binary COPY."""
+    sql = stmt.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    reader = BinaryCopyReader(width)
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY ({sql}) TO STDOUT WITH (FORMAT binary)", reader, size=1 << 20)
+    return reader.result()
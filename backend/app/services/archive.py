@@ -0,0 +1,154 @@
+"""
+Archival of completed tasks to cold storage tables.
+Top-level tasks completed more than TASK_ARCHIVE_AFTER_DAYS ago are moved,
+with their subtasks, comments and labels, into archived_tasks,
+archived_task_comments and archived_task_labels, TASK_ARCHIVE_BATCH_SIZE
+tasks per transaction. The hot tables then hold open and recent tasks only.
+
+Archived tasks are read-only. History reads call task_history(), which
+adds the archive only when it holds tasks due in the requested range.
+Rollups and completion time sketches count archived tasks as before: the
+move does not change them, and recomputing them reads task_history().
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import delete, exists, func, insert, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import FromClause
+
+from app.core.config import settings
+from app.core.invalidation import publish_invalidation
+from app.models.archive import ArchivedTask, ArchivedTaskComment, archived_task_labels
+from app.models.resource_version import Resource
+from app.models.task import Task, TaskComment, TaskStatus, task_labels
+from app.services.resource_versions import bump_resource_versions
+
+TASK_COLUMNS = [column.name for column in Task.__table__.columns]
+COMMENT_COLUMNS = [column.name for column in TaskComment.__table__.columns]
+
+
+@dataclass(frozen=True)
+class TaskHistory:
+    """Task and task label rows to read, with the same columns as tasks and task_labels."""
+    tasks: FromClause
+    task_labels: FromClause
+    archived: bool
+
+
+def task_history(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None) -> TaskHistory:
+    """
+    Tasks for a due date range: the hot tables, plus the archive if it holds
+    tasks due in the range (two index lookups to find out).
+
+    Args:
+        db: Database session
+        start_date: First due date (default unbounded)
+        end_date: Last due date (default unbounded)
+    """
+    first, last = db.execute(select(func.min(ArchivedTask.due_date), func.max(ArchivedTask.due_date))).one()
+    if first is None or (end_date is not None and end_date < first) or (start_date is not None and start_date > last):
+        return TaskHistory(Task.__table__, task_labels, archived=False)
+
+    archived = ArchivedTask.__table__
+    return TaskHistory(
+        union_all(
+            select(Task.__table__),
+            select(*(archived.c[name] for name in TASK_COLUMNS)),
+        ).subquery("task_history"),
+        union_all(
+            select(task_labels),
+            select(archived_task_labels.c.task_id, archived_task_labels.c.label_id),
+        ).subquery("task_label_history"),
+        archived=True,
+    )
+
+
+def archive_completed_tasks(
+    db: Session,
+    older_than_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Move tasks completed more than older_than_days ago into the archive,
+    committing after every batch.
+
+    Args:
+        db: Database session
+        older_than_days: Age of completion to archive at (default settings.TASK_ARCHIVE_AFTER_DAYS)
+        batch_size: Top-level tasks per transaction (default settings.TASK_ARCHIVE_BATCH_SIZE)
+
+    Returns:
+        Rows archived per table
+    """
+    older_than_days = older_than_days if older_than_days is not None else settings.TASK_ARCHIVE_AFTER_DAYS
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+
+    totals = {"tasks": 0, "comments": 0, "labels": 0}
+    while True:
+        archived = _archive_batch(db, cutoff, batch_size)
+        db.commit()
+        if not archived["tasks"]:
+            return totals
+        for table, count in archived.items():
+            totals[table] += count
+
+
+def _archive_batch(db: Session, cutoff: datetime, batch_size: int) -> Dict[str, int]:
+    """Archive up to batch_size finished task trees in the session's transaction."""
+    tasks = Task.__table__
+    subtasks = tasks.alias("subtasks")
+    finished = (Task.status == TaskStatus.COMPLETED, Task.completed_at < cutoff)
+    unfinished_subtask = exists().where(
+        subtasks.c.parent_task_id == Task.id,
+        or_(
+            subtasks.c.status != TaskStatus.COMPLETED,
+            subtasks.c.completed_at.is_(None),
+            subtasks.c.completed_at >= cutoff,
+        ),
+    )
+    # Tasks being edited right now are left for the next run
+    parent_ids = db.scalars(
+        select(Task.id)
+        .where(Task.is_subtask == False, *finished, ~unfinished_subtask)
+        .order_by(Task.completed_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not parent_ids:
+        return {"tasks": 0, "comments": 0, "labels": 0}
+    task_ids = [
+        *parent_ids,
+        *db.scalars(select(Task.id).where(Task.parent_task_id.in_(parent_ids)).with_for_update()).all(),
+    ]
+
+    now = literal(datetime.utcnow())
+    db.execute(
+        insert(ArchivedTask).from_select(
+            [*TASK_COLUMNS, "archived_at"],
+            select(*tasks.c, now).where(tasks.c.id.in_(task_ids)),
+        )
+    )
+    comments = db.execute(
+        insert(ArchivedTaskComment).from_select(
+            COMMENT_COLUMNS,
+            select(TaskComment.__table__).where(TaskComment.task_id.in_(task_ids)),
+        )
+    ).rowcount
+    labels = db.execute(
+        insert(archived_task_labels).from_select(
+            ["task_id", "label_id"],
+            select(task_labels).where(task_labels.c.task_id.in_(task_ids)),
+        )
+    ).rowcount
+    db.execute(delete(TaskComment.__table__).where(TaskComment.task_id.in_(task_ids)))
+    db.execute(delete(task_labels).where(task_labels.c.task_id.in_(task_ids)))
+    db.execute(delete(tasks).where(tasks.c.id.in_(task_ids)))
+
+    # Core deletes bypass the flush hooks; rollups and sketches are unaffected by design
+    bump_resource_versions(db, [Resource.TASKS])
+    publish_invalidation(db, "tasks", [str(task_id) for task_id in task_ids])
+    publish_invalidation(db, "comments")
+    return {"tasks": len(task_ids), "comments": comments, "labels": labels}
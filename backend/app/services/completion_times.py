@@ -0,0 +1,256 @@
+"""
+Completion time percentiles per employee and per label.
+Each completed task's created_at -> completed_at time is counted into a
+DDSketch (app.core.ddsketch) per (completion day, employee) and per
+(completion day, label), stored as bins in completion_time_bins. Counts are
+added when a task is completed and taken back if it is reopened, edited or
+deleted, in the same transaction. A date range is answered by summing the
+days' bins per key (an exact sketch merge) and reading the quantiles off
+the merged sketches in memory, without touching tasks. Archiving a task
+leaves its counts in place.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Date, cast, delete, event, func, insert, inspect, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.ddsketch import LOG_GAMMA, MIN_VALUE, DDSketch, bin_index
+from app.models.employee import Employee, EmployeeLabel
+from app.models.rollup import CompletionTimeBin, SketchDimension
+from app.models.task import Task, TaskStatus, task_labels
+from app.services.archive import task_history
+
+PERCENTILES = (0.5, 0.9)
+
+# Task attributes a completion is derived from
+COMPLETION_ATTRIBUTES = ("status", "created_at", "completed_at", "assigned_to")
+
+
+@dataclass(frozen=True)
+class Completion:
+    """A completed task as counted in the sketches."""
+    day: date
+    seconds: float
+    employee_id: Optional[UUID]
+    label_ids: FrozenSet[UUID] = frozenset()
+
+
+def completion_of(values: Dict[str, Any], label_ids: Iterable[UUID] = ()) -> Optional[Completion]:
+    """The completion a task's values count as, or None if it is not completed."""
+    if values["status"] != TaskStatus.COMPLETED or values["completed_at"] is None or values["created_at"] is None:
+        return None
+    return Completion(
+        values["completed_at"].date(),
+        (values["completed_at"] - values["created_at"]).total_seconds(),
+        values["assigned_to"],
+        frozenset(label_ids),
+    )
+
+
+def record_completions(
+    connection: Connection,
+    added: Iterable[Completion] = (),
+    removed: Iterable[Completion] = (),
+) -> None:
+    """
+    Add and take back completions in the caller's transaction.
+    Call this after Core-level task writes that bypass the ORM flush hook.
+    """
+    deltas: Dict[Tuple[SketchDimension, date, UUID, int], int] = {}
+    for completions, sign in ((added, 1), (removed, -1)):
+        for completion in completions:
+            index = bin_index(completion.seconds)
+            keys = [(SketchDimension.LABEL, label_id) for label_id in completion.label_ids]
+            if completion.employee_id is not None:
+                keys.append((SketchDimension.EMPLOYEE, completion.employee_id))
+            for dimension, key in keys:
+                bin_key = (dimension, completion.day, key, index)
+                deltas[bin_key] = deltas.get(bin_key, 0) + sign
+
+    rows = [
+        {"dimension": dimension, "day": day, "key": key, "bin": index, "count": count}
+        for (dimension, day, key, index), count in sorted(deltas.items(), key=lambda item: str(item[0]))
+        if count
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(CompletionTimeBin).values(rows)
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=[
+            CompletionTimeBin.dimension, CompletionTimeBin.day, CompletionTimeBin.key, CompletionTimeBin.bin
+        ],
+        set_={"count": CompletionTimeBin.count + stmt.excluded.count},
+    ))
+
+
+def record_task_completion(connection: Connection, task) -> None:
+    """
+    Count a task completed by a Core UPDATE; `task` carries COMPLETION_ATTRIBUTES,
+    id and is_subtask. Subtasks are not counted, as in the flush hook.
+    """
+    if task.is_subtask:
+        return
+    values = {attribute: getattr(task, attribute) for attribute in COMPLETION_ATTRIBUTES}
+    label_ids = connection.execute(
+        select(task_labels.c.label_id).where(task_labels.c.task_id == task.id)
+    ).scalars().all()
+    completion = completion_of(values, label_ids)
+    if completion is not None:
+        record_completions(connection, added=[completion])
+
+
+def rebuild_completion_times(db: Session) -> int:
+    """
+    Recount every sketch from tasks, archived ones included, e.g. after
+    deploying the table.
+
+    Returns:
+        Number of bins written
+    """
+    history = task_history(db)
+    tasks, labels = history.tasks.c, history.task_labels.c
+    seconds = func.extract("epoch", tasks.completed_at - tasks.created_at)
+    index = func.ceil(func.ln(func.greatest(seconds, MIN_VALUE)) / LOG_GAMMA).label("bin")
+    day = cast(tasks.completed_at, Date).label("day")
+    completed = (tasks.is_subtask == False, tasks.status == TaskStatus.COMPLETED, tasks.completed_at.isnot(None))
+
+    dimension = CompletionTimeBin.dimension.type
+    by_employee = (
+        select(
+            literal(SketchDimension.EMPLOYEE, dimension).label("dimension"),
+            day,
+            tasks.assigned_to.label("key"),
+            index,
+            func.count().label("count"),
+        )
+        .where(*completed, tasks.assigned_to.isnot(None))
+        .group_by(day, tasks.assigned_to, index)
+    )
+    by_label = (
+        select(
+            literal(SketchDimension.LABEL, dimension).label("dimension"),
+            day,
+            labels.label_id.label("key"),
+            index,
+            func.count().label("count"),
+        )
+        .select_from(history.tasks)
+        .join(history.task_labels, labels.task_id == tasks.id)
+        .where(*completed)
+        .group_by(day, labels.label_id, index)
+    )
+
+    db.execute(delete(CompletionTimeBin))
+    columns = ("dimension", "day", "key", "bin", "count")
+    written = 0
+    for source in (by_employee, by_label):
+        written += db.execute(insert(CompletionTimeBin).from_select(columns, source)).rowcount
+    db.commit()
+    return written
+
+
+def completion_time_percentiles(
+    db: Session,
+    dimension: SketchDimension,
+    start_date: date,
+    end_date: date,
+) -> Dict[str, Any]:
+    """
+    p50/p90 completion time per employee or label over a date range.
+
+    Args:
+        db: Database session
+        dimension: Group by employee or by label
+        start_date: First completion day
+        end_date: Last completion day
+
+    Returns:
+        Percentiles (in hours) per key, best first, and merged over all keys
+    """
+    name_model = Employee if dimension == SketchDimension.EMPLOYEE else EmployeeLabel
+    rows = db.execute(
+        select(CompletionTimeBin.key, name_model.name, CompletionTimeBin.bin, func.sum(CompletionTimeBin.count))
+        .join(name_model, name_model.id == CompletionTimeBin.key)
+        .where(CompletionTimeBin.dimension == dimension, CompletionTimeBin.day.between(start_date, end_date))
+        .group_by(CompletionTimeBin.key, name_model.name, CompletionTimeBin.bin)
+        .having(func.sum(CompletionTimeBin.count) > 0)
+    ).all()
+
+    sketches: Dict[UUID, DDSketch] = {}
+    names: Dict[UUID, str] = {}
+    for key, name, index, count in rows:
+        sketches.setdefault(key, DDSketch()).add_bin(index, int(count))
+        names[key] = name
+
+    items = sorted(
+        (_summary(sketch, id=str(key), name=names[key]) for key, sketch in sketches.items()),
+        key=lambda item: (item["p50_hours"], item["name"]),
+    )
+    overall = DDSketch()
+    if dimension == SketchDimension.EMPLOYEE:
+        for sketch in sketches.values():
+            overall.merge(sketch)
+    return {
+        "group_by": dimension.value,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "items": items,
+        # Label sketches overlap (a task can have several labels), so only employees add up
+        "overall": _summary(overall) if dimension == SketchDimension.EMPLOYEE else None,
+    }
+
+
+def _summary(sketch: DDSketch, **fields) -> Dict[str, Any]:
+    summary = {**fields, "count": sketch.count}
+    for q in PERCENTILES:
+        value = sketch.quantile(q)
+        summary[f"p{round(q * 100)}_hours"] = round(value / 3600, 2) if value is not None else None
+    return summary
+
+
+def _values(obj: Task, committed: bool) -> Dict[str, Any]:
+    """A flushed task's attribute values, before (committed) or after the flush."""
+    state = inspect(obj)
+    values = {}
+    for attribute in COMPLETION_ATTRIBUTES:
+        history = state.attrs[attribute].history
+        if committed and history.has_changes():
+            values[attribute] = history.deleted[0] if history.deleted else None
+        else:
+            values[attribute] = getattr(obj, attribute)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_completions(session: Session, flush_context) -> None:
+    """Move completion counts for tasks completed, reopened, edited or deleted in this flush."""
+    added, removed = [], []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Task) or obj.is_subtask:
+            continue
+        state = inspect(obj)
+        if obj not in session.new and obj not in session.deleted and not any(
+            state.attrs[attribute].history.has_changes() for attribute in (*COMPLETION_ATTRIBUTES, "labels")
+        ):
+            continue
+        before = None if obj in session.new else _values(obj, committed=True)
+        after = None if obj in session.deleted else _values(obj, committed=False)
+        was_completed = before is not None and completion_of(before) is not None
+        is_completed = after is not None and completion_of(after) is not None
+        if not was_completed and not is_completed:
+            continue
+
+        labels = state.attrs.labels.load_history()
+        old = completion_of(before, (label.id for label in (*labels.unchanged, *labels.deleted))) if was_completed else None
+        new = completion_of(after, (label.id for label in (*labels.unchanged, *labels.added))) if is_completed else None
+        if old != new:
+            removed.extend([old] if old else [])
+            added.extend([new] if new else [])
+
+    if added or removed:
+        record_completions(session.connection(), added, removed)
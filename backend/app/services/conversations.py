@@ -0,0 +1,297 @@
+"""
+Bot conversation state store.
+The bot reads and writes per-chat dialog state in memory. Changes are
+written behind to the conversation_states table in batches, so a message
+costs no database round trip, yet state survives restarts. Each batch
+announces its chats with NOTIFY, and other workers reload just those.
+
+Between a change and its flush (CONVERSATION_FLUSH_INTERVAL) other workers
+still see the previous state; updates from one chat are handled by one
+worker anyway (see app.api.telegram).
+"""
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Set
+
+import orjson
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.pubsub import notify, pg_listener
+from app.models.conversation import ConversationState, ConversationStep
+
+logger = logging.getLogger(__name__)
+
+CONVERSATIONS_CHANNEL = "conversation_states"
+
+# Above this many chats a flush tells other workers to reload everything
+MAX_CHATS_PER_MESSAGE = 100
+
+# Seconds between purges of expired rows
+SWEEP_INTERVAL = 60.0
+
+
+@dataclass(frozen=True)
+class Conversation:
+    """A chat's current conversation step."""
+    step: ConversationStep
+    data: Dict[str, Any]
+    expires_at: datetime
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= datetime.utcnow()
+
+
+class ConversationStore:
+    """
+    In-memory conversation state with write-behind persistence.
+    Lookups are served from memory while the LISTEN connection is up, and
+    read through to the table otherwise.
+    """
+
+    def __init__(self, ttl: float, flush_interval: float) -> None:
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self._states: Dict[int, Conversation] = {}
+        # Changes not yet committed; None marks a deletion
+        self._pending: Dict[int, Optional[Conversation]] = {}
+        self._stale: Set[int] = set()
+        self._reload_all = True
+        self._lock = threading.Lock()
+        self._refresh_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._origin = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+        pg_listener.subscribe(CONVERSATIONS_CHANNEL, self._on_notification)
+        pg_listener.on_connect(self.invalidate)
+
+    async def get(self, chat_id: int) -> Optional[Conversation]:
+        """A chat's unexpired conversation state, or None."""
+        if chat_id in self._pending:
+            conversation = self._states.get(chat_id)
+        elif not pg_listener.connected:
+            conversation = await run_in_threadpool(self._load_one, chat_id)
+        else:
+            # A refresh in flight has already taken the stale set: wait for it too
+            if self._reload_all or chat_id in self._stale or self._refresh_lock.locked():
+                await self.refresh()
+            conversation = self._states.get(chat_id)
+
+        if conversation is not None and conversation.expired:
+            self.clear(chat_id)
+            return None
+        return conversation
+
+    def set(
+        self,
+        chat_id: int,
+        step: ConversationStep,
+        data: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> Conversation:
+        """Move a chat to a step; persisted with the next flush."""
+        conversation = Conversation(
+            step,
+            data or {},
+            datetime.utcnow() + timedelta(seconds=ttl if ttl is not None else self.ttl),
+        )
+        with self._lock:
+            self._states[chat_id] = conversation
+            self._pending[chat_id] = conversation
+        return conversation
+
+    def clear(self, chat_id: int) -> None:
+        """End a chat's conversation."""
+        with self._lock:
+            if chat_id not in self._states and chat_id not in self._pending and pg_listener.connected:
+                return
+            self._states.pop(chat_id, None)
+            self._pending[chat_id] = None
+
+    def invalidate(self, chat_ids: Optional[Iterable[int]] = None) -> None:
+        """Reload some chats (or everything) from the table on next use."""
+        with self._lock:
+            if chat_ids is None:
+                self._reload_all = True
+            else:
+                self._stale.update(chat_ids)
+
+    async def refresh(self) -> None:
+        """Reload stale chats, keeping changes that are not written yet."""
+        async with self._refresh_lock:
+            with self._lock:
+                reload_all, stale = self._reload_all, self._stale
+                self._reload_all, self._stale = False, set()
+            if not reload_all and not stale:
+                return
+
+            try:
+                loaded = await run_in_threadpool(self._load, None if reload_all else stale)
+            except Exception:
+                with self._lock:
+                    self._reload_all |= reload_all
+                    self._stale |= stale
+                raise
+
+            with self._lock:
+                if reload_all:
+                    self._states = loaded
+                else:
+                    for chat_id in stale:
+                        self._states.pop(chat_id, None)
+                    self._states.update(loaded)
+                for chat_id, conversation in self._pending.items():
+                    if conversation is None:
+                        self._states.pop(chat_id, None)
+                    else:
+                        self._states[chat_id] = conversation
+
+    async def flush(self) -> int:
+        """
+        Write pending changes in one transaction.
+
+        Returns:
+            Number of chats written
+        """
+        async with self._flush_lock:
+            with self._lock:
+                batch = dict(self._pending)
+            if not batch:
+                return 0
+
+            await run_in_threadpool(self._write, batch)
+
+            # Keep anything changed again while the batch was being written
+            with self._lock:
+                for chat_id, conversation in batch.items():
+                    if chat_id in self._pending and self._pending[chat_id] is conversation:
+                        del self._pending[chat_id]
+            return len(batch)
+
+    async def sweep(self) -> None:
+        """Drop expired states from memory and the table."""
+        with self._lock:
+            expired = [chat_id for chat_id, conversation in self._states.items() if conversation.expired]
+            for chat_id in expired:
+                if chat_id not in self._pending:
+                    del self._states[chat_id]
+        await run_in_threadpool(self._purge_expired)
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final conversation state flush failed")
+
+    async def _run(self) -> None:
+        swept_at = 0.0
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if time.monotonic() - swept_at >= SWEEP_INTERVAL:
+                    await self.sweep()
+                    swept_at = time.monotonic()
+            except Exception:
+                logger.exception("Conversation state flush failed")
+
+    def _on_notification(self, payload: str) -> None:
+        """Listener callback: another worker flushed some chats."""
+        message = orjson.loads(payload)
+        if message["origin"] == self._origin:
+            return
+        chats = message["chats"]
+        if chats is None:
+            self.invalidate()
+        else:
+            self.invalidate(chat_id for chat_id in chats if chat_id not in self._pending)
+
+    def _write(self, batch: Dict[int, Optional[Conversation]]) -> None:
+        now = datetime.utcnow()
+        rows = [
+            {
+                "chat_id": chat_id,
+                "step": conversation.step,
+                "data": conversation.data,
+                "expires_at": conversation.expires_at,
+                "updated_at": now,
+            }
+            for chat_id, conversation in batch.items()
+            if conversation is not None
+        ]
+        deleted = [chat_id for chat_id, conversation in batch.items() if conversation is None]
+
+        with SessionLocal() as db:
+            if rows:
+                stmt = insert(ConversationState).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ConversationState.chat_id],
+                    set_={
+                        "step": stmt.excluded.step,
+                        "data": stmt.excluded.data,
+                        "expires_at": stmt.excluded.expires_at,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+                db.execute(stmt)
+            if deleted:
+                db.execute(delete(ConversationState).where(ConversationState.chat_id.in_(deleted)))
+
+            chats = sorted(batch) if len(batch) <= MAX_CHATS_PER_MESSAGE else None
+            notify(
+                db.connection(),
+                CONVERSATIONS_CHANNEL,
+                orjson.dumps({"origin": self._origin, "chats": chats}).decode(),
+            )
+            db.commit()
+
+    @staticmethod
+    def _load(chat_ids: Optional[Set[int]]) -> Dict[int, Conversation]:
+        stmt = select(ConversationState).where(ConversationState.expires_at > datetime.utcnow())
+        if chat_ids is not None:
+            stmt = stmt.where(ConversationState.chat_id.in_(chat_ids))
+        with SessionLocal() as db:
+            return {
+                row.chat_id: Conversation(row.step, row.data, row.expires_at)
+                for row in db.scalars(stmt)
+            }
+
+    @classmethod
+    def _load_one(cls, chat_id: int) -> Optional[Conversation]:
+        return cls._load({chat_id}).get(chat_id)
+
+    @staticmethod
+    def _purge_expired() -> None:
+        with SessionLocal() as db:
+            db.execute(delete(ConversationState).where(ConversationState.expires_at <= datetime.utcnow()))
+            db.commit()
+
+
+# One store per worker process, flushed in the background while the app runs
+conversation_store = ConversationStore(
+    ttl=settings.CONVERSATION_TTL,
+    flush_interval=settings.CONVERSATION_FLUSH_INTERVAL,
+)
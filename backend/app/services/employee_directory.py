@@ -0,0 +1,157 @@
+"""
+Telegram user to employee directory for the bot.
+Every bot update has to identify its sender; the directory keeps the
+mapping for all linked employees in memory so resolving a sender needs no
+query. It is (re)loaded whenever the LISTEN connection comes up and patched
+from the invalidation bus when employees or labels change on any worker.
+"""
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.invalidation import on_evict
+from app.core.pubsub import pg_listener
+from app.models.employee import Employee, employee_label_assignments
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TelegramEmployee:
+    """What the bot needs to know about an update's sender."""
+    employee_id: UUID
+    telegram_user_id: int
+    is_active: bool
+    label_ids: FrozenSet[UUID]
+
+
+def load_telegram_employees(db, employee_ids: Optional[Iterable[UUID]] = None) -> List[TelegramEmployee]:
+    """Load linked employees (all, or only the given ones) with their labels."""
+    employees = select(Employee.id, Employee.telegram_user_id, Employee.is_active).where(
+        Employee.telegram_user_id.isnot(None)
+    )
+    assignments = select(employee_label_assignments.c.employee_id, employee_label_assignments.c.label_id)
+    if employee_ids is not None:
+        employees = employees.where(Employee.id.in_(employee_ids))
+        assignments = assignments.where(employee_label_assignments.c.employee_id.in_(employee_ids))
+
+    labels: Dict[UUID, Set[UUID]] = {}
+    for employee_id, label_id in db.execute(assignments):
+        labels.setdefault(employee_id, set()).add(label_id)
+
+    return [
+        TelegramEmployee(employee_id, telegram_user_id, is_active, frozenset(labels.get(employee_id, ())))
+        for employee_id, telegram_user_id, is_active in db.execute(employees)
+    ]
+
+
+class EmployeeDirectory:
+    """
+    In-memory map of Telegram user ID to employee.
+    Changed employees are only marked dirty; the next lookup reloads just
+    those rows. While the LISTEN connection is down, changes from other
+    workers could be missed, so lookups read through to the database.
+    """
+
+    def __init__(self) -> None:
+        self._by_telegram_id: Dict[int, TelegramEmployee] = {}
+        self._telegram_ids: Dict[UUID, int] = {}
+        self._reload_all = True
+        self._dirty: Set[UUID] = set()
+        self._lock = threading.Lock()
+        self._refresh_lock = asyncio.Lock()
+        self._warming: Optional[asyncio.Task] = None
+
+        on_evict("employees", self._employees_changed)
+        # Deleting a label drops its assignments without touching employees
+        on_evict("labels", lambda keys: self.invalidate())
+        pg_listener.on_connect(self._warm)
+
+    async def resolve(self, telegram_user_id: int) -> Optional[TelegramEmployee]:
+        """Employee linked to a Telegram user, or None if there is none."""
+        if not pg_listener.connected:
+            return await run_in_threadpool(self._lookup, telegram_user_id)
+        # A refresh in flight has already taken the dirty set: wait for it too
+        if self._reload_all or self._dirty or self._refresh_lock.locked():
+            await self.refresh()
+        return self._by_telegram_id.get(telegram_user_id)
+
+    async def refresh(self) -> None:
+        """Reload whatever changed since the last refresh."""
+        async with self._refresh_lock:
+            with self._lock:
+                reload_all, dirty = self._reload_all, self._dirty
+                self._reload_all, self._dirty = False, set()
+            if not reload_all and not dirty:
+                return
+
+            try:
+                employees = await run_in_threadpool(self._load, None if reload_all else dirty)
+            except Exception:
+                with self._lock:
+                    self._reload_all |= reload_all
+                    self._dirty |= dirty
+                raise
+
+            with self._lock:
+                if reload_all:
+                    self._by_telegram_id = {}
+                    self._telegram_ids = {}
+                else:
+                    for employee_id in dirty:
+                        telegram_user_id = self._telegram_ids.pop(employee_id, None)
+                        if telegram_user_id is not None:
+                            self._by_telegram_id.pop(telegram_user_id, None)
+                for employee in employees:
+                    self._by_telegram_id[employee.telegram_user_id] = employee
+                    self._telegram_ids[employee.employee_id] = employee.telegram_user_id
+
+    def invalidate(self, employee_ids: Optional[Iterable[UUID]] = None) -> None:
+        """Mark employees (or everyone) for reload on the next lookup."""
+        with self._lock:
+            if employee_ids is None:
+                self._reload_all = True
+            else:
+                self._dirty.update(employee_ids)
+
+    def __len__(self) -> int:
+        return len(self._by_telegram_id)
+
+    def _employees_changed(self, keys: Optional[Iterable[str]]) -> None:
+        self.invalidate(None if keys is None else [UUID(key) for key in keys])
+
+    def _warm(self) -> None:
+        """Reload everything in the background once notifications flow again."""
+        self.invalidate()
+        self._warming = asyncio.get_running_loop().create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        try:
+            await self.refresh()
+            logger.info("Employee directory loaded %d Telegram users", len(self))
+        except Exception:
+            logger.exception("Loading the employee directory failed; retrying on first lookup")
+
+    @staticmethod
+    def _load(employee_ids: Optional[Set[UUID]]) -> List[TelegramEmployee]:
+        with SessionLocal() as db:
+            return load_telegram_employees(db, employee_ids)
+
+    @staticmethod
+    def _lookup(telegram_user_id: int) -> Optional[TelegramEmployee]:
+        with SessionLocal() as db:
+            employee = db.scalar(select(Employee.id).where(Employee.telegram_user_id == telegram_user_id))
+            if employee is None:
+                return None
+            return load_telegram_employees(db, [employee])[0]
+
+
+# Shared by every bot handler in this worker
+employee_directory = EmployeeDirectory()
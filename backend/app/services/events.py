@@ -0,0 +1,182 @@
+"""
+Live event service.
+Every task and attendance change event is published here: the event is
+stored for replay and announced with NOTIFY in the same transaction, so
+subscribers only ever see committed changes, on every worker.
+
+Event IDs are assigned at insert, not commit, so event N can commit after
+N+1. A stream's resume cursor (the SSE event ID) is therefore the newest
+event ID it delivered plus the lower IDs it has not seen yet, e.g.
+"1042~1039,1041"; resuming replays both, so a late commit is not skipped.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.pubsub import notify
+from app.models.attendance import Attendance
+from app.models.event import Event, EventType
+from app.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "app_events"
+
+# Events buffered per subscriber before a slow client is disconnected
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Most events replayed to a resuming client
+MAX_REPLAY = 1000
+
+# How far below the newest delivered ID a cursor keeps waiting for late commits
+CURSOR_LOOKBACK = 100
+
+
+def event_message(event: Event) -> Dict[str, Any]:
+    """Wire format shared by NOTIFY payloads and replayed events."""
+    return {
+        "id": event.id,
+        "type": event.event_type.value,
+        "data": event.payload,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
+def publish_event(db: Session, event_type: EventType, data: Dict[str, Any]) -> Event:
+    """
+    Record an event and notify subscribers when the transaction commits.
+
+    Args:
+        db: Database session; the caller commits
+        event_type: Event type
+        data: JSON-serializable event data
+
+    Returns:
+        Stored event
+    """
+    event = Event(event_type=event_type, payload=jsonable_encoder(data))
+    db.add(event)
+    db.flush()
+    notify(db.connection(), EVENTS_CHANNEL, orjson.dumps(event_message(event)).decode())
+    return event
+
+
+def publish_task_event(db: Session, event_type: EventType, task: Task) -> Event:
+    """Publish a task event. The task must already be flushed."""
+    return publish_event(db, event_type, {
+        "task_id": task.id,
+        "task_number": task.task_number,
+        "title": task.title,
+        "status": task.status,
+        "priority": task.priority,
+        "assigned_to": task.assigned_to,
+        "due_date": task.due_date,
+    })
+
+
+def publish_attendance_event(db: Session, attendance: Attendance) -> Event:
+    """Publish an attendance-marked event. The record must already be flushed."""
+    return publish_event(db, EventType.ATTENDANCE_MARKED, {
+        "attendance_id": attendance.id,
+        "employee_id": attendance.employee_id,
+        "date": attendance.date,
+        "status": attendance.status,
+        "auto_marked": attendance.auto_marked,
+    })
+
+
+def replay_events(
+    db: Session, after_id: int, missing: Iterable[int] = (), limit: int = MAX_REPLAY
+) -> List[Dict[str, Any]]:
+    """Get stored events after an event ID, plus the missing lower IDs that have since committed."""
+    events = (
+        db.query(Event)
+        .filter(or_(Event.id > after_id, Event.id.in_(list(missing))))
+        .order_by(Event.id)
+        .limit(limit)
+        .all()
+    )
+    return [event_message(event) for event in events]
+
+
+class EventCursor:
+    """Position of a stream: the newest event ID delivered and the lower IDs not delivered yet."""
+
+    def __init__(self, last_id: Optional[int] = None, missing: Iterable[int] = ()) -> None:
+        self.last_id = last_id
+        self.missing = set(missing)
+
+    @classmethod
+    def parse(cls, value: str) -> "EventCursor":
+        """Parse a cursor ("1042" or "1042~1039,1041"); raises ValueError if malformed."""
+        last_id, _, missing = value.partition("~")
+        cursor = cls(int(last_id), (int(event_id) for event_id in missing.split(",") if event_id))
+        if cursor.last_id < 0 or any(event_id >= cursor.last_id for event_id in cursor.missing):
+            raise ValueError(value)
+        return cursor
+
+    def advance(self, event_id: int) -> None:
+        """Record a delivered event."""
+        if self.last_id is None:
+            self.last_id = event_id
+        elif event_id > self.last_id:
+            self.missing.update(range(max(self.last_id + 1, event_id - CURSOR_LOOKBACK), event_id))
+            self.last_id = event_id
+        self.missing.discard(event_id)
+        # IDs this far back are taken to be rolled back
+        self.missing = {missing for missing in self.missing if missing >= self.last_id - CURSOR_LOOKBACK}
+
+    def __str__(self) -> str:
+        if not self.missing:
+            return str(self.last_id)
+        return f"{self.last_id}~{','.join(map(str, sorted(self.missing)))}"
+
+
+class Subscription:
+    """A single stream client's buffered events."""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+
+class EventBroker:
+    """
+    In-process fan-out of NOTIFY payloads to stream subscribers.
+    A subscriber that falls behind is dropped rather than buffered without
+    bound; it reconnects and resumes from its last event ID.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Set[Subscription] = set()
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def dispatch(self, payload: str) -> None:
+        """Listener callback: parse once, enqueue for every subscriber."""
+        if not self._subscriptions:
+            return
+
+        message = orjson.loads(payload)
+        for subscription in list(self._subscriptions):
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self._subscriptions.discard(subscription)
+                logger.warning("Dropping slow event stream subscriber")
+
+
+# One broker per worker process, fed by the shared listener
+event_broker = EventBroker()
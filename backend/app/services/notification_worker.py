@@ -0,0 +1,120 @@
+"""
+Notification delivery worker.
+Claims batches of pending outbox rows, sends them concurrently to Telegram
+and records the outcome. Runs as its own process
+(scripts/run_notification_worker.py); any number can run side by side.
+"""
+import asyncio
+import logging
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.pubsub import pg_listener
+from app.services.notifications import (
+    NOTIFICATIONS_CHANNEL,
+    ClaimedNotification,
+    coalesce_notifications,
+    claim_notifications,
+    reclaim_stale_notifications,
+    record_sent,
+    record_failed,
+)
+from app.services.telegram_sender import TelegramSender, TelegramError
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps for rows stuck in SENDING
+RECLAIM_INTERVAL = 60
+
+
+class NotificationWorker:
+    """Outbox delivery loop."""
+
+    def __init__(self, sender: TelegramSender, batch_size: int = settings.NOTIFICATION_BATCH_SIZE) -> None:
+        self.sender = sender
+        self.batch_size = batch_size
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    def wake(self, payload: str = "") -> None:
+        """Listener callback: new notifications were committed."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Finish the current batch, then exit."""
+        self._stopping = True
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Deliver until stopped, sleeping between batches until woken or polled."""
+        pg_listener.subscribe(NOTIFICATIONS_CHANNEL, self.wake)
+        await pg_listener.start()
+        last_reclaim = 0.0
+        try:
+            while not self._stopping:
+                if time.monotonic() - last_reclaim > RECLAIM_INTERVAL:
+                    reclaimed = await run_in_threadpool(self._with_session, reclaim_stale_notifications)
+                    if reclaimed:
+                        logger.warning("Reclaimed %d stale notifications", reclaimed)
+                    last_reclaim = time.monotonic()
+
+                self._wake.clear()
+                delivered = await self.run_once()
+                if delivered < self.batch_size and not self._stopping:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=settings.NOTIFICATION_POLL_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await pg_listener.stop()
+
+    async def run_once(self) -> int:
+        """Coalesce, then claim and deliver one batch; returns the batch size."""
+        await run_in_threadpool(self._with_session, coalesce_notifications)
+        batch = await run_in_threadpool(self._with_session, claim_notifications, self.batch_size)
+        if not batch:
+            return 0
+
+        errors = await asyncio.gather(*(self.deliver(notification) for notification in batch))
+
+        sent, failures = {}, []
+        for notification, (error, permanent, message_id) in zip(batch, errors):
+            if error is None:
+                sent[notification.id] = message_id
+            else:
+                failures.append((notification, error, permanent))
+                logger.warning("Notification %s failed: %s", notification.id, error)
+
+        await run_in_threadpool(self._with_session, record_sent, sent)
+        if failures:
+            await run_in_threadpool(self._with_session, record_failed, failures)
+        return len(batch)
+
+    async def deliver(self, notification: ClaimedNotification):
+        """
+        Send one notification.
+
+        Returns:
+            (error, permanent, telegram message id)
+        """
+        if notification.chat_id is None:
+            return "Recipient has no Telegram chat", True, None
+
+        try:
+            result = await self.sender.send_message(
+                notification.chat_id, notification.message, notification.reply_markup
+            )
+        except TelegramError as exc:
+            return exc.description, exc.permanent, None
+        return None, False, result.get("message_id")
+
+    @staticmethod
+    def _with_session(func, *args):
+        db = SessionLocal()
+        try:
+            return func(db, *args)
+        finally:
+            db.close()
@@ -0,0 +1,509 @@
+"""
+Notification outbox service.
+Request handlers enqueue Telegram messages as Notification rows in their own
+transaction; the notification worker claims and delivers them afterwards, so
+API latency never depends on Telegram.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.callback_data import CallbackAction, encode_callback
+from app.core.config import settings
+from app.core.invalidation import publish_invalidation
+from app.core.pubsub import notify
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+from app.models.notification import Notification, NotificationType, NotificationStatus
+from app.models.resource_version import Resource
+from app.models.task import OPEN_STATUSES, Task, TaskPriority
+from app.services.resource_versions import bump_resource_versions
+
+# Woken worker claims new rows right away instead of waiting for its next poll
+NOTIFICATIONS_CHANNEL = "notifications"
+
+# Per-employee task messages that are held briefly and merged into one digest
+COALESCED_TYPES = (NotificationType.TASK_ASSIGNED, NotificationType.TASK_OVERDUE)
+
+# Attendance that counts as checked in for task delivery
+CHECKED_IN_STATUSES = (AttendanceStatus.PRESENT, AttendanceStatus.HALF_DAY)
+
+# Tasks per digest message; keeps text and keyboard well inside Telegram's limits
+MAX_DIGEST_TASKS = 20
+
+PRIORITY_ICONS = {
+    TaskPriority.LOW: "🟢",
+    TaskPriority.MEDIUM: "🟡",
+    TaskPriority.HIGH: "🔴",
+    TaskPriority.URGENT: "🚨",
+}
+
+
+def enqueue_notification(
+    db: Session,
+    notification_type: NotificationType,
+    message: str,
+    recipient_employee_id: Optional[UUID] = None,
+    task_id: Optional[UUID] = None,
+    reply_markup: Optional[Dict[str, Any]] = None,
+) -> Notification:
+    """
+    Add a message to the outbox in the caller's transaction.
+
+    Args:
+        db: Database session; the caller commits
+        notification_type: Notification type
+        message: Message text
+        recipient_employee_id: Employee to message; None messages the owner
+        task_id: Task the message is about, if any
+        reply_markup: Telegram inline keyboard
+
+    Returns:
+        Pending notification
+    """
+    available_at = datetime.utcnow()
+    status = NotificationStatus.PENDING
+    if notification_type in COALESCED_TYPES and recipient_employee_id:
+        # Give the rest of a burst time to arrive so it can go out as one digest
+        available_at += timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW)
+        if settings.NOTIFICATION_DEFER_UNTIL_CHECK_IN and not is_checked_in(db, recipient_employee_id):
+            status = NotificationStatus.DEFERRED
+
+    notification = Notification(
+        notification_type=notification_type,
+        recipient_employee_id=recipient_employee_id,
+        task_id=task_id,
+        message=message,
+        reply_markup=reply_markup,
+        status=status,
+        available_at=available_at,
+    )
+    db.add(notification)
+    if status == NotificationStatus.PENDING:
+        notify(db.connection(), NOTIFICATIONS_CHANNEL, "")
+    return notification
+
+
+def is_checked_in(db: Session, employee_id: UUID) -> bool:
+    """Whether the employee has marked themselves present today."""
+    return db.query(
+        db.query(Attendance)
+        .filter(
+            Attendance.employee_id == employee_id,
+            Attendance.date == date.today(),
+            Attendance.status.in_(CHECKED_IN_STATUSES),
+        )
+        .exists()
+    ).scalar()
+
+
+def cancel_stale_notifications(db: Session, *criteria) -> int:
+    """
+    Cancel undelivered task messages whose task is no longer open and
+    assigned to the recipient: completed, cancelled, archived, deleted or
+    reassigned since the message was queued. Rows another worker holds are
+    skipped. Runs in the caller's transaction.
+
+    Args:
+        db: Database session; the caller commits
+        criteria: Extra conditions on the notifications to check
+
+    Returns:
+        Number of notifications cancelled
+    """
+    still_open = exists().where(
+        Task.id == Notification.task_id,
+        Task.assigned_to == Notification.recipient_employee_id,
+        Task.status.in_(OPEN_STATUSES),
+    )
+    stale = (
+        select(Notification.id)
+        .where(
+            Notification.status.in_((NotificationStatus.PENDING, NotificationStatus.DEFERRED)),
+            Notification.notification_type.in_(COALESCED_TYPES),
+            Notification.recipient_employee_id.isnot(None),
+            ~still_open,
+            *criteria,
+        )
+        .with_for_update(skip_locked=True)
+    )
+    result = db.execute(
+        update(Notification)
+        .where(Notification.id.in_(stale.scalar_subquery()))
+        .values(status=NotificationStatus.CANCELLED)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def release_deferred_notifications(db: Session, employee_id: UUID) -> int:
+    """
+    Queue everything held for an employee, in the caller's transaction.
+    Call when they check in; the released messages go out as one digest.
+    Messages about tasks that were closed or reassigned meanwhile are
+    cancelled instead.
+
+    Returns:
+        Number of notifications released
+    """
+    cancel_stale_notifications(
+        db,
+        Notification.recipient_employee_id == employee_id,
+        Notification.status == NotificationStatus.DEFERRED,
+    )
+    result = db.execute(
+        update(Notification)
+        .where(
+            Notification.recipient_employee_id == employee_id,
+            Notification.status == NotificationStatus.DEFERRED,
+        )
+        .values(status=NotificationStatus.PENDING, available_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        notify(db.connection(), NOTIFICATIONS_CHANNEL, "")
+    return result.rowcount
+
+
+def release_on_check_in(db: Session, attendance: Attendance) -> int:
+    """Release held notifications if this record checks the employee in today."""
+    if attendance.date != date.today() or attendance.status not in CHECKED_IN_STATUSES:
+        return 0
+    return release_deferred_notifications(db, attendance.employee_id)
+
+
+def format_due(task: Task) -> str:
+    """Format a task's due date and time, e.g. 'Nov 04, 2024 6:00 PM'."""
+    due = task.due_date.strftime("%b %d, %Y")
+    if task.due_time:
+        due += " " + task.due_time.strftime("%I:%M %p").lstrip("0")
+    return due
+
+
+def task_message(task: Task) -> str:
+    """Task assignment message body."""
+    icon = PRIORITY_ICONS.get(task.priority, "")
+    return (
+        f"📋 Task #{task.task_number}\n\n"
+        f"🎯 {task.title}\n"
+        f"⏰ Due: {format_due(task)}\n"
+        f"{icon} Priority: {task.priority.value.title()}"
+    )
+
+
+def task_buttons(task: Task) -> List[List[Dict[str, str]]]:
+    """Inline keyboard rows for acting on a task."""
+    return [
+        [
+            {"text": "▶️ Start", "callback_data": encode_callback(CallbackAction.START, task.id)},
+            {"text": "✅ Done", "callback_data": encode_callback(CallbackAction.DONE, task.id)},
+        ],
+        [{"text": "⚠️ Report Issue", "callback_data": encode_callback(CallbackAction.ISSUE, task.id)}],
+    ]
+
+
+def notify_task_assigned(db: Session, task: Task) -> Notification:
+    """Queue the assignment message for the task's employee."""
+    return enqueue_notification(
+        db,
+        NotificationType.TASK_ASSIGNED,
+        task_message(task),
+        recipient_employee_id=task.assigned_to,
+        task_id=task.id,
+        reply_markup={"inline_keyboard": task_buttons(task)},
+    )
+
+
+def notify_task_overdue(db: Session, task: Task) -> Notification:
+    """Queue an overdue reminder for the task's employee."""
+    return enqueue_notification(
+        db,
+        NotificationType.TASK_OVERDUE,
+        f"⏰ Overdue\n\n{task_message(task)}",
+        recipient_employee_id=task.assigned_to,
+        task_id=task.id,
+        reply_markup={"inline_keyboard": task_buttons(task)},
+    )
+
+
+def notify_task_completed(db: Session, task: Task) -> Notification:
+    """Queue a completion message for the owner."""
+    return enqueue_notification(
+        db,
+        NotificationType.TASK_COMPLETED,
+        f"✅ Task #{task.task_number} completed\n\n🎯 {task.title}",
+        task_id=task.id,
+    )
+
+
+def notify_issue_reported(db: Session, task: Task, subtask: Task, employee_name: str, description: str) -> Notification:
+    """Queue a message telling the owner an employee is blocked."""
+    return enqueue_notification(
+        db,
+        NotificationType.SUBTASK_CREATED,
+        f"⚠️ Issue on Task #{task.task_number}\n\n"
+        f"🎯 {task.title}\n"
+        f"👤 {employee_name}\n\n"
+        f"{description}\n\n"
+        f"📌 Subtask #{subtask.task_number} created",
+        task_id=subtask.id,
+    )
+
+
+def digest_message(assigned: List[Task], overdue: List[Task]) -> str:
+    """Digest text listing new and overdue tasks."""
+    sections = []
+    for heading, tasks in (("📋 New tasks", assigned), ("⏰ Overdue tasks", overdue)):
+        if tasks:
+            lines = [f"{heading} ({len(tasks)})", ""]
+            for task in tasks:
+                icon = PRIORITY_ICONS.get(task.priority, "")
+                lines.append(f"{icon} #{task.task_number} {task.title}\n    Due: {format_due(task)}")
+            sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def digest_buttons(tasks: List[Task]) -> List[List[Dict[str, str]]]:
+    """One keyboard row per task: start, done, report issue."""
+    return [
+        [
+            {"text": f"▶️ {task.task_number}", "callback_data": encode_callback(CallbackAction.START, task.id)},
+            {"text": "✅ Done", "callback_data": encode_callback(CallbackAction.DONE, task.id)},
+            {"text": "⚠️ Issue", "callback_data": encode_callback(CallbackAction.ISSUE, task.id)},
+        ]
+        for task in tasks
+    ]
+
+
+def coalesce_notifications(db: Session) -> int:
+    """
+    Merge each employee's pending task messages into digests.
+    Runs when an employee's oldest held message is due, taking every pending
+    sibling with it; single messages are left to go out as they are.
+    Held and deferred messages about tasks that were closed or reassigned
+    are cancelled first, so deferred rows don't outlive their tasks.
+
+    Returns:
+        Number of digests created
+    """
+    cancel_stale_notifications(db)
+
+    now = datetime.utcnow()
+    due_recipients = (
+        select(Notification.recipient_employee_id)
+        .where(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.notification_type.in_(COALESCED_TYPES),
+            Notification.recipient_employee_id.isnot(None),
+            Notification.available_at <= now,
+        )
+    )
+    rows = db.execute(
+        select(Notification.id, Notification.recipient_employee_id, Notification.notification_type, Task)
+        .join(Task, Task.id == Notification.task_id)
+        .where(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.notification_type.in_(COALESCED_TYPES),
+            Notification.recipient_employee_id.in_(due_recipients),
+        )
+        .order_by(Notification.created_at)
+        .with_for_update(of=Notification, skip_locked=True)
+    ).all()
+
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row.recipient_employee_id].append(row)
+
+    digests = 0
+    for recipient_id, group in groups.items():
+        if len(group) < 2:
+            continue
+        for start in range(0, len(group), MAX_DIGEST_TASKS):
+            chunk = group[start:start + MAX_DIGEST_TASKS]
+            assigned = [row.Task for row in chunk if row.notification_type == NotificationType.TASK_ASSIGNED]
+            overdue = [row.Task for row in chunk if row.notification_type == NotificationType.TASK_OVERDUE]
+            digest = Notification(
+                notification_type=NotificationType.TASK_DIGEST,
+                recipient_employee_id=recipient_id,
+                message=digest_message(assigned, overdue),
+                reply_markup={"inline_keyboard": digest_buttons([row.Task for row in chunk])},
+                status=NotificationStatus.PENDING,
+                available_at=now,
+            )
+            db.add(digest)
+            db.flush()
+            db.execute(
+                update(Notification)
+                .where(Notification.id.in_([row.id for row in chunk]))
+                .values(status=NotificationStatus.COALESCED, digest_id=digest.id)
+                .execution_options(synchronize_session=False)
+            )
+            digests += 1
+
+    db.commit()
+    return digests
+
+
+@dataclass
+class ClaimedNotification:
+    """A notification claimed for delivery by one worker."""
+    id: UUID
+    notification_type: NotificationType
+    chat_id: Optional[int]
+    message: str
+    reply_markup: Optional[Dict[str, Any]]
+    task_id: Optional[UUID]
+    attempts: int
+
+
+def claim_notifications(db: Session, limit: int) -> List[ClaimedNotification]:
+    """
+    Claim a batch of due notifications and commit the claim.
+    SKIP LOCKED lets any number of workers claim concurrently without
+    blocking each other or sending the same row twice.
+    """
+    now = datetime.utcnow()
+    due = (
+        select(Notification.id)
+        .where(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.available_at <= now,
+        )
+        .order_by(Notification.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = db.execute(
+        update(Notification)
+        .where(Notification.id.in_(due.scalar_subquery()))
+        .values(
+            status=NotificationStatus.SENDING,
+            claimed_at=now,
+            attempts=Notification.attempts + 1,
+        )
+        .returning(
+            Notification.id,
+            Notification.notification_type,
+            Notification.recipient_employee_id,
+            Notification.message,
+            Notification.reply_markup,
+            Notification.task_id,
+            Notification.attempts,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    employee_ids = {row.recipient_employee_id for row in rows if row.recipient_employee_id}
+    chats = {}
+    if employee_ids:
+        chats = dict(db.execute(
+            select(Employee.id, Employee.telegram_user_id).where(Employee.id.in_(employee_ids))
+        ).all())
+    db.commit()
+
+    owner_chat = int(settings.TELEGRAM_OWNER_CHAT_ID)
+    return [
+        ClaimedNotification(
+            id=row.id,
+            notification_type=row.notification_type,
+            chat_id=chats.get(row.recipient_employee_id) if row.recipient_employee_id else owner_chat,
+            message=row.message,
+            reply_markup=row.reply_markup,
+            task_id=row.task_id,
+            attempts=row.attempts,
+        )
+        for row in rows
+    ]
+
+
+def reclaim_stale_notifications(db: Session) -> int:
+    """
+    Return notifications stuck in SENDING (e.g. a worker crashed) to the queue.
+    Delivery is therefore at-least-once.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.NOTIFICATION_CLAIM_TIMEOUT)
+    result = db.execute(
+        update(Notification)
+        .where(
+            Notification.status == NotificationStatus.SENDING,
+            Notification.claimed_at < cutoff,
+        )
+        .values(status=NotificationStatus.PENDING, available_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def record_sent(db: Session, sent: Dict[UUID, Optional[int]]) -> None:
+    """
+    Mark notifications as sent.
+
+    Args:
+        db: Database session
+        sent: Telegram message ID of each sent notification
+    """
+    if not sent:
+        return
+
+    db.execute(
+        update(Notification)
+        .where(Notification.id.in_(list(sent)))
+        .values(status=NotificationStatus.SENT, sent_at=datetime.utcnow(), last_error=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Remember which message assigned each task (directly or via a digest),
+    # so later bot replies can reference it. The bulk update matches on the
+    # whole primary key of the partitioned tasks table, due_date included.
+    assignments = db.execute(
+        select(Notification.id, Notification.digest_id, Notification.task_id, Task.due_date)
+        .join(Task, Task.id == Notification.task_id)
+        .where(
+            or_(Notification.id.in_(list(sent)), Notification.digest_id.in_(list(sent))),
+            Notification.notification_type == NotificationType.TASK_ASSIGNED,
+            Notification.task_id.isnot(None),
+        )
+    ).all()
+    updates = [
+        {"id": row.task_id, "due_date": row.due_date, "telegram_message_id": sent[row.digest_id or row.id]}
+        for row in assignments
+        if sent[row.digest_id or row.id] is not None
+    ]
+    if updates:
+        db.execute(update(Task), updates)
+        bump_resource_versions(db, [Resource.TASKS])
+        publish_invalidation(db, "tasks", [str(item["id"]) for item in updates])
+
+    db.commit()
+
+
+def record_failed(db: Session, failures: Iterable[tuple]) -> None:
+    """
+    Reschedule or give up on failed deliveries.
+
+    Args:
+        db: Database session
+        failures: (claimed notification, error message, permanent) tuples
+    """
+    now = datetime.utcnow()
+    for notification, error, permanent in failures:
+        if permanent or notification.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+            values = {"status": NotificationStatus.FAILED}
+        else:
+            # Exponential backoff: 30s, 60s, 120s, ...
+            delay = timedelta(seconds=30 * 2 ** (notification.attempts - 1))
+            values = {"status": NotificationStatus.PENDING, "available_at": now + delay}
+
+        db.execute(
+            update(Notification)
+            .where(Notification.id == notification.id)
+            .values(last_error=error[:1000], **values)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
@@ -0,0 +1,230 @@
+"""
+Columnar export of historical data to Parquet.
+Each exported table is written as one Parquet file per calendar month,
+Hive-style (<table>/month=YYYY-MM/part-0.parquet), so BI tools can prune
+by month. Rows are streamed from a server-side cursor in batches that
+become Arrow record batches, so memory stays bounded by the batch size.
+
+A partition is written to a temporary file and renamed when complete. A
+re-run skips closed months whose file already exists and rewrites the
+current month, so an interrupted export resumes where it stopped.
+
+Archived tasks and comments (app.services.archive) are exported with the
+live ones, so a month reads the same before and after archival.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Enum, Integer, Table, Text, Time, cast, func, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.archive import ArchivedTask, ArchivedTaskComment
+from app.models.attendance import Attendance
+from app.models.notification import Notification
+from app.models.task import Task, TaskComment
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only the export needs it
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+PARTITION_FILE = "part-0.parquet"
+
+# Exported table -> column its rows are partitioned by month on
+EXPORT_TABLES = {
+    "tasks": Task.__table__.c.due_date,
+    "task_comments": TaskComment.__table__.c.created_at,
+    "attendance": Attendance.__table__.c.date,
+    "notifications": Notification.__table__.c.created_at,
+}
+
+# Exported table -> archive table holding its older rows
+ARCHIVE_TABLES = {
+    "tasks": ArchivedTask.__table__,
+    "task_comments": ArchivedTaskComment.__table__,
+}
+
+
+@dataclass(frozen=True)
+class PartitionResult:
+    """Outcome of exporting one month of a table."""
+    table: str
+    month: str
+    rows: int
+    skipped: bool
+    path: str
+
+
+def export_available() -> bool:
+    """Whether pyarrow is installed."""
+    return pa is not None
+
+
+def export_parquet(
+    db: Session,
+    tables: Optional[Iterable[str]] = None,
+    target_dir: Optional[str] = None,
+    force: bool = False,
+    batch_size: Optional[int] = None,
+    on_partition: Optional[Callable[[PartitionResult], None]] = None,
+) -> List[PartitionResult]:
+    """
+    Export tables to monthly Parquet partitions.
+
+    Args:
+        db: Database session
+        tables: Tables to export (default all of EXPORT_TABLES)
+        target_dir: Output directory (default settings.EXPORT_DIR)
+        force: Rewrite closed months that were already exported
+        batch_size: Rows per record batch (default settings.EXPORT_BATCH_SIZE)
+        on_partition: Called after each partition, e.g. to report progress
+
+    Returns:
+        One result per month of each table
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is not installed")
+    target = Path(target_dir or settings.EXPORT_DIR)
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    current_month = date.today().replace(day=1)
+
+    results = []
+    for name in tables or EXPORT_TABLES:
+        column = EXPORT_TABLES[name]
+        archive = ARCHIVE_TABLES.get(name)
+        for month in _months(db, column, archive):
+            path = target / name / f"month={month:%Y-%m}" / PARTITION_FILE
+            if month < current_month and path.exists() and not force:
+                result = PartitionResult(name, f"{month:%Y-%m}", 0, True, str(path))
+            else:
+                rows = _write_partition(db, column, archive, month, path, batch_size)
+                result = PartitionResult(name, f"{month:%Y-%m}", rows, False, str(path))
+            results.append(result)
+            if on_partition is not None:
+                on_partition(result)
+    return results
+
+
+def list_partitions(target_dir: Optional[str] = None) -> Dict[str, List[str]]:
+    """Exported months per table."""
+    target = Path(target_dir or settings.EXPORT_DIR)
+    return {
+        name: sorted(path.parent.name.split("=", 1)[1] for path in (target / name).glob(f"month=*/{PARTITION_FILE}"))
+        for name in EXPORT_TABLES
+    }
+
+
+def arrow_schema(table: Table):
+    """Arrow schema for a table's columns."""
+    return pa.schema([pa.field(column.name, _arrow_type(column), nullable=column.nullable) for column in table.columns])
+
+
+def _arrow_type(column):
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, BigInteger):
+        return pa.int64()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Time):
+        return pa.time64("us")
+    # Enum values, UUIDs, text and JSON (as text)
+    return pa.string()
+
+
+def _selected(column):
+    """Select UUIDs and JSON as text, skipping the round trip through Python objects."""
+    if isinstance(column.type, (UUID, JSONB)):
+        return cast(column, Text).label(column.name)
+    return column
+
+
+def _converter(column) -> Optional[Callable[[Any], Any]]:
+    """Per-value conversion for columns Arrow cannot take as returned."""
+    if isinstance(column.type, Enum):
+        return lambda value: value.value if value is not None else None
+    return None
+
+
+def _months(db: Session, column, archive: Optional[Table] = None) -> List[date]:
+    """First day of every month between the column's oldest and newest value, archive included."""
+    bounds = [db.execute(select(func.min(column), func.max(column))).one()]
+    if archive is not None:
+        archived = archive.c[column.name]
+        bounds.append(db.execute(select(func.min(archived), func.max(archived))).one())
+    bounds = [bound for bound in bounds if bound[0] is not None]
+    if not bounds:
+        return []
+    first, last = min(bound[0] for bound in bounds), max(bound[1] for bound in bounds)
+    month, last_month = _month_of(first), _month_of(last)
+    months = []
+    while month <= last_month:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def _write_partition(
+    db: Session,
+    column,
+    archive: Optional[Table],
+    month: date,
+    path: Path,
+    batch_size: int,
+) -> int:
+    """Stream one month of rows (then its archived rows) into a Parquet file; returns the row count."""
+    table = column.table
+    schema = arrow_schema(table)
+    converters = [_converter(table_column) for table_column in table.columns]
+    end = _next_month(month)
+    if isinstance(column.type, DateTime):
+        month, end = datetime.combine(month, datetime.min.time()), datetime.combine(end, datetime.min.time())
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    rows = 0
+    with pq.ParquetWriter(temporary, schema, compression="zstd") as writer:
+        for source in (table, archive):
+            if source is None:
+                continue
+            # Archive tables have the exported table's columns, plus bookkeeping ones left out
+            source_column = source.c[column.name]
+            stmt = (
+                select(*(_selected(source.c[table_column.name]) for table_column in table.columns))
+                .where(source_column >= month, source_column < end)
+                .order_by(source_column)
+                .execution_options(yield_per=batch_size)
+            )
+            for partition in db.execute(stmt).partitions():
+                values = list(zip(*partition))
+                arrays = [
+                    pa.array(column_values if convert is None else [convert(value) for value in column_values], type=field.type)
+                    for column_values, convert, field in zip(values, converters, schema)
+                ]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                rows += len(partition)
+    os.replace(temporary, path)
+    logger.info("Exported %d %s rows to %s", rows, table.name, path)
+    return rows
+
+
+def _month_of(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
@@ -0,0 +1,107 @@
+"""
+Monthly range partitions of tasks (by due_date) and attendance (by date).
+Each table has one partition per month, <table>_pYYYY_MM, and a
+<table>_default partition for rows outside them. Queries filtering on the
+partition column only scan the months they ask for, so "today" and "this
+week" touch one small partition however much history there is.
+
+ensure_partitions runs daily (scripts/run_report_scheduler.py) to create
+the coming months before rows arrive, and moves any month that landed in
+the default partition (a far-off due date, say) into its own partition.
+"""
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+from app.models.attendance import Attendance
+from app.models.task import Task
+
+# Partitioned table -> partition column
+PARTITIONED_TABLES: Dict[str, str] = {
+    Task.__tablename__: Task.due_date.key,
+    Attendance.__tablename__: Attendance.date.key,
+}
+
+LOCK_TIMEOUT = 10  # Seconds
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def ensure_partitions(connection: Connection, months_ahead: Optional[int] = None) -> List[str]:
+    """
+    Create monthly partitions from this month to months_ahead ahead, plus
+    any month that has rows in a default partition.
+
+    Args:
+        connection: Connection in the caller's transaction
+        months_ahead: Months to create ahead (default settings.PARTITION_MONTHS_AHEAD)
+
+    Returns:
+        Names of the partitions created
+    """
+    if months_ahead is None:
+        months_ahead = settings.PARTITION_MONTHS_AHEAD
+    month = date.today().replace(day=1)
+    upcoming = [month]
+    for _ in range(months_ahead):
+        upcoming.append(_next_month(upcoming[-1]))
+
+    # Attaching waits for readers of the default partition, and queries queue
+    # behind it meanwhile; give up rather than stall, the next run retries
+    connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}s'"))
+
+    created = []
+    for table, column in PARTITIONED_TABLES.items():
+        default = default_partition_name(table)
+        existing = set(connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits"
+                " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+                " WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": table},
+        ).scalars())
+        # Keep rows out of the default partition while its months are split off
+        connection.execute(text(f"LOCK TABLE {default} IN EXCLUSIVE MODE"))
+        stray = connection.execute(
+            text(f"SELECT DISTINCT CAST(date_trunc('month', {column}) AS date) FROM {default}")
+        ).scalars().all()
+
+        for month in sorted({*upcoming, *stray}):
+            name = partition_name(table, month)
+            if name not in existing:
+                _create_partition(connection, table, column, month)
+                created.append(name)
+    return created
+
+
+def _create_partition(connection: Connection, table: str, column: str, month: date) -> None:
+    """Create a month's partition, moving its rows out of the default partition."""
+    name = partition_name(table, month)
+    end = _next_month(month)
+    connection.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default_partition_name(table)}"
+            f" WHERE {column} >= :start AND {column} < :end RETURNING *)"
+            f" INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start": month, "end": end},
+    )
+    # Attaching adds the parent's indexes and foreign keys to the partition
+    connection.execute(text(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
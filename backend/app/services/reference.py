@@ -0,0 +1,93 @@
+"""
+Reference data versioning service.
+Records a new version for every employee, label and routine change so
+clients can sync the reference set incrementally.
+"""
+from datetime import datetime
+from typing import Dict, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee, EmployeeLabel
+from app.models.routine import Routine
+from app.models.reference import ReferenceVersion, ReferenceEntity, reference_version_seq
+
+# Advisory lock serializing reference writers so versions commit in order
+REFERENCE_LOCK_KEY = 7_260_260
+
+TRACKED_MODELS = {
+    Employee: ReferenceEntity.EMPLOYEE,
+    EmployeeLabel: ReferenceEntity.LABEL,
+    Routine: ReferenceEntity.ROUTINE,
+}
+
+_PENDING_KEY = "reference_changes"
+
+
+def current_reference_version(db: Session) -> int:
+    """Get the latest committed reference version (0 if nothing tracked yet)."""
+    return db.query(func.coalesce(func.max(ReferenceVersion.version), 0)).scalar()
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_reference_changes(session: Session, flush_context, instances) -> None:
+    """Collect changed reference objects before they are flushed."""
+    pending = session.info.setdefault(_PENDING_KEY, [])
+
+    for obj in session.new:
+        if type(obj) in TRACKED_MODELS:
+            pending.append((obj, False))
+
+    for obj in session.dirty:
+        if type(obj) in TRACKED_MODELS and session.is_modified(obj):
+            pending.append((obj, False))
+
+    for obj in session.deleted:
+        if type(obj) in TRACKED_MODELS:
+            pending.append((obj, True))
+            # Deleting a label silently changes the label list of its holders
+            if isinstance(obj, EmployeeLabel):
+                pending.extend((employee, False) for employee in obj.employees)
+                pending.extend((routine, False) for routine in obj.routines)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_reference_changes(session: Session, flush_context) -> None:
+    """Write one new version per changed reference entity in the flushing transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    changes: Dict[Tuple[ReferenceEntity, UUID], bool] = {}
+    for obj, is_deleted in pending:
+        key = (TRACKED_MODELS[type(obj)], obj.id)
+        changes[key] = changes.get(key, False) or is_deleted
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "version": reference_version_seq.next_value(),
+            "is_deleted": is_deleted,
+            "changed_at": now,
+        }
+        for (entity_type, entity_id), is_deleted in changes.items()
+    ]
+
+    stmt = insert(ReferenceVersion).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReferenceVersion.entity_type, ReferenceVersion.entity_id],
+        set_={
+            "version": reference_version_seq.next_value(),
+            "is_deleted": stmt.excluded.is_deleted,
+            "changed_at": stmt.excluded.changed_at,
+        },
+    )
+
+    connection = session.connection()
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": REFERENCE_LOCK_KEY})
+    connection.execute(stmt)
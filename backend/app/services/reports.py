@@ -0,0 +1,357 @@
+"""
+Owner daily report service.
+Builds the day's report payload from a fixed set of aggregate queries
+(attendance roster, task status counts, tasks needing attention, top
+performers), renders the morning, midday and end-of-day Telegram messages
+from it, and caches both until a relevant change commits. The dashboard's
+/api/reports/daily endpoint and the scheduled Telegram pushes share the
+cached payload.
+"""
+import enum
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, literal_column, or_, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.core.etag import content_etag
+from app.core.invalidation import LocalCache
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee, EmployeeLabel, employee_label_assignments
+from app.models.notification import Notification, NotificationType
+from app.models.task import OPEN_STATUSES, CommentType, Task, TaskComment, TaskStatus
+from app.services.archive import task_history
+from app.services.notifications import enqueue_notification
+
+
+class ReportKind(str, enum.Enum):
+    """Scheduled owner report."""
+    ATTENDANCE = "attendance"
+    MIDDAY = "midday"
+    END_OF_DAY = "end_of_day"
+
+
+# Most tasks listed per section; counts always cover everything
+MAX_LISTED_TASKS = 20
+
+TOP_PERFORMERS = 3
+
+# (etag, payload) per day, evicted by any change the report shows
+REPORT_CACHE = LocalCache(
+    "daily-reports",
+    watches=["tasks", "comments", "attendance", "employees", "labels"],
+)
+
+SEPARATOR = "━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# Message templates, filled from the report payload
+ATTENDANCE_TEMPLATE = (
+    "📊 Attendance Report - {date}\n\n"
+    "✅ Present: {present}\n"
+    "❌ Absent: {absent}\n"
+    "🕐 Half Day: {half_day}\n"
+    "🏖️ Leave: {leave}\n"
+    "❔ Not marked: {not_marked}"
+)
+MIDDAY_TEMPLATE = (
+    "📊 Midday Progress - {date}\n\n"
+    "Tasks Status:\n"
+    "✅ Completed: {completed}\n"
+    "⏳ In Progress: {in_progress}\n"
+    "⏰ Overdue: {overdue}\n"
+    "📋 Pending: {pending}"
+)
+END_OF_DAY_TEMPLATE = (
+    "📊 End of Day Report - {date}\n\n"
+    "Today's Summary:\n"
+    "✅ Completed: {completed} ({completed_pct}%)\n"
+    "⏰ Overdue: {overdue} ({overdue_pct}%)\n"
+    "❌ Incomplete: {incomplete} ({incomplete_pct}%)"
+)
+EMPLOYEE_LINE = "• {name}{labels}"
+TASK_LINE = "{index}. #{task_number} - {title} ({employee}){due}"
+MEDALS = ("🥇", "🥈", "🥉")
+PERFORMER_LINE = "{medal} {name} - {completed}/{total} tasks completed"
+
+
+def get_daily_report(db: Session, day: date) -> Tuple[str, Dict[str, Any]]:
+    """
+    Get a day's report payload and its ETag, from cache when possible.
+
+    Returns:
+        (etag, payload) where payload includes the rendered messages
+    """
+    cached = REPORT_CACHE.get(day)
+    if cached is None:
+        generation = REPORT_CACHE.generation
+        payload = build_daily_report(db, day)
+        # Tagged by content: the report also renders labels, which have no version
+        cached = content_etag(payload), payload
+        REPORT_CACHE.put(day, cached, generation)
+    return cached
+
+
+def build_daily_report(db: Session, day: date) -> Dict[str, Any]:
+    """Run the report queries for a day and render its messages."""
+    payload = {
+        "date": day.isoformat(),
+        "attendance": _attendance_section(db, day),
+        **_task_sections(db, day),
+        "top_performers": _top_performers(db, day),
+    }
+    payload["messages"] = {
+        ReportKind.ATTENDANCE.value: render_attendance(payload),
+        ReportKind.MIDDAY.value: render_midday(payload),
+        ReportKind.END_OF_DAY.value: render_end_of_day(payload),
+    }
+    return payload
+
+
+def send_daily_report(db: Session, kind: ReportKind, day: Optional[date] = None) -> Notification:
+    """Queue a report for the owner's Telegram chat; the caller commits."""
+    _, payload = get_daily_report(db, day or date.today())
+    reply_markup = None
+    if settings.DASHBOARD_URL:
+        reply_markup = {"inline_keyboard": [[{"text": "📈 View Dashboard", "url": settings.DASHBOARD_URL}]]}
+    return enqueue_notification(
+        db,
+        NotificationType.DAILY_REPORT,
+        payload["messages"][kind.value],
+        reply_markup=reply_markup,
+    )
+
+
+def _attendance_section(db: Session, day: date) -> Dict[str, Any]:
+    """Active employees with their labels and the day's attendance (1 query)."""
+    labels = (
+        select(func.string_agg(EmployeeLabel.name, aggregate_order_by(literal_column("', '"), EmployeeLabel.name)))
+        .select_from(employee_label_assignments.join(EmployeeLabel))
+        .where(employee_label_assignments.c.employee_id == Employee.id)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(Employee.id, Employee.name, labels.label("labels"), Attendance.status)
+        .outerjoin(Attendance, and_(Attendance.employee_id == Employee.id, Attendance.date == day))
+        .where(Employee.is_active == True)
+        .order_by(Employee.name)
+    ).all()
+
+    groups: Dict[str, List[Dict[str, Any]]] = {"present": [], "absent": [], "half_day": [], "leave": [], "not_marked": []}
+    for row in rows:
+        key = row.status.value if row.status is not None else "not_marked"
+        groups[key].append({"id": str(row.id), "name": row.name, "labels": row.labels})
+
+    return {
+        "total_employees": len(rows),
+        **{status: len(employees) for status, employees in groups.items()},
+        "present_employees": groups["present"] + groups["half_day"],
+        "absent_employees": groups["absent"],
+        "not_marked_employees": groups["not_marked"],
+    }
+
+
+def _scope(tasks, day: date):
+    """Open, due that day, overdue, and in the day's scope: conditions on Task or task_history() columns."""
+    is_open = tasks.status.in_(OPEN_STATUSES)
+    due_today = tasks.due_date == day
+    is_overdue = and_(is_open, or_(tasks.status == TaskStatus.OVERDUE, tasks.due_date < day))
+    in_scope = and_(tasks.is_subtask == False, or_(due_today, and_(tasks.due_date < day, is_open)))
+    return is_open, due_today, is_overdue, in_scope
+
+
+def _task_sections(db: Session, day: date) -> Dict[str, Any]:
+    """
+    Status counts (1 query) and the overdue and in-progress lists (1 query).
+    The day's scope is its top-level tasks plus open tasks carried over
+    from earlier days. Only the counts can include archived tasks, which
+    are all completed.
+    """
+    tasks = task_history(db, day, day).tasks.c
+    _, due_today, is_overdue, in_scope = _scope(tasks, day)
+    counts = db.execute(
+        select(
+            func.count().label("total"),
+            func.count().filter(tasks.status == TaskStatus.COMPLETED).label("completed"),
+            func.count().filter(tasks.status == TaskStatus.IN_PROGRESS).label("in_progress"),
+            func.count().filter(tasks.status == TaskStatus.BLOCKED).label("blocked"),
+            func.count().filter(
+                tasks.status.in_((TaskStatus.PENDING, TaskStatus.ASSIGNED)), due_today
+            ).label("pending"),
+            func.count().filter(is_overdue).label("overdue"),
+        ).where(in_scope)
+    ).one()
+
+    _, _, is_overdue, in_scope = _scope(Task, day)
+
+    # Latest comment explains why a task is stuck; an open subtask means it is blocked on the owner
+    comment = (
+        select(TaskComment.comment_text, TaskComment.comment_type)
+        .where(TaskComment.task_id == Task.id)
+        .order_by(TaskComment.created_at.desc())
+        .limit(1)
+        .lateral()
+    )
+    subtask = aliased(Task)
+    open_subtask = (
+        select(subtask.task_number)
+        .where(subtask.parent_task_id == Task.id, subtask.status != TaskStatus.COMPLETED)
+        .order_by(subtask.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            Task.id,
+            Task.task_number,
+            Task.title,
+            Task.status,
+            Task.due_date,
+            Task.due_time,
+            Employee.name.label("employee"),
+            comment.c.comment_text,
+            comment.c.comment_type,
+            open_subtask.label("subtask_number"),
+            is_overdue.label("overdue"),
+        )
+        .outerjoin(Employee, Employee.id == Task.assigned_to)
+        .outerjoin(comment, true())
+        .where(in_scope, or_(is_overdue, Task.status.in_((TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED))))
+        .order_by(Task.due_date, Task.due_time.nulls_last(), Task.task_number)
+    ).all()
+
+    overdue, in_progress = [], []
+    for row in rows:
+        item = {
+            "id": str(row.id),
+            "task_number": row.task_number,
+            "title": row.title,
+            "status": row.status.value,
+            "employee": row.employee,
+            "due_date": row.due_date.isoformat(),
+            "due_time": row.due_time.isoformat() if row.due_time else None,
+            "comment": row.comment_text,
+            "issue_reported": row.comment_type == CommentType.ISSUE_REPORT,
+            "subtask_number": row.subtask_number,
+        }
+        (overdue if row.overdue else in_progress).append(item)
+
+    completed, overdue_count = counts.completed, counts.overdue
+    return {
+        "tasks": {
+            "total": counts.total,
+            "completed": completed,
+            "in_progress": counts.in_progress,
+            "blocked": counts.blocked,
+            "pending": counts.pending,
+            "overdue": overdue_count,
+            "incomplete": counts.total - completed - overdue_count,
+        },
+        "overdue_tasks": overdue[:MAX_LISTED_TASKS],
+        "in_progress_tasks": in_progress[:MAX_LISTED_TASKS],
+    }
+
+
+def _top_performers(db: Session, day: date) -> List[Dict[str, Any]]:
+    """Employees who completed the largest share of the day's tasks (1 query)."""
+    history = task_history(db, day, day)
+    tasks = history.tasks.c
+    completed = func.count().filter(tasks.status == TaskStatus.COMPLETED)
+    rows = db.execute(
+        select(Employee.id, Employee.name, completed.label("completed"), func.count().label("total"))
+        .join(history.tasks, tasks.assigned_to == Employee.id)
+        .where(tasks.due_date == day, tasks.is_subtask == False)
+        .group_by(Employee.id, Employee.name)
+        .having(completed > 0)
+        .order_by((completed * 1.0 / func.count()).desc(), completed.desc(), Employee.name)
+        .limit(TOP_PERFORMERS)
+    ).all()
+    return [
+        {"employee_id": str(row.id), "name": row.name, "completed": row.completed, "total": row.total}
+        for row in rows
+    ]
+
+
+def _percent(part: int, whole: int) -> int:
+    return round(part * 100 / whole) if whole else 0
+
+
+def _employee_lines(employees: List[Dict[str, Any]]) -> List[str]:
+    return [
+        EMPLOYEE_LINE.format(name=employee["name"], labels=f" ({employee['labels']})" if employee["labels"] else "")
+        for employee in employees
+    ]
+
+
+def _task_lines(tasks: List[Dict[str, Any]], with_due: bool = False, with_reason: bool = False) -> List[str]:
+    lines = []
+    for index, task in enumerate(tasks, 1):
+        due = ""
+        if with_due and task["due_time"]:
+            due = f" - Due {task['due_time'][:5]}"
+        lines.append(TASK_LINE.format(
+            index=index,
+            task_number=task["task_number"],
+            title=task["title"],
+            employee=task["employee"] or "Unassigned",
+            due=due,
+        ))
+        if with_reason:
+            if task["issue_reported"]:
+                lines.append(f"   • Reason: {task['comment']} (Issue reported)")
+            elif task["comment"]:
+                lines.append(f"   • Employee comment: \"{task['comment']}\"")
+            else:
+                lines.append("   • No response from employee")
+            if task["subtask_number"]:
+                lines.append(f"   • Subtask #{task['subtask_number']} created for you")
+    return lines
+
+
+def _with_sections(header: str, sections: List[Tuple[str, List[str]]]) -> str:
+    parts = [header]
+    for title, lines in sections:
+        if lines:
+            parts.append(f"{SEPARATOR}\n\n{title}\n" + "\n".join(lines))
+    return "\n\n".join(parts)
+
+
+def render_attendance(payload: Dict[str, Any]) -> str:
+    """Morning attendance report."""
+    attendance = payload["attendance"]
+    return _with_sections(ATTENDANCE_TEMPLATE.format(date=payload["date"], **attendance), [
+        ("Absent Employees:", _employee_lines(attendance["absent_employees"])),
+        ("Not Marked:", _employee_lines(attendance["not_marked_employees"])),
+        ("Present Employees:", _employee_lines(attendance["present_employees"])),
+    ])
+
+
+def render_midday(payload: Dict[str, Any]) -> str:
+    """Midday progress report."""
+    return _with_sections(MIDDAY_TEMPLATE.format(date=payload["date"], **payload["tasks"]), [
+        ("⚠️ Overdue Tasks:", _task_lines(payload["overdue_tasks"], with_due=True)),
+        ("🔄 In Progress:", _task_lines(payload["in_progress_tasks"])),
+    ])
+
+
+def render_end_of_day(payload: Dict[str, Any]) -> str:
+    """End-of-day report with carried-forward tasks and top performers."""
+    tasks = payload["tasks"]
+    header = END_OF_DAY_TEMPLATE.format(
+        date=payload["date"],
+        completed=tasks["completed"],
+        overdue=tasks["overdue"],
+        incomplete=tasks["incomplete"],
+        completed_pct=_percent(tasks["completed"], tasks["total"]),
+        overdue_pct=_percent(tasks["overdue"], tasks["total"]),
+        incomplete_pct=_percent(tasks["incomplete"], tasks["total"]),
+    )
+    performers = [
+        PERFORMER_LINE.format(medal=medal, **performer)
+        for medal, performer in zip(MEDALS, payload["top_performers"])
+    ]
+    return _with_sections(header, [
+        ("⚠️ Overdue Tasks (carried forward):", _task_lines(payload["overdue_tasks"], with_reason=True)),
+        ("Top Performers:", performers),
+    ])
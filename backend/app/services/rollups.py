@@ -0,0 +1,360 @@
+"""
+Daily task rollups for reporting analytics.
+Task counts are rolled up per (due date, employee, label, status, priority)
+into task_daily_rollups, so analytics over a year read about
+365 x employees x statuses rows instead of every task.
+
+Past days are appended nightly (scripts/run_report_scheduler.py). A flush
+that changes a task due on an already rolled-up day flags that day dirty,
+and the next refresh recomputes just the flagged days. Days not rolled up
+yet (normally just today) are aggregated live from tasks when read.
+Archived tasks stay counted: recomputes read them through task_history().
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, and_, case, cast, delete, event, func, insert, inspect, null, select, union_all, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.rollup import TaskDailyRollup, TaskRollupDay
+from app.models.task import OPEN_STATUSES, Task, TaskStatus
+from app.services.archive import TaskHistory, task_history
+
+# Days recomputed per transaction
+REFRESH_BATCH_DAYS = 31
+
+ROLLUP_COLUMNS = (
+    "day",
+    "employee_id",
+    "label_id",
+    "status",
+    "priority",
+    "task_count",
+    "completed_on_time",
+    "completed_late",
+    "completion_seconds",
+)
+
+
+def aggregate_tasks(history: TaskHistory, start_date: date, end_date: date, days: Optional[List[date]] = None) -> Any:
+    """
+    Rollup rows computed from tasks, one set without labels and one per label.
+
+    Args:
+        history: Task rows to read (see task_history)
+        start_date: First due date
+        end_date: Last due date
+        days: Only these due dates within the range
+
+    Returns:
+        Select yielding ROLLUP_COLUMNS
+    """
+    tasks, labels = history.tasks.c, history.task_labels.c
+    where = [tasks.is_subtask == False, tasks.due_date.between(start_date, end_date)]
+    if days is not None:
+        where.append(tasks.due_date.in_(days))
+
+    completed = tasks.status == TaskStatus.COMPLETED
+    on_time = and_(completed, cast(tasks.completed_at, Date) <= tasks.due_date)
+    measures = (
+        func.count().label("task_count"),
+        func.count().filter(on_time).label("completed_on_time"),
+        func.count().filter(completed, ~on_time).label("completed_late"),
+        func.coalesce(
+            func.sum(func.extract("epoch", tasks.completed_at - tasks.created_at)).filter(completed), 0.0
+        ).label("completion_seconds"),
+    )
+    keys = (tasks.due_date, tasks.assigned_to, tasks.status, tasks.priority)
+
+    unlabelled = (
+        select(
+            tasks.due_date.label("day"),
+            tasks.assigned_to.label("employee_id"),
+            cast(null(), PG_UUID(as_uuid=True)).label("label_id"),
+            tasks.status,
+            tasks.priority,
+            *measures,
+        )
+        .where(*where)
+        .group_by(*keys)
+    )
+    labelled = (
+        select(
+            tasks.due_date.label("day"),
+            tasks.assigned_to.label("employee_id"),
+            labels.label_id,
+            tasks.status,
+            tasks.priority,
+            *measures,
+        )
+        .select_from(history.tasks)
+        .join(history.task_labels, labels.task_id == tasks.id)
+        .where(*where)
+        .group_by(*keys, labels.label_id)
+    )
+    return union_all(unlabelled, labelled)
+
+
+def mark_rollup_days_dirty(connection: Connection, days: Iterable[date]) -> None:
+    """
+    Flag rolled-up days for recomputation in the caller's transaction.
+    Call this after Core-level task writes that bypass the ORM flush hook.
+
+    Days already dirty are updated too: the caller then holds the day rows
+    until it commits, so a refresh clearing the flag waits for the write
+    instead of aggregating without it.
+    """
+    today = date.today()
+    days = sorted({day for day in days if day is not None and day < today})
+    if not days:
+        return
+    connection.execute(
+        update(TaskRollupDay)
+        .where(TaskRollupDay.day.in_(days))
+        .values(dirty=True)
+    )
+
+
+def append_rollup_days(db: Session, through: date) -> int:
+    """
+    Register days after the last rolled-up one (up to `through`) for rollup.
+
+    Returns:
+        Number of days added
+    """
+    last = db.scalar(select(func.max(TaskRollupDay.day)))
+    if last is None:
+        tasks = task_history(db).tasks
+        last = db.scalar(select(func.min(tasks.c.due_date)))
+        if last is None:
+            return 0
+        last -= timedelta(days=1)
+    if last >= through:
+        return 0
+
+    days = [last + timedelta(days=offset) for offset in range(1, (through - last).days + 1)]
+    db.execute(
+        pg_insert(TaskRollupDay)
+        .values([{"day": day, "dirty": True} for day in days])
+        .on_conflict_do_nothing(index_elements=[TaskRollupDay.day])
+    )
+    db.commit()
+    return len(days)
+
+
+def refresh_rollups(db: Session) -> int:
+    """
+    Recompute every dirty day, REFRESH_BATCH_DAYS per transaction.
+    Locking the day rows waits for writers still holding them, and an edit
+    made while a batch is computed waits in turn, then re-flags its day for
+    the next refresh. Rows are locked in day order.
+
+    Returns:
+        Number of days recomputed
+    """
+    total = 0
+    while True:
+        batch = db.scalars(
+            select(TaskRollupDay.day)
+            .where(TaskRollupDay.dirty == True)
+            .order_by(TaskRollupDay.day)
+            .limit(REFRESH_BATCH_DAYS)
+            .with_for_update()
+        ).all()
+        if not batch:
+            return total
+
+        days = db.scalars(
+            update(TaskRollupDay)
+            .where(TaskRollupDay.day.in_(batch), TaskRollupDay.dirty == True)
+            .values(dirty=False, rolled_up_at=datetime.utcnow())
+            .returning(TaskRollupDay.day)
+        ).all()
+        if days:
+            start_date, end_date = min(days), max(days)
+            db.execute(delete(TaskDailyRollup).where(TaskDailyRollup.day.in_(days)))
+            db.execute(insert(TaskDailyRollup).from_select(
+                ROLLUP_COLUMNS,
+                aggregate_tasks(task_history(db, start_date, end_date), start_date, end_date, days),
+            ))
+        db.commit()
+        total += len(days)
+
+
+def run_rollups(db: Session, through: Optional[date] = None) -> Dict[str, int]:
+    """Append days up to `through` (default yesterday) and recompute dirty days."""
+    through = through or date.today() - timedelta(days=1)
+    appended = append_rollup_days(db, through)
+    return {"appended": appended, "recomputed": refresh_rollups(db)}
+
+
+def rollup_rows(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    employee_id: Optional[UUID] = None,
+    label_id: Optional[UUID] = None,
+):
+    """
+    Rollup rows for a date range: stored rows for rolled-up days, live
+    aggregates for later ones.
+
+    Args:
+        db: Database session
+        start_date: First due date
+        end_date: Last due date
+        employee_id: Only this employee's tasks
+        label_id: Only tasks with this label; None counts all tasks once
+
+    Returns:
+        Subquery with ROLLUP_COLUMNS
+    """
+    last_rolled = db.scalar(select(func.max(TaskRollupDay.day))) or start_date - timedelta(days=1)
+
+    stored = select(*(getattr(TaskDailyRollup, column) for column in ROLLUP_COLUMNS)).where(
+        TaskDailyRollup.day.between(start_date, min(end_date, last_rolled))
+    )
+    sources = [stored]
+    if end_date > last_rolled:
+        live_start = max(start_date, last_rolled + timedelta(days=1))
+        sources.append(aggregate_tasks(task_history(db, live_start, end_date), live_start, end_date))
+
+    rows = union_all(*sources).subquery()
+    filters = [rows.c.label_id == label_id if label_id is not None else rows.c.label_id.is_(None)]
+    if employee_id is not None:
+        filters.append(rows.c.employee_id == employee_id)
+    return select(rows).where(*filters).subquery()
+
+
+def completion_rate(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    employee_id: Optional[UUID] = None,
+    label_id: Optional[UUID] = None,
+) -> List[Dict[str, Any]]:
+    """Tasks due, completed and completed on time per day."""
+    rows = rollup_rows(db, start_date, end_date, employee_id, label_id)
+    completed = rows.c.completed_on_time + rows.c.completed_late
+    result = db.execute(
+        select(
+            rows.c.day,
+            func.sum(rows.c.task_count).label("total"),
+            func.sum(completed).label("completed"),
+            func.sum(rows.c.completed_on_time).label("on_time"),
+        )
+        .group_by(rows.c.day)
+        .order_by(rows.c.day)
+    ).all()
+    return [
+        {
+            "date": row.day.isoformat(),
+            "total": int(row.total),
+            "completed": int(row.completed),
+            "on_time": int(row.on_time),
+            "completion_rate": _rate(row.completed, row.total),
+        }
+        for row in result
+    ]
+
+
+def employee_performance(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    label_id: Optional[UUID] = None,
+) -> List[Dict[str, Any]]:
+    """Per-employee totals over a date range, best completion rate first."""
+    rows = rollup_rows(db, start_date, end_date, label_id=label_id)
+    completed = func.sum(rows.c.completed_on_time + rows.c.completed_late)
+    total = func.sum(rows.c.task_count)
+    result = db.execute(
+        select(
+            rows.c.employee_id,
+            Employee.name,
+            total.label("total"),
+            completed.label("completed"),
+            func.sum(rows.c.completed_on_time).label("on_time"),
+            func.sum(rows.c.task_count).filter(rows.c.status.in_(OPEN_STATUSES)).label("open"),
+            func.sum(rows.c.completion_seconds).label("completion_seconds"),
+        )
+        .join(Employee, Employee.id == rows.c.employee_id)
+        .group_by(rows.c.employee_id, Employee.name)
+        .order_by((completed * 1.0 / total).desc(), completed.desc(), Employee.name)
+    ).all()
+    return [
+        {
+            "employee_id": str(row.employee_id),
+            "name": row.name,
+            "total": int(row.total),
+            "completed": int(row.completed),
+            "on_time": int(row.on_time),
+            "open": int(row.open or 0),
+            "completion_rate": _rate(row.completed, row.total),
+            "on_time_rate": _rate(row.on_time, row.completed),
+            "avg_completion_hours": (
+                round(row.completion_seconds / float(row.completed) / 3600, 2) if row.completed else None
+            ),
+        }
+        for row in result
+    ]
+
+
+def overdue_trends(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    employee_id: Optional[UUID] = None,
+    label_id: Optional[UUID] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Overdue tasks per due date: still open after their day (or marked
+    overdue), and completed after their day.
+    """
+    rows = rollup_rows(db, start_date, end_date, employee_id, label_id)
+    today = date.today()
+    is_overdue = case(
+        (rows.c.day < today, rows.c.status.in_(OPEN_STATUSES)),
+        else_=rows.c.status == TaskStatus.OVERDUE,
+    )
+    result = db.execute(
+        select(
+            rows.c.day,
+            func.sum(rows.c.task_count).label("total"),
+            func.coalesce(func.sum(rows.c.task_count).filter(is_overdue), 0).label("open_overdue"),
+            func.sum(rows.c.completed_late).label("completed_late"),
+        )
+        .group_by(rows.c.day)
+        .order_by(rows.c.day)
+    ).all()
+    return [
+        {
+            "date": row.day.isoformat(),
+            "total": int(row.total),
+            "open_overdue": int(row.open_overdue),
+            "completed_late": int(row.completed_late),
+            "overdue_rate": _rate(row.open_overdue + row.completed_late, row.total),
+        }
+        for row in result
+    ]
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_changed_days(session: Session, flush_context) -> None:
+    """Flag the rolled-up days of every task touched by this flush, old due dates included."""
+    days = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Task) and not obj.is_subtask:
+            days.add(obj.due_date)
+            days.update(inspect(obj).attrs.due_date.history.deleted)
+    if days:
+        mark_rollup_days_dirty(session.connection(), days)
+
+
+def _rate(part, whole) -> float:
+    # SUM over bigint counts comes back as Decimal
+    return round(float(part) * 100 / float(whole), 1) if whole else 0.0
@@ -0,0 +1,164 @@
+"""
+Task actions taken from Telegram buttons.
+A press is applied with one guarded UPDATE ... RETURNING on the task's
+primary key: the WHERE clause checks the assignee and the allowed source
+statuses, so there is no read before the write. Presses that change
+nothing (double taps, stale buttons) cost that one statement only.
+
+Report Issue changes nothing on the press: the task is blocked when the
+employee sends the description (report_task_issue), so a cancelled or
+abandoned report leaves it as it was.
+"""
+import textwrap
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, FrozenSet, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.callback_data import CallbackAction
+from app.core.invalidation import publish_invalidation
+from app.models.employee import Employee
+from app.models.event import EventType
+from app.models.resource_version import Resource
+from app.models.task import OPEN_STATUSES, CommentType, Task, TaskComment, TaskStatus
+from app.services.completion_times import record_task_completion
+from app.services.events import publish_task_event
+from app.services.notifications import notify_issue_reported, notify_task_completed
+from app.services.resource_versions import bump_resource_versions
+from app.services.rollups import mark_rollup_days_dirty
+from app.services.tasks import create_subtask
+
+
+@dataclass(frozen=True)
+class Transition:
+    """Status change a button applies, and the statuses it applies to."""
+    target: TaskStatus
+    allowed_from: FrozenSet[TaskStatus]
+    event_type: EventType
+
+
+TRANSITIONS: Dict[CallbackAction, Transition] = {
+    CallbackAction.START: Transition(
+        TaskStatus.IN_PROGRESS, OPEN_STATUSES - {TaskStatus.IN_PROGRESS}, EventType.TASK_STARTED
+    ),
+    CallbackAction.DONE: Transition(TaskStatus.COMPLETED, OPEN_STATUSES, EventType.TASK_COMPLETED),
+}
+
+# Columns returned by the UPDATE; enough for events and messages
+RETURNED_COLUMNS = (
+    Task.id,
+    Task.task_number,
+    Task.title,
+    Task.status,
+    Task.priority,
+    Task.assigned_to,
+    Task.is_subtask,
+    Task.due_date,
+    Task.created_at,
+    Task.completed_at,
+)
+
+
+def apply_task_action(db: Session, action: CallbackAction, task_id: UUID, employee_id: UUID):
+    """
+    Apply a button press to a task assigned to the employee.
+
+    Args:
+        db: Database session; committed here when the task changed
+        action: Decoded button action
+        task_id: Decoded task ID
+        employee_id: Employee who pressed the button
+
+    Returns:
+        Row with the updated task's RETURNED_COLUMNS, or None if the task is
+        not the employee's or the action does not apply to its status
+    """
+    if action == CallbackAction.ISSUE:
+        # Read only; blocked tasks included, an employee may report a further issue
+        return db.execute(
+            select(*RETURNED_COLUMNS).where(
+                Task.id == task_id,
+                Task.assigned_to == employee_id,
+                Task.status.in_(OPEN_STATUSES),
+            )
+        ).first()
+
+    transition = TRANSITIONS[action]
+    now = datetime.utcnow()
+    values = {"status": transition.target, "updated_at": now}
+    if action == CallbackAction.DONE:
+        values["completed_at"] = now
+
+    task = db.execute(
+        update(Task)
+        .where(
+            Task.id == task_id,
+            Task.assigned_to == employee_id,
+            Task.status.in_(transition.allowed_from),
+        )
+        .values(**values)
+        .returning(*RETURNED_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    if task is None:
+        db.rollback()
+        return None
+
+    # Core UPDATE bypasses the flush hooks
+    bump_resource_versions(db, [Resource.TASKS])
+    mark_rollup_days_dirty(db.connection(), [task.due_date])
+    publish_invalidation(db, "tasks", [str(task.id)])
+    publish_task_event(db, transition.event_type, task)
+    if action == CallbackAction.DONE:
+        record_task_completion(db.connection(), task)
+        notify_task_completed(db, task)
+    db.commit()
+    return task
+
+
+def report_task_issue(db: Session, task_id: UUID, employee_id: UUID, description: str) -> Optional[Task]:
+    """
+    Turn an employee's issue description into a subtask for the owner,
+    blocking the task on it. The description is also kept as an issue
+    comment on the task.
+
+    Args:
+        db: Database session; committed here
+        task_id: Task the issue blocks
+        employee_id: Employee reporting it; must be the assignee
+        description: Issue text from the employee
+
+    Returns:
+        The created subtask, or None if the task is not the employee's or
+        no longer open
+    """
+    task = db.query(Task).filter(
+        Task.id == task_id,
+        Task.assigned_to == employee_id,
+        Task.status.in_(OPEN_STATUSES),
+    ).first()
+    if task is None:
+        return None
+
+    subtask = create_subtask(
+        db,
+        task,
+        title=textwrap.shorten(description, width=200, placeholder="…"),
+        description=description,
+        priority=task.priority,
+        due_date=date.today(),
+    )
+    db.add(TaskComment(
+        task_id=task.id,
+        comment_by_employee_id=employee_id,
+        comment_text=description,
+        comment_type=CommentType.ISSUE_REPORT,
+    ))
+    employee_name = db.query(Employee.name).filter(Employee.id == employee_id).scalar()
+    notify_issue_reported(db, task, subtask, employee_name, description)
+    db.commit()
+    return subtask
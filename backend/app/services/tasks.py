@@ -0,0 +1,138 @@
+"""
+Task creation logic shared by the API and the Telegram bot.
+"""
+from datetime import date, datetime, time
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.event import EventType
+from app.models.task import Task, TaskPriority, TaskStatus, TaskType, task_number_counters, task_numbers
+from app.services.events import publish_task_event
+
+
+def generate_task_number(db: Session, parent_task: Task | None = None) -> str:
+    """
+    Generate a unique task number from its prefix's counter, claimed in
+    task_numbers in the caller's transaction. Concurrent callers wait for
+    each other on the counter row.
+    """
+    if parent_task:
+        # For subtasks: T2024-001-S1, T2024-001-S2, etc.
+        prefix, template = f"{parent_task.task_number}-S", "{}"
+    else:
+        # For main tasks: T2024-001, T2024-002, etc.
+        prefix, template = f"T{datetime.now().year}-", "{:03d}"
+
+    # Skips numbers already issued some other way
+    while True:
+        task_number = prefix + template.format(_next_task_number(db, prefix))
+        if _claim_task_number(db, task_number):
+            return task_number
+
+
+def _next_task_number(db: Session, prefix: str) -> int:
+    """Increment a prefix's counter, starting at 1."""
+    return db.execute(
+        pg_insert(task_number_counters)
+        .values(prefix=prefix, last_value=1)
+        .on_conflict_do_update(
+            index_elements=[task_number_counters.c.prefix],
+            set_={"last_value": task_number_counters.c.last_value + 1},
+        )
+        .returning(task_number_counters.c.last_value)
+    ).scalar_one()
+
+
+def _claim_task_number(db: Session, task_number: str) -> bool:
+    """Record a task number as issued; False if it already was."""
+    return db.execute(
+        pg_insert(task_numbers)
+        .values(task_number=task_number)
+        .on_conflict_do_nothing()
+        .returning(task_numbers.c.task_number)
+    ).first() is not None
+
+
+def create_subtask(
+    db: Session,
+    parent_task: Task,
+    title: str,
+    due_date: date,
+    description: Optional[str] = None,
+    task_type: TaskType = TaskType.ONE_TIME,
+    priority: TaskPriority = TaskPriority.MEDIUM,
+    due_time: Optional[time] = None,
+    assigned_to: Optional[UUID] = None,
+    created_by: Optional[UUID] = None,
+) -> Task:
+    """
+    Add a subtask and mark its parent as blocked on it.
+
+    Args:
+        db: Database session; the caller commits
+        parent_task: Task the subtask blocks
+        title: Subtask title
+        due_date: Subtask due date
+        description: Optional details
+        task_type: Task type
+        priority: Task priority
+        due_time: Optional due time
+        assigned_to: Employee to resolve it; unassigned subtasks are the owner's
+        created_by: User who created it; None when raised through the bot
+
+    Returns:
+        The flushed subtask
+    """
+    subtask = Task(
+        task_number=generate_task_number(db, parent_task),
+        title=title,
+        description=description,
+        task_type=task_type,
+        priority=priority,
+        status=TaskStatus.PENDING,
+        due_date=due_date,
+        due_time=due_time,
+        assigned_to=assigned_to,
+        assigned_by=created_by,
+        created_by=created_by,
+        parent_task_id=parent_task.id,
+        is_subtask=True,
+    )
+    was_blocked = parent_task.status == TaskStatus.BLOCKED
+    parent_task.status = TaskStatus.BLOCKED
+
+    db.add(subtask)
+    db.flush()
+    publish_task_event(db, EventType.TASK_CREATED, subtask)
+    if not was_blocked:
+        publish_task_event(db, EventType.TASK_BLOCKED, parent_task)
+    return subtask
+
+
+def mark_overdue_tasks(db: Session, today: Optional[date] = None) -> int:
+    """
+    Mark open tasks due before today as overdue and publish a TASK_OVERDUE
+    event for each. Blocked tasks keep their status.
+
+    Args:
+        db: Database session; committed here
+        today: Day to compare due dates with (default today)
+
+    Returns:
+        Number of tasks marked
+    """
+    today = today or date.today()
+    tasks = db.query(Task).filter(
+        Task.due_date < today,
+        Task.status.in_((TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS)),
+    ).all()
+    for task in tasks:
+        task.status = TaskStatus.OVERDUE
+    db.flush()
+    for task in tasks:
+        publish_task_event(db, EventType.TASK_OVERDUE, task)
+    db.commit()
+    return len(tasks)
@@ -0,0 +1,142 @@
+"""
+Telegram bot update handlers.
+Updates arrive through the webhook and are processed by the update
+dispatcher, one chat at a time in order.
+"""
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.callback_data import CallbackAction, decode_callback
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.conversation import ConversationStep
+from app.services.conversations import conversation_store
+from app.services.employee_directory import TelegramEmployee, employee_directory
+from app.services.task_actions import apply_task_action, report_task_issue
+from app.services.telegram_sender import TelegramSender
+from app.services.telegram_updates import UpdateDispatcher
+
+HELP_TEXT = (
+    "👋 Team Task Manager\n\n"
+    "Your tasks arrive here as messages with buttons:\n"
+    "▶️ Start, ✅ Done, ⚠️ Report Issue\n\n"
+    "/help - Show this message\n"
+    "/cancel - Cancel the current question"
+)
+
+ISSUE_PROMPT = "⚠️ What is blocking #{task_number}? Reply with a short description, or /cancel."
+
+# Answer shown on the button press, by action
+ACTION_ANSWERS = {
+    CallbackAction.START: "▶️ Started #{task_number}",
+    CallbackAction.DONE: "✅ Task #{task_number} completed",
+    CallbackAction.ISSUE: "⚠️ Describe the issue with #{task_number}",
+}
+
+NOT_LINKED_TEXT = (
+    "👋 Your Telegram ID is {telegram_user_id}.\n"
+    "Ask the owner to add it to your employee profile to receive tasks here."
+)
+
+# Pooled, rate-limited client shared by every reply
+telegram_sender = TelegramSender()
+
+
+async def handle_update(update: Dict[str, Any]) -> None:
+    """Resolve the sender and route an update to its handler."""
+    if "callback_query" in update:
+        query = update["callback_query"]
+        employee = await employee_directory.resolve(query["from"]["id"])
+        await handle_callback_query(query, employee)
+    elif "message" in update and "from" in update["message"]:
+        message = update["message"]
+        employee = await employee_directory.resolve(message["from"]["id"])
+        await handle_message(message, employee)
+
+
+async def handle_message(message: Dict[str, Any], employee: Optional[TelegramEmployee]) -> None:
+    """Handle a text message or command."""
+    chat_id = message["chat"]["id"]
+    text = (message.get("text") or "").strip()
+    if not text:
+        return
+
+    if text.startswith("/"):
+        command = text.split()[0].split("@")[0].lower()
+        if command in ("/start", "/help"):
+            if employee is None:
+                reply = NOT_LINKED_TEXT.format(telegram_user_id=message["from"]["id"])
+            else:
+                reply = HELP_TEXT
+            await telegram_sender.send_message(chat_id, reply)
+        elif command == "/cancel":
+            conversation_store.clear(chat_id)
+            await telegram_sender.send_message(chat_id, "👌 Cancelled")
+        return
+
+    conversation = await conversation_store.get(chat_id)
+    if conversation is None or employee is None or not employee.is_active:
+        return
+
+    if conversation.step == ConversationStep.AWAITING_ISSUE_DESCRIPTION:
+        task_id = UUID(conversation.data["task_id"])
+        subtask_number = await run_in_threadpool(_report_task_issue, task_id, employee.employee_id, text)
+        conversation_store.clear(chat_id)
+        if subtask_number is None:
+            reply = "This task is already done or no longer assigned to you"
+        else:
+            reply = f"✅ Thanks, the owner has been told (#{subtask_number})"
+        await telegram_sender.send_message(chat_id, reply)
+
+
+async def handle_callback_query(query: Dict[str, Any], employee: Optional[TelegramEmployee]) -> None:
+    """Handle an inline keyboard button press."""
+    if employee is None or not employee.is_active:
+        await telegram_sender.answer_callback_query(query["id"], "You are not registered as an active employee")
+        return
+
+    decoded = decode_callback(query.get("data") or "")
+    if decoded is None:
+        await telegram_sender.answer_callback_query(query["id"], "This button is no longer valid")
+        return
+
+    action, task_id = decoded
+    task = await run_in_threadpool(_apply_task_action, action, task_id, employee.employee_id)
+    if task is None:
+        await telegram_sender.answer_callback_query(
+            query["id"], "This task is already done or no longer assigned to you"
+        )
+        return
+
+    await telegram_sender.answer_callback_query(
+        query["id"], ACTION_ANSWERS[action].format(task_number=task.task_number)
+    )
+    if action == CallbackAction.ISSUE:
+        chat_id = (query.get("message") or {}).get("chat", {}).get("id", query["from"]["id"])
+        conversation_store.set(
+            chat_id,
+            ConversationStep.AWAITING_ISSUE_DESCRIPTION,
+            {"task_id": str(task.id), "task_number": task.task_number},
+        )
+        await telegram_sender.send_message(chat_id, ISSUE_PROMPT.format(task_number=task.task_number))
+
+
+def _apply_task_action(action: CallbackAction, task_id: UUID, employee_id: UUID):
+    with SessionLocal() as db:
+        return apply_task_action(db, action, task_id, employee_id)
+
+
+def _report_task_issue(task_id: UUID, employee_id: UUID, description: str) -> Optional[str]:
+    with SessionLocal() as db:
+        subtask = report_task_issue(db, task_id, employee_id, description)
+        return subtask.task_number if subtask is not None else None
+
+
+# One dispatcher per worker process, started with the app
+update_dispatcher = UpdateDispatcher(
+    handle_update,
+    shards=settings.TELEGRAM_UPDATE_SHARDS,
+    queue_size=settings.TELEGRAM_UPDATE_QUEUE_SIZE,
+)
@@ -0,0 +1,208 @@
+"""
+Rate-limited Telegram Bot API sender.
+Sends messages concurrently over a pooled HTTP client while staying within
+Telegram's limits: about 30 messages per second overall and one per second
+per chat. 429 responses pause sending for the advertised Retry-After.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Idle per-chat gates are dropped once this many exist
+MAX_CHAT_GATES = 10_000
+
+
+class TelegramError(Exception):
+    """Telegram API call failed."""
+
+    def __init__(
+        self,
+        description: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(description)
+        self.description = description
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def permanent(self) -> bool:
+        """Whether retrying cannot help (bad request, bot blocked, chat gone)."""
+        return self.status_code in (400, 401, 403, 404)
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+    Waiters are served in arrival order, each sleeping only as long as the
+    next token takes to refill.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait for and take one token."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class ChatGate:
+    """
+    Minimum spacing between sends to one chat.
+    Spacing is stamped when the send actually goes out (after any wait for
+    the global limit), so queued messages can never bunch up.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self.next_at = 0.0
+        self.lock = asyncio.Lock()
+
+    @property
+    def idle(self) -> bool:
+        """Unused and past its spacing, so it can be dropped and recreated later."""
+        return not self.lock.locked() and self.next_at <= time.monotonic()
+
+
+class TelegramSender:
+    """Async Telegram Bot API client with global and per-chat rate limits."""
+
+    def __init__(
+        self,
+        token: str = settings.TELEGRAM_BOT_TOKEN,
+        base_url: str = settings.TELEGRAM_API_BASE_URL,
+        global_rate: float = settings.TELEGRAM_GLOBAL_RATE,
+        chat_rate: float = settings.TELEGRAM_CHAT_RATE,
+        max_retries: int = 3,
+    ) -> None:
+        self.client = httpx.AsyncClient(
+            base_url=f"{base_url.rstrip('/')}/bot{token}",
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        self.chat_rate = chat_rate
+        self.max_retries = max_retries
+        self._global = TokenBucket(global_rate, global_rate)
+        self._chats: Dict[int, ChatGate] = {}
+        self._resume_at = 0.0
+
+    async def send_message(
+        self,
+        chat_id: int,
+        text: str,
+        reply_markup: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a text message, waiting for rate-limit capacity first.
+
+        Returns:
+            The sent Telegram message
+
+        Raises:
+            TelegramError: If the API rejects the request or is unreachable
+        """
+        payload: Dict[str, Any] = {"chat_id": chat_id, "text": text}
+        if reply_markup:
+            payload["reply_markup"] = reply_markup
+        return await self.call("sendMessage", payload, chat_id=chat_id)
+
+    async def answer_callback_query(self, callback_query_id: str, text: Optional[str] = None) -> None:
+        """
+        Acknowledge a button press (stops the client's loading spinner).
+        Not a message send, so it bypasses the send limits.
+        """
+        payload: Dict[str, Any] = {"callback_query_id": callback_query_id}
+        if text:
+            payload["text"] = text
+        await self._post("answerCallbackQuery", payload)
+
+    async def call(self, method: str, payload: Dict[str, Any], chat_id: Optional[int] = None) -> Any:
+        """
+        Call a Bot API method within the rate limits.
+        429 responses are retried after their Retry-After, up to max_retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(chat_id)
+            try:
+                return await self._post(method, payload)
+            except TelegramError as exc:
+                if exc.retry_after is None or attempt == self.max_retries:
+                    raise
+                # Flood control applies to the whole bot: hold every send
+                self._resume_at = max(self._resume_at, time.monotonic() + exc.retry_after)
+                logger.warning("Telegram flood control, pausing sends for %ss", exc.retry_after)
+
+    async def _acquire(self, chat_id: Optional[int]) -> None:
+        if chat_id is None:
+            await self._acquire_global()
+            return
+
+        # Wait for the chat first, so a busy chat never holds a global token
+        gate = self._chat_gate(chat_id)
+        async with gate.lock:
+            while (delay := gate.next_at - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            await self._acquire_global()
+            gate.next_at = time.monotonic() + gate.interval
+
+    async def _acquire_global(self) -> None:
+        while (delay := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await self._global.acquire()
+
+    def _chat_gate(self, chat_id: int) -> ChatGate:
+        gate = self._chats.get(chat_id)
+        if gate is None:
+            if len(self._chats) >= MAX_CHAT_GATES:
+                self._chats = {chat: g for chat, g in self._chats.items() if not g.idle}
+            gate = self._chats[chat_id] = ChatGate(self.chat_rate)
+        return gate
+
+    async def _post(self, method: str, payload: Dict[str, Any]) -> Any:
+        """Call a Bot API method and return its result."""
+        try:
+            response = await self.client.post(f"/{method}", json=payload)
+        except httpx.HTTPError as exc:
+            raise TelegramError(f"{type(exc).__name__}: {exc}") from exc
+
+        try:
+            data = response.json()
+        except ValueError:
+            raise TelegramError(f"HTTP {response.status_code}", response.status_code)
+
+        if not data.get("ok"):
+            retry_after = (data.get("parameters") or {}).get("retry_after")
+            if retry_after is None and response.status_code == 429:
+                retry_after = float(response.headers.get("retry-after", 1))
+            raise TelegramError(
+                data.get("description", f"HTTP {response.status_code}"),
+                response.status_code,
+                retry_after,
+            )
+        return data["result"]
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
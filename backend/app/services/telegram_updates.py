@@ -0,0 +1,122 @@
+"""
+Telegram update dispatcher.
+The webhook acknowledges updates immediately and hands them to a pool of
+shard workers keyed by chat ID: updates from one chat are processed strictly
+in order, while different chats run concurrently. Shard queues are bounded;
+when one is full the webhook refuses the update and Telegram retries it later.
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+UpdateHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Update types that carry a chat, in the order they are checked
+CHAT_UPDATE_KEYS = (
+    "message",
+    "edited_message",
+    "callback_query",
+    "channel_post",
+    "edited_channel_post",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+)
+
+# Recently accepted update IDs remembered to drop Telegram redeliveries
+RECENT_UPDATE_IDS = 10_000
+
+
+def update_chat_id(update: Dict[str, Any]) -> int:
+    """Chat an update belongs to (0 for chatless updates such as polls)."""
+    for key in CHAT_UPDATE_KEYS:
+        payload = update.get(key)
+        if payload:
+            chat = payload.get("chat") or (payload.get("message") or {}).get("chat")
+            if chat:
+                return chat["id"]
+            return (payload.get("from") or {}).get("id", 0)
+    return 0
+
+
+class UpdateDispatcher:
+    """Sharded, bounded, per-chat ordered update processing."""
+
+    def __init__(self, handler: UpdateHandler, shards: int, queue_size: int) -> None:
+        self.handler = handler
+        self.shards = shards
+        self.queue_size = queue_size
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        self._recent: "OrderedDict[int, None]" = OrderedDict()
+        self.stats = {"accepted": 0, "rejected": 0, "duplicates": 0, "processed": 0, "failed": 0}
+
+    async def start(self) -> None:
+        """Start one worker task per shard."""
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.shards)]
+        self._tasks = [asyncio.create_task(self._run_shard(queue)) for queue in self._queues]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Let queued updates finish (up to timeout), then stop the workers."""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues)), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopping with %d Telegram updates unprocessed", self.backlog)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+
+    @property
+    def backlog(self) -> int:
+        """Updates waiting across all shards."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def submit(self, update: Dict[str, Any]) -> bool:
+        """
+        Queue an update on its chat's shard without waiting.
+
+        Returns:
+            False if the shard is full (or not started) and the update should be refused
+        """
+        if not self._queues:
+            return False
+
+        update_id: Optional[int] = update.get("update_id")
+        if update_id is not None and update_id in self._recent:
+            self.stats["duplicates"] += 1
+            return True
+
+        queue = self._queues[update_chat_id(update) % self.shards]
+        try:
+            queue.put_nowait(update)
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            return False
+
+        self.stats["accepted"] += 1
+        if update_id is not None:
+            self._recent[update_id] = None
+            if len(self._recent) > RECENT_UPDATE_IDS:
+                self._recent.popitem(last=False)
+        return True
+
+    async def _run_shard(self, queue: asyncio.Queue) -> None:
+        while True:
+            update = await queue.get()
+            try:
+                await self.handler(update)
+                self.stats["processed"] += 1
+            except Exception:
+                self.stats["failed"] += 1
+                logger.exception("Telegram update %s failed", update.get("update_id"))
+            finally:
+                queue.task_done()
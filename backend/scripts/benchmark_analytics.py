@@ -0,0 +1,205 @@
+"""
+Benchmark for task analytics.
+Compares generator-based counting over task objects (the style of
+get_dashboard_stats) with the vectorized NumPy path in
+app.services.analytics, at 1M tasks by default:
+
+- Dashboard counters: one generator pass per figure, as the dashboard does
+- Daily trends: per-day status counts, on-time completions, overdue counts
+  and trailing 7-day rates, as a single dict-counting Python pass
+
+The vectorized timings include decoding the binary COPY stream into arrays
+(what load_task_columns does), but not the database side. No database is
+needed. The objects are plain slotted classes, which are cheaper to build
+and read than the ORM instances get_dashboard_stats loads, so the
+generator numbers are a lower bound.
+
+Usage:
+    python scripts/benchmark_analytics.py [task_count ...]
+"""
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from app.models.task import TaskStatus
+from app.services import analytics
+
+DEFAULT_TASK_COUNTS = [1_000_000]
+REPEAT = 3
+DAYS = 365
+EMPLOYEES = 25
+WINDOW = 7
+COPY_WRITE_SIZE = 1 << 20
+
+
+class TaskRow:
+    """Task attributes the counters read."""
+    __slots__ = ("status", "due_date", "assigned_to", "completed_at")
+
+    def __init__(self, status, due_date, assigned_to, completed_at):
+        self.status = status
+        self.due_date = due_date
+        self.assigned_to = assigned_to
+        self.completed_at = completed_at
+
+
+def build_tasks(count, start, employee_ids):
+    """Build task objects and the integer rows the streaming query would return."""
+    rng = random.Random(42)
+    statuses = analytics.TASK_STATUSES
+    objects, rows = [], []
+    for _ in range(count):
+        day = rng.randrange(DAYS)
+        code = rng.randrange(len(statuses))
+        employee = rng.randrange(-1, EMPLOYEES)
+        completed_day = day + rng.randrange(-1, 3) if statuses[code] == TaskStatus.COMPLETED else int(analytics.NO_DAY)
+        objects.append(TaskRow(
+            statuses[code],
+            start + timedelta(days=day),
+            employee_ids[employee] if employee >= 0 else None,
+            datetime.combine(start + timedelta(days=completed_day), datetime.min.time())
+            if completed_day != analytics.NO_DAY else None,
+        ))
+        rows.append((day, code, employee, completed_day))
+    return objects, rows
+
+
+def generator_dashboard(tasks, today):
+    """Dashboard-style counters: one generator pass per figure."""
+    return {
+        "pending": sum(1 for t in tasks if t.status == TaskStatus.PENDING),
+        "in_progress": sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS),
+        "completed": sum(1 for t in tasks if t.status == TaskStatus.COMPLETED),
+        "overdue": sum(1 for t in tasks if t.due_date < today and t.status not in [TaskStatus.COMPLETED]),
+    }
+
+
+def vectorized_dashboard(columns, today):
+    """The same counters from the status and day arrays."""
+    counts = np.bincount(columns.status, minlength=len(analytics.TASK_STATUSES))
+    past = columns.day < (today - columns.start_date).days
+    return {
+        "pending": int(counts[analytics.TASK_STATUSES.index(TaskStatus.PENDING)]),
+        "in_progress": int(counts[analytics.TASK_STATUSES.index(TaskStatus.IN_PROGRESS)]),
+        "completed": int(counts[analytics.COMPLETED]),
+        "overdue": int(np.count_nonzero(past & (columns.status != analytics.COMPLETED))),
+    }
+
+
+def generator_trends(tasks, start, today):
+    """Daily trends in one Python pass with counters, then rolling windows in Python."""
+    by_day_status = Counter()
+    on_time = Counter()
+    for t in tasks:
+        by_day_status[t.due_date, t.status] += 1
+        if t.completed_at is not None and t.completed_at.date() <= t.due_date:
+            on_time[t.due_date] += 1
+
+    days = [start + timedelta(days=offset) for offset in range(DAYS)]
+    open_statuses = [status for status in TaskStatus if status != TaskStatus.COMPLETED]
+    total = [sum(by_day_status[day, status] for status in TaskStatus) for day in days]
+    completed = [by_day_status[day, TaskStatus.COMPLETED] for day in days]
+    overdue = [
+        sum(by_day_status[day, status] for status in open_statuses) if day < today
+        else by_day_status[day, TaskStatus.OVERDUE]
+        for day in days
+    ]
+
+    def rolling(values):
+        return [sum(values[max(0, i - WINDOW + 1):i + 1]) for i in range(len(values))]
+
+    rolling_total = rolling(total)
+    return {
+        "total": total,
+        "completed": completed,
+        "on_time": [on_time[day] for day in days],
+        "overdue": overdue,
+        "rolling_completion_rate": [c / t if t else 0.0 for c, t in zip(rolling(completed), rolling_total)],
+    }
+
+
+def copy_payload(rows):
+    """The binary COPY stream the server sends for the rows' int4 columns."""
+    reader = analytics.BinaryCopyReader(4)
+    data = np.empty(len(rows), dtype=reader.row_dtype)
+    data["fields"] = 4
+    for i, column in enumerate(np.array(rows, dtype=np.int32).T):
+        data[f"l{i}"] = 4
+        data[f"v{i}"] = column
+    return reader.SIGNATURE + bytes(8) + data.tobytes() + reader.TRAILER
+
+
+def to_columns(payload, start, employee_ids):
+    """What load_task_columns does with the COPY stream (written in 1 MB pieces)."""
+    reader = analytics.BinaryCopyReader(4)
+    for offset in range(0, len(payload), COPY_WRITE_SIZE):
+        reader.write(payload[offset:offset + COPY_WRITE_SIZE])
+    flat = reader.result()
+    return analytics.TaskColumns(
+        start, DAYS, employee_ids,
+        day=flat[:, 0], status=flat[:, 1], employee=flat[:, 2], completed_day=flat[:, 3],
+    )
+
+
+def best_of(func):
+    """Best wall time of several runs, and the last result."""
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def report(name, before, after):
+    print(f"  {name}")
+    print(f"    Generator : {before * 1000:9.1f} ms")
+    print(f"    Vectorized: {after * 1000:9.1f} ms")
+    print(f"    Speedup   : {before / after:9.1f}x")
+
+
+def main():
+    """Main benchmark function."""
+    task_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_TASK_COUNTS
+    start = date.today() - timedelta(days=DAYS - 1)
+    today = date.today() - timedelta(days=30)
+    employee_ids = [uuid.uuid4() for _ in range(EMPLOYEES)]
+
+    print("=" * 60)
+    print("Task analytics: generator counting vs NumPy")
+    print("=" * 60)
+
+    for count in task_counts:
+        tasks, rows = build_tasks(count, start, employee_ids)
+        payload = copy_payload(rows)
+        print(f"\n{count:,} tasks over {DAYS} days")
+
+        columns = to_columns(payload, start, employee_ids)
+        before, expected = best_of(lambda: generator_dashboard(tasks, today))
+        after, result = best_of(lambda: vectorized_dashboard(to_columns(payload, start, employee_ids), today))
+        assert result == expected
+        report("Dashboard counters", before, after)
+
+        before, expected = best_of(lambda: generator_trends(tasks, start, today))
+        after, result = best_of(lambda: analytics.task_trends(to_columns(payload, start, employee_ids), today, WINDOW))
+        for name in ("total", "completed", "on_time", "overdue"):
+            assert result[name].tolist() == expected[name], name
+        assert np.allclose(result["rolling_completion_rate"], expected["rolling_completion_rate"])
+        report("Daily trends", before, after)
+
+        conversion, _ = best_of(lambda: to_columns(payload, start, employee_ids))
+        compute, _ = best_of(lambda: analytics.task_trends(columns, today, WINDOW))
+        print(f"  (of which COPY stream -> arrays {conversion * 1000:.1f} ms, trends {compute * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark for response compression.
+Measures CPU cost versus bytes saved for gzip and brotli at several levels on
+task list payloads, and the cost of serving a hot payload from the
+precompressed cache instead.
+
+No database is needed; payloads are built from synthetic task rows.
+
+Usage:
+    python scripts/benchmark_compression.py [task_count ...]
+"""
+import gzip
+import hashlib
+import sys
+import time
+import uuid
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import orjson
+
+from app.core.middleware import CompressedBodyCache, brotli
+
+DEFAULT_TASK_COUNTS = [100, 1_000, 10_000]
+REPEAT = 5
+GZIP_LEVELS = [1, 6, 9]
+BROTLI_QUALITIES = [1, 5, 11]
+
+
+def build_payload(count):
+    """Build a task list JSON body shaped like GET /api/tasks."""
+    statuses = ["pending", "assigned", "in_progress", "completed", "overdue"]
+    now = datetime.utcnow().isoformat()
+    employees = [str(uuid.uuid4()) for _ in range(20)]
+    rows = [
+        {
+            "title": f"Clean display shelves {i}",
+            "description": "Wipe glass and rearrange the gold chain trays",
+            "task_type": "routine",
+            "priority": "high",
+            "due_date": (date.today() - timedelta(days=i % 30)).isoformat(),
+            "due_time": "18:00:00",
+            "id": str(uuid.uuid4()),
+            "task_number": f"T2024-{i:05d}",
+            "status": statuses[i % len(statuses)],
+            "assigned_to": employees[i % len(employees)],
+            "assigned_by": employees[0],
+            "created_by": employees[0],
+            "parent_task_id": None,
+            "is_subtask": False,
+            "telegram_message_id": 1000 + i,
+            "completed_at": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+    return orjson.dumps(rows)
+
+
+def best_of(func):
+    """Best wall time of several runs, with the last result."""
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def report(name, body, elapsed, compressed):
+    """Print one benchmark line."""
+    saved = len(body) - len(compressed)
+    print(
+        f"  {name:<11} {elapsed * 1000:8.2f} ms  {len(compressed):>10,} B  "
+        f"{len(compressed) / len(body) * 100:5.1f}%  "
+        f"{saved / max(elapsed, 1e-9) / 1e6:8.1f} MB saved per CPU-second"
+    )
+
+
+def main():
+    """Main benchmark function."""
+    task_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_TASK_COUNTS
+
+    print("=" * 60)
+    print("Response compression: CPU cost vs bytes saved")
+    print("=" * 60)
+
+    for count in task_counts:
+        body = build_payload(count)
+        print(f"\n{count:,} tasks, {len(body):,} B uncompressed")
+
+        for level in GZIP_LEVELS:
+            elapsed, compressed = best_of(lambda: gzip.compress(body, compresslevel=level, mtime=0))
+            report(f"gzip-{level}", body, elapsed, compressed)
+
+        if brotli is not None:
+            for quality in BROTLI_QUALITIES:
+                elapsed, compressed = best_of(lambda: brotli.compress(body, quality=quality))
+                report(f"br-{quality}", body, elapsed, compressed)
+        else:
+            print("  brotli not installed, skipping")
+
+        # Hot payload: body hash + cache lookup replaces compression
+        cache = CompressedBodyCache(64 * 1024 * 1024)
+        key = (hashlib.blake2b(body, digest_size=16).hexdigest(), "gzip")
+        cache.put(key, gzip.compress(body, mtime=0))
+        elapsed, _ = best_of(
+            lambda: cache.get((hashlib.blake2b(body, digest_size=16).hexdigest(), "gzip"))
+        )
+        print(f"  {'cache hit':<11} {elapsed * 1000:8.2f} ms  (hash + lookup)")
+
+
+if __name__ == "__main__":
+    main()
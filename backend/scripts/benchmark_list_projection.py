@@ -0,0 +1,116 @@
+"""
+Micro-benchmark for the task list read path.
+Compares ORM hydration against the Core row projection used by the list
+endpoints, per row, at 10k and 100k rows.
+
+Rows are inserted in a transaction that is rolled back at the end, so the
+configured database is left untouched.
+
+Usage:
+    python scripts/benchmark_list_projection.py [row_count ...]
+"""
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, select
+
+from app.core.database import SessionLocal
+from app.core.projection import schema_columns, fetch_rows
+from app.models import *  # Import all models to register them
+from app.models.task import Task, TaskStatus, TaskPriority, TaskType
+from app.schemas.task import TaskResponse
+
+DEFAULT_ROW_COUNTS = [10_000, 100_000]
+INSERT_CHUNK = 5_000
+TASK_COLUMNS = schema_columns(Task, TaskResponse)
+
+
+def seed_tasks(db, count):
+    """Insert benchmark tasks inside the current transaction."""
+    statuses = list(TaskStatus)
+    today = date.today()
+    now = datetime.utcnow()
+    for start in range(0, count, INSERT_CHUNK):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "task_number": f"BENCH-{i:07d}",
+                "title": f"Benchmark task {i}",
+                "description": "Generated by benchmark_list_projection.py",
+                "task_type": TaskType.ONE_TIME,
+                "priority": TaskPriority.MEDIUM,
+                "status": statuses[i % len(statuses)],
+                "due_date": today - timedelta(days=i % 365),
+                "is_subtask": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(start, min(start + INSERT_CHUNK, count))
+        ]
+        db.execute(insert(Task.__table__), rows)
+    db.flush()
+
+
+def orm_read(db):
+    """ORM read path: hydrate Task entities, validate from attributes."""
+    tasks = db.query(Task).filter(Task.task_number.like("BENCH-%")).all()
+    return [TaskResponse.model_validate(task) for task in tasks]
+
+
+def core_read(db):
+    """Core read path: select response columns, validate plain rows."""
+    rows = fetch_rows(db, select(*TASK_COLUMNS).where(Task.task_number.like("BENCH-%")))
+    return [TaskResponse.model_validate(row) for row in rows]
+
+
+def measure(db, read, count):
+    """Run a read path once, returning (seconds, peak bytes)."""
+    db.expunge_all()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = read(db)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == count
+    db.expunge_all()
+    return elapsed, peak
+
+
+def main():
+    """Main benchmark function."""
+    row_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_ROW_COUNTS
+
+    print("=" * 60)
+    print("Task list read path: ORM hydration vs Core projection")
+    print("=" * 60)
+
+    for count in row_counts:
+        db = SessionLocal()
+        try:
+            seed_tasks(db, count)
+            # Warm up statement caches before timing
+            measure(db, orm_read, count)
+            measure(db, core_read, count)
+
+            orm_time, orm_peak = measure(db, orm_read, count)
+            core_time, core_peak = measure(db, core_read, count)
+
+            print(f"\n{count:,} rows")
+            print(f"  ORM : {orm_time * 1e6 / count:7.2f} us/row  {orm_peak / count:8.0f} B/row peak")
+            print(f"  Core: {core_time * 1e6 / count:7.2f} us/row  {core_peak / count:8.0f} B/row peak")
+            print(f"  Saved {(1 - core_time / orm_time) * 100:.0f}% CPU, {(1 - core_peak / orm_peak) * 100:.0f}% memory")
+        finally:
+            db.rollback()
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark for task list response serialization.
+Compares the previous path (pydantic validation of each ORM object, then
+jsonable_encoder and the standard json module) with the trusted orjson path
+used by the list endpoints, at 1k and 10k tasks.
+
+No database is needed; tasks are built as transient ORM objects.
+
+Usage:
+    python scripts/benchmark_serialization.py [task_count ...]
+"""
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import List
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import TrustedSerializer
+from app.models import *  # Import all models to register them
+from app.models.task import Task, TaskStatus, TaskPriority, TaskType
+from app.schemas.task import TaskResponse
+
+DEFAULT_TASK_COUNTS = [1_000, 10_000]
+REPEAT = 5
+
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+TASK_SERIALIZER = TrustedSerializer(TaskResponse)
+
+
+def build_tasks(count):
+    """Build transient Task objects with every response field populated."""
+    statuses = list(TaskStatus)
+    now = datetime.utcnow()
+    return [
+        Task(
+            id=uuid.uuid4(),
+            task_number=f"T2024-{i:05d}",
+            title=f"Clean display shelves {i}",
+            description="Wipe glass and rearrange the gold chain trays",
+            task_type=TaskType.ROUTINE,
+            priority=TaskPriority.HIGH,
+            status=statuses[i % len(statuses)],
+            due_date=date.today() - timedelta(days=i % 30),
+            due_time=dt_time(18, 0),
+            assigned_to=uuid.uuid4(),
+            assigned_by=uuid.uuid4(),
+            created_by=uuid.uuid4(),
+            parent_task_id=None,
+            is_subtask=False,
+            telegram_message_id=1000 + i,
+            completed_at=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def validated_json(tasks):
+    """Previous path: validate every object, then jsonable_encoder + json.dumps."""
+    validated = TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+
+def trusted_orjson(tasks):
+    """Current path: dump trusted attributes straight to orjson."""
+    return orjson.dumps(TASK_SERIALIZER.dump_many(tasks))
+
+
+def best_of(func, tasks):
+    """Best wall time of several runs."""
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func(tasks)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    """Main benchmark function."""
+    task_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_TASK_COUNTS
+
+    print("=" * 60)
+    print("Task list serialization: validated json vs trusted orjson")
+    print("=" * 60)
+
+    for count in task_counts:
+        tasks = build_tasks(count)
+        assert orjson.loads(trusted_orjson(tasks)) == json.loads(validated_json(tasks))
+
+        before = best_of(validated_json, tasks)
+        after = best_of(trusted_orjson, tasks)
+
+        print(f"\n{count:,} tasks")
+        print(f"  Before: {before * 1000:8.2f} ms")
+        print(f"  After : {after * 1000:8.2f} ms")
+        print(f"  Speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
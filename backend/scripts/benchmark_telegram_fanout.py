@@ -0,0 +1,88 @@
+"""
+Load test for the rate-limited Telegram sender.
+Simulates the morning routine fan-out: sends a burst of messages spread over
+many chats through TelegramSender, and compares the achieved drain time with
+the fastest time Telegram's limits allow.
+
+Start the fake API first:
+    python scripts/fake_telegram_api.py --port 8081
+
+Usage:
+    python scripts/benchmark_telegram_fanout.py [messages] [chats] [--base-url URL] [--naive]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import httpx
+
+from app.core.config import settings
+from app.services.telegram_sender import TelegramSender, TelegramError
+
+
+async def fan_out(sender, messages, chats):
+    """Send every message concurrently; returns the number that failed."""
+    async def send(i):
+        try:
+            await sender.send_message(1000 + i % chats, f"📋 Task #{i:05d}\n\n🎯 Benchmark task")
+        except TelegramError:
+            return 1
+        return 0
+
+    return sum(await asyncio.gather(*(send(i) for i in range(messages))))
+
+
+async def run(args):
+    """Run the burst and print the results."""
+    async with httpx.AsyncClient(base_url=args.base_url) as fake:
+        await fake.post("/stats/reset")
+
+        if args.naive:
+            # No client-side limiting: everything goes out at once
+            sender = TelegramSender(base_url=args.base_url, global_rate=1e9, chat_rate=1e9, max_retries=0)
+        else:
+            sender = TelegramSender(base_url=args.base_url)
+
+        started = time.perf_counter()
+        failed = await fan_out(sender, args.messages, args.chats)
+        elapsed = time.perf_counter() - started
+        await sender.close()
+
+        stats = (await fake.get("/stats")).json()
+
+    per_chat = -(-args.messages // args.chats)
+    ideal = max(
+        (args.messages - settings.TELEGRAM_GLOBAL_RATE) / settings.TELEGRAM_GLOBAL_RATE,
+        (per_chat - 1) / settings.TELEGRAM_CHAT_RATE,
+        0,
+    )
+
+    print(f"\n{args.messages:,} messages to {args.chats:,} chats ({'naive' if args.naive else 'rate-limited'})")
+    print(f"  Delivered : {stats['sent']:,}  failed: {failed:,}  429s: {stats['rejected']:,}")
+    print(f"  Drain time: {elapsed:.2f} s (limits allow {ideal:.2f} s)")
+    print(f"  Throughput: {stats['sent'] / max(elapsed, 1e-9):.1f} msg/s")
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description="Telegram fan-out load test")
+    parser.add_argument("messages", type=int, nargs="?", default=600)
+    parser.add_argument("chats", type=int, nargs="?", default=200)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8081")
+    parser.add_argument("--naive", action="store_true", help="Disable client-side rate limiting")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Telegram fan-out: rate-limited sender vs Telegram limits")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Parquet export of historical data.
+Writes tasks, task comments, attendance and notifications as one Parquet
+file per table and month under EXPORT_DIR (<table>/month=YYYY-MM/), for
+BI tools. Rows are streamed in EXPORT_BATCH_SIZE batches, so memory stays
+bounded. Closed months that were already exported are skipped, so an
+interrupted run resumes where it stopped; the current month is always
+rewritten. Reads from a replica when DB_REPLICA_HOSTS is set. Needs pyarrow.
+
+Usage:
+    python scripts/export_parquet.py
+    python scripts/export_parquet.py --table tasks --table attendance
+    python scripts/export_parquet.py --output /data/exports --force
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.config import settings
+from app.core.database import read_session
+from app.services.parquet_export import EXPORT_TABLES, export_available, export_parquet
+
+
+def print_partition(result):
+    state = "skipped (already exported)" if result.skipped else f"{result.rows:,} rows"
+    print(f"  {result.table:<14} {result.month}  {state}")
+
+
+def main():
+    """Run the export."""
+    parser = argparse.ArgumentParser(description="Export historical data to monthly Parquet files")
+    parser.add_argument("--table", action="append", choices=list(EXPORT_TABLES), help="table to export (repeatable, default all)")
+    parser.add_argument("--output", default=settings.EXPORT_DIR, help="output directory (default EXPORT_DIR)")
+    parser.add_argument("--force", action="store_true", help="rewrite months that were already exported")
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE, help="rows per record batch")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if not export_available():
+        print("pyarrow is not installed: pip install pyarrow")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"Exporting to {Path(args.output).resolve()}")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    with read_session() as db:
+        results = export_parquet(
+            db,
+            tables=args.table,
+            target_dir=args.output,
+            force=args.force,
+            batch_size=args.batch_size,
+            on_partition=print_partition,
+        )
+
+    written = [result for result in results if not result.skipped]
+    print("=" * 60)
+    print(
+        f"{sum(result.rows for result in written):,} rows in {len(written)} partitions, "
+        f"{len(results) - len(written)} skipped, {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Local fake of the Telegram Bot API for load testing the sender.
+Accepts sendMessage, enforces Telegram-like global and per-chat limits
+(answering 429 with retry_after when exceeded) and reports totals at /stats.
+Other methods (answerCallbackQuery, editMessageText, ...) succeed unlimited.
+
+Point the app at it with TELEGRAM_API_BASE_URL=http://127.0.0.1:8081.
+
+Usage:
+    python scripts/fake_telegram_api.py [--port 8081] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+# Seconds of slack for network jitter between sender and fake
+JITTER = 0.05
+
+
+class Limiter:
+    """Token bucket that reports the wait instead of waiting."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def wait(self) -> float:
+        """Seconds until a token is available (0 if one is)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1 - self.rate * JITTER:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+def create_app(global_rate: float, chat_rate: float, latency: float) -> Starlette:
+    """Build the fake API application."""
+    global_limiter = Limiter(global_rate, global_rate)
+    chat_limiters = defaultdict(lambda: Limiter(chat_rate, 1))
+    stats = {"sent": 0, "rejected": 0, "calls": 0, "started": None, "last": None, "chats": defaultdict(int)}
+
+    async def send_message(request: Request) -> JSONResponse:
+        payload = await request.json()
+        if latency:
+            await asyncio.sleep(latency)
+
+        chat_id = payload.get("chat_id")
+        if chat_id is None or not payload.get("text"):
+            return JSONResponse(
+                {"ok": False, "error_code": 400, "description": "Bad Request: message text is empty"},
+                status_code=400,
+            )
+
+        chat_limiter = chat_limiters[chat_id]
+        wait = max(chat_limiter.wait(), global_limiter.wait())
+        if wait:
+            stats["rejected"] += 1
+            retry_after = max(1, round(wait))
+            return JSONResponse(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": f"Too Many Requests: retry after {retry_after}",
+                    "parameters": {"retry_after": retry_after},
+                },
+                status_code=429,
+            )
+
+        chat_limiter.take()
+        global_limiter.take()
+        now = time.monotonic()
+        stats["started"] = stats["started"] or now
+        stats["last"] = now
+        stats["sent"] += 1
+        stats["chats"][chat_id] += 1
+        return JSONResponse({
+            "ok": True,
+            "result": {
+                "message_id": stats["sent"],
+                "chat": {"id": chat_id},
+                "date": int(time.time()),
+                "text": payload["text"],
+            },
+        })
+
+    async def other_method(request: Request) -> JSONResponse:
+        await request.body()
+        if latency:
+            await asyncio.sleep(latency)
+        stats["calls"] += 1
+        return JSONResponse({"ok": True, "result": True})
+
+    async def get_stats(request: Request) -> JSONResponse:
+        elapsed = (stats["last"] - stats["started"]) if stats["started"] else 0.0
+        return JSONResponse({
+            "sent": stats["sent"],
+            "rejected": stats["rejected"],
+            "calls": stats["calls"],
+            "chats": len(stats["chats"]),
+            "elapsed": elapsed,
+        })
+
+    async def reset_stats(request: Request) -> JSONResponse:
+        stats.update(sent=0, rejected=0, calls=0, started=None, last=None, chats=defaultdict(int))
+        return JSONResponse({"ok": True})
+
+    return Starlette(routes=[
+        Route("/bot{token}/sendMessage", send_message, methods=["POST"]),
+        Route("/bot{token}/{method}", other_method, methods=["POST"]),
+        Route("/stats", get_stats),
+        Route("/stats/reset", reset_stats, methods=["POST"]),
+    ])
+
+
+def main():
+    """Run the fake API."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every call")
+    parser.add_argument("--global-rate", type=float, default=30.0)
+    parser.add_argument("--chat-rate", type=float, default=1.0)
+    args = parser.parse_args()
+
+    app = create_app(args.global_rate, args.chat_rate, args.latency)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
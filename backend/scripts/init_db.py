@@ -1,6 +1,7 @@
 """
 Database initialization script.
-Creates the database schema and initial owner user.
+Creates the database schema and initial owner user. Existing databases are
+upgraded with `alembic upgrade head` instead.
 """
 import sys
 from pathlib import Path
@@ -10,6 +11,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from app.core.database import Base, engine, SessionLocal
 from app.core.security import get_password_hash
+from app.services.partitions import ensure_partitions
 from app.models.user import User, UserRole
 from app.models import *  # Import all models to register them
 
@@ -18,6 +20,8 @@ def init_database():
     """Create all database tables."""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        ensure_partitions(connection)
     print("✓ Database tables created successfully!")
 
 
@@ -0,0 +1,225 @@
+"""
+Telegram update replayer for load testing the webhook.
+Generates numbered messages and button presses for many chats and posts them
+to /api/telegram/webhook the way Telegram does: each chat's updates in
+sequence, many chats at once over a fixed number of keep-alive connections,
+retrying refused (503) updates after their Retry-After.
+
+With --in-process the app is served from this process with a recording
+handler, so per-chat ordering is verified and processing throughput is
+measured; otherwise updates go to a running server.
+
+Usage:
+    python scripts/replay_telegram_updates.py [updates] [chats] [--in-process] [--work-ms 2]
+    python scripts/replay_telegram_updates.py 20000 500 --url http://127.0.0.1:8000/api/telegram/webhook
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import orjson
+
+from app.core.config import settings
+from app.services.telegram_updates import update_chat_id
+
+FIRST_CHAT_ID = 100_000
+IN_PROCESS_PORT = 8765
+
+
+def build_updates(count, chats):
+    """Per-chat queues of updates; update_id increases globally, seq per chat."""
+    updates = defaultdict(deque)
+    for update_id in range(1, count + 1):
+        chat_id = FIRST_CHAT_ID + update_id % chats
+        seq = len(updates[chat_id])
+        user = {"id": chat_id, "is_bot": False, "first_name": f"Employee {chat_id}"}
+        chat = {"id": chat_id, "type": "private"}
+        if seq % 3 == 2:
+            update = {
+                "update_id": update_id,
+                "callback_query": {
+                    "id": str(update_id),
+                    "from": user,
+                    "message": {"message_id": seq, "chat": chat, "date": 0},
+                    "data": f"seq:{seq}",
+                },
+            }
+        else:
+            update = {
+                "update_id": update_id,
+                "message": {"message_id": seq, "from": user, "chat": chat, "date": 0, "text": f"seq:{seq}"},
+            }
+        updates[chat_id].append(update)
+    return updates
+
+
+def update_seq(update):
+    """Sequence number a replayed update carries."""
+    payload = update.get("message") or update["callback_query"]
+    return int((payload.get("text") or payload.get("data")).split(":")[1])
+
+
+class Connection:
+    """
+    Minimal keep-alive HTTP/1.1 client.
+    A general-purpose client costs more CPU per request than the webhook
+    itself, which would make the replayer the bottleneck.
+    """
+
+    def __init__(self, host, port, path, secret):
+        self.host = host
+        self.port = port
+        self.head = (
+            f"POST {path} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Content-Type: application/json\r\n"
+            + (f"X-Telegram-Bot-Api-Secret-Token: {secret}\r\n" if secret else "")
+        ).encode()
+        self.reader = None
+        self.writer = None
+
+    async def post(self, body):
+        """Post a JSON body; returns (status, headers)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(self.head + b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        await self.reader.readexactly(int(headers.get("content-length", 0)))
+        return status, headers
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def replay(url, updates, concurrency, secret):
+    """
+    Post every chat's updates in order, chats concurrently.
+    A chat is handed to a connection only once its previous update was
+    acknowledged; refused updates are re-queued after Retry-After.
+    """
+    parts = urlsplit(url)
+    ready = asyncio.Queue()
+    for chat_id in updates:
+        ready.put_nowait(chat_id)
+    remaining = sum(len(chat_updates) for chat_updates in updates.values())
+    finished = asyncio.Event()
+    refused = 0
+
+    async def worker():
+        nonlocal remaining, refused
+        connection = Connection(parts.hostname, parts.port or 80, parts.path, secret)
+        try:
+            while True:
+                chat_id = await ready.get()
+                chat_updates = updates[chat_id]
+                status, headers = await connection.post(orjson.dumps(chat_updates[0]))
+                if status == 503:
+                    refused += 1
+                    delay = float(headers.get("retry-after", 1))
+                    asyncio.get_running_loop().call_later(delay, ready.put_nowait, chat_id)
+                    continue
+                if status != 200:
+                    raise RuntimeError(f"Webhook answered HTTP {status}")
+                chat_updates.popleft()
+                remaining -= 1
+                if chat_updates:
+                    ready.put_nowait(chat_id)
+                elif not remaining:
+                    finished.set()
+        finally:
+            connection.close()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    done = asyncio.create_task(finished.wait())
+    await asyncio.wait([done, *workers], return_when=asyncio.FIRST_COMPLETED)
+    for task in workers:
+        task.cancel()
+    for task in workers:
+        if task.done() and not task.cancelled() and task.exception():
+            raise task.exception()
+    done.cancel()
+    return refused
+
+
+async def run(args):
+    """Replay the updates and print the results."""
+    updates = build_updates(args.updates, args.chats)
+    processed = defaultdict(list)
+    url = args.url
+
+    if args.in_process:
+        import uvicorn
+
+        from app.main import app
+        from app.services.telegram_bot import update_dispatcher
+
+        async def record(update):
+            await asyncio.sleep(args.work_ms / 1000)
+            processed[update_chat_id(update)].append(update_seq(update))
+
+        update_dispatcher.handler = record
+        # The webhook refuses updates without a configured secret
+        settings.TELEGRAM_WEBHOOK_SECRET = args.secret or settings.TELEGRAM_WEBHOOK_SECRET or "replay"
+        await update_dispatcher.start()
+        # Served without startup events: no database or listener needed
+        server = uvicorn.Server(uvicorn.Config(app, port=IN_PROCESS_PORT, lifespan="off", log_level="warning"))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        url = f"http://127.0.0.1:{IN_PROCESS_PORT}/api/telegram/webhook"
+
+    started = time.perf_counter()
+    refused = await replay(url, updates, args.concurrency, args.secret or settings.TELEGRAM_WEBHOOK_SECRET)
+    acked = time.perf_counter() - started
+
+    print(f"\n{args.updates:,} updates from {args.chats:,} chats over {args.concurrency} connections")
+    print(f"  Acknowledged: {acked:.2f} s ({args.updates / acked:,.0f} updates/s), {refused:,} refused with 503")
+
+    if args.in_process:
+        await update_dispatcher.stop(timeout=300)
+        done = time.perf_counter() - started
+        server.should_exit = True
+        await serving
+        out_of_order = sum(1 for seqs in processed.values() if seqs != sorted(seqs))
+        total = sum(len(seqs) for seqs in processed.values())
+        print(f"  Processed   : {total:,} in {done:.2f} s ({total / done:,.0f} updates/s, {args.work_ms} ms each)")
+        print(f"  Chats out of order: {out_of_order}")
+
+
+def main():
+    """Main replay function."""
+    parser = argparse.ArgumentParser(description="Telegram webhook replayer")
+    parser.add_argument("updates", type=int, nargs="?", default=10_000)
+    parser.add_argument("chats", type=int, nargs="?", default=200)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/telegram/webhook")
+    parser.add_argument("--secret", default=None)
+    parser.add_argument("--in-process", action="store_true", help="Serve the app here and verify ordering")
+    parser.add_argument("--work-ms", type=float, default=2.0, help="Simulated handler time (in-process)")
+    parser.add_argument("--concurrency", type=int, default=40, help="Keep-alive connections (Telegram's default)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Telegram webhook replay")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
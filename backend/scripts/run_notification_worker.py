@@ -0,0 +1,51 @@
+"""
+Notification delivery worker.
+Delivers pending outbox notifications to Telegram until interrupted.
+Several workers may run at once; each claims its own batches.
+
+Usage:
+    python scripts/run_notification_worker.py
+"""
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.models import *  # Import all models to register them
+from app.core import invalidation  # Registers the cache invalidation flush hook
+from app.services.notification_worker import NotificationWorker
+from app.services.telegram_sender import TelegramSender
+
+
+async def run():
+    """Run the worker until SIGINT/SIGTERM."""
+    sender = TelegramSender()
+    worker = NotificationWorker(sender)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await sender.close()
+
+
+def main():
+    """Main worker function."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    print("=" * 60)
+    print("Notification worker started (Ctrl+C to stop)")
+    print("=" * 60)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
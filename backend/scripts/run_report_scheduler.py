@@ -0,0 +1,208 @@
+"""
+Owner report scheduler.
+Queues the attendance, midday and end-of-day reports for the owner's
+Telegram chat at REPORT_*_TIME (in TZ) every day. The notification worker
+delivers them. Open tasks past their due date are marked overdue at
+OVERDUE_CHECK_TIME, with a live event each. Also appends yesterday to the
+analytics rollups at ROLLUP_TIME and recomputes days with late edits every
+ROLLUP_REFRESH_INTERVAL minutes, and creates the coming monthly partitions
+of tasks and attendance at PARTITION_MAINTENANCE_TIME. Tasks completed
+more than TASK_ARCHIVE_AFTER_DAYS ago are archived at TASK_ARCHIVE_TIME.
+Run a single scheduler.
+
+Usage:
+    python scripts/run_report_scheduler.py
+    python scripts/run_report_scheduler.py --now end_of_day
+    python scripts/run_report_scheduler.py --overdue    # Mark overdue tasks and exit
+    python scripts/run_report_scheduler.py --rollup    # Backfill/refresh rollups and exit
+    python scripts/run_report_scheduler.py --rebuild-completion-times
+    python scripts/run_report_scheduler.py --partitions    # Create partitions and exit
+    python scripts/run_report_scheduler.py --archive    # Archive old completed tasks and exit
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.models import *  # Import all models to register them
+from app.core import invalidation  # Registers the cache invalidation flush hook
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.services.archive import archive_completed_tasks
+from app.services.completion_times import rebuild_completion_times
+from app.services.partitions import ensure_partitions
+from app.services.reports import ReportKind, send_daily_report
+from app.services.rollups import refresh_rollups, run_rollups
+from app.services.tasks import mark_overdue_tasks
+
+logger = logging.getLogger(__name__)
+
+REPORT_TIMES = {
+    ReportKind.ATTENDANCE: settings.REPORT_ATTENDANCE_TIME,
+    ReportKind.MIDDAY: settings.REPORT_MIDDAY_TIME,
+    ReportKind.END_OF_DAY: settings.REPORT_END_OF_DAY_TIME,
+}
+
+
+def queue_report(kind: ReportKind):
+    """Queue one report for today."""
+    with SessionLocal() as db:
+        notification = send_daily_report(db, kind)
+        db.commit()
+        logger.info("Queued %s report (notification %s)", kind.value, notification.id)
+
+
+def mark_overdue():
+    """Mark open tasks due before today as overdue."""
+    with SessionLocal() as db:
+        marked = mark_overdue_tasks(db)
+    if marked:
+        logger.info("Marked %d tasks overdue", marked)
+
+
+def update_rollups():
+    """Append days up to yesterday to the rollups and recompute edited days."""
+    with SessionLocal() as db:
+        result = run_rollups(db)
+    logger.info("Rollups: %(appended)d days appended, %(recomputed)d days recomputed", result)
+
+
+def refresh_edited_days():
+    """Recompute rolled-up days whose tasks changed."""
+    with SessionLocal() as db:
+        recomputed = refresh_rollups(db)
+    if recomputed:
+        logger.info("Rollups: %d edited days recomputed", recomputed)
+
+
+def maintain_partitions():
+    """Create the coming months' partitions of tasks and attendance."""
+    with engine.begin() as connection:
+        created = ensure_partitions(connection)
+    if created:
+        logger.info("Partitions created: %s", ", ".join(created))
+
+
+def archive_tasks():
+    """Move tasks completed more than TASK_ARCHIVE_AFTER_DAYS ago into the archive."""
+    with SessionLocal() as db:
+        archived = archive_completed_tasks(db)
+    if archived["tasks"]:
+        logger.info("Archived %(tasks)d tasks, %(comments)d comments, %(labels)d labels", archived)
+
+
+def main():
+    """Main scheduler function."""
+    parser = argparse.ArgumentParser(description="Queue owner daily reports")
+    parser.add_argument("--now", choices=[kind.value for kind in ReportKind], help="queue one report and exit")
+    parser.add_argument("--overdue", action="store_true", help="mark overdue tasks and exit")
+    parser.add_argument("--rollup", action="store_true", help="update the analytics rollups and exit")
+    parser.add_argument(
+        "--rebuild-completion-times", action="store_true", help="recount completion time sketches from tasks and exit"
+    )
+    parser.add_argument("--partitions", action="store_true", help="create upcoming table partitions and exit")
+    parser.add_argument("--archive", action="store_true", help="archive old completed tasks and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if args.now:
+        queue_report(ReportKind(args.now))
+        return
+    if args.overdue:
+        mark_overdue()
+        return
+    if args.rollup:
+        update_rollups()
+        return
+    if args.rebuild_completion_times:
+        with SessionLocal() as db:
+            logger.info("Completion time sketches rebuilt: %d bins", rebuild_completion_times(db))
+        return
+    if args.partitions:
+        maintain_partitions()
+        return
+    if args.archive:
+        archive_tasks()
+        return
+
+    scheduler = BlockingScheduler(timezone=settings.TZ)
+    for kind, at in REPORT_TIMES.items():
+        hour, minute = at.split(":")
+        scheduler.add_job(
+            queue_report,
+            CronTrigger(hour=int(hour), minute=int(minute), timezone=settings.TZ),
+            args=[kind],
+            id=f"report-{kind.value}",
+            misfire_grace_time=15 * 60,
+            coalesce=True,
+        )
+
+    hour, minute = settings.OVERDUE_CHECK_TIME.split(":")
+    scheduler.add_job(
+        mark_overdue,
+        CronTrigger(hour=int(hour), minute=int(minute), timezone=settings.TZ),
+        id="overdue",
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+    )
+
+    hour, minute = settings.ROLLUP_TIME.split(":")
+    scheduler.add_job(
+        update_rollups,
+        CronTrigger(hour=int(hour), minute=int(minute), timezone=settings.TZ),
+        id="rollups",
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        refresh_edited_days,
+        IntervalTrigger(minutes=settings.ROLLUP_REFRESH_INTERVAL),
+        id="rollup-refresh",
+        coalesce=True,
+        max_instances=1,
+    )
+
+    hour, minute = settings.PARTITION_MAINTENANCE_TIME.split(":")
+    scheduler.add_job(
+        maintain_partitions,
+        CronTrigger(hour=int(hour), minute=int(minute), timezone=settings.TZ),
+        id="partitions",
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+    )
+
+    hour, minute = settings.TASK_ARCHIVE_TIME.split(":")
+    scheduler.add_job(
+        archive_tasks,
+        CronTrigger(hour=int(hour), minute=int(minute), timezone=settings.TZ),
+        id="archive",
+        misfire_grace_time=60 * 60,
+        coalesce=True,
+    )
+
+    print("=" * 60)
+    print("Report scheduler started (Ctrl+C to stop)")
+    for kind, at in REPORT_TIMES.items():
+        print(f"  {kind.value}: {at} {settings.TZ}")
+    print(f"  overdue: {settings.OVERDUE_CHECK_TIME} {settings.TZ}")
+    print(f"  rollups: {settings.ROLLUP_TIME} {settings.TZ}, edits every {settings.ROLLUP_REFRESH_INTERVAL} min")
+    print(f"  partitions: {settings.PARTITION_MAINTENANCE_TIME} {settings.TZ}, {settings.PARTITION_MONTHS_AHEAD} months ahead")
+    print(f"  archive: {settings.TASK_ARCHIVE_TIME} {settings.TZ}, tasks completed {settings.TASK_ARCHIVE_AFTER_DAYS}+ days ago")
+    print("=" * 60)
+
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Shared fixtures for the backend tests.
+
+The tests run against a real PostgreSQL database, TEST_DB_NAME
+(default team_tasks_test), using the DB_* connection settings from the
+environment. Its tables are created at the start of the session and dropped
+at the end, so never point it at a database with data you want to keep.
+
+TEST_DB_REPLICA_HOSTS lists streaming replicas of that server (JSON, like
+DB_REPLICA_HOSTS) for the read replica tests, which skip without one.
+"""
+import os
+
+os.environ["DB_NAME"] = os.environ.get("TEST_DB_NAME", "team_tasks_test")
+os.environ["DB_REPLICA_HOSTS"] = os.environ.get("TEST_DB_REPLICA_HOSTS", "[]")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import Base, SessionLocal, engine
+from app.core.security import create_access_token, get_password_hash
+from app.models import User, UserRole
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Create every table once per test session."""
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except OperationalError as exc:
+        pytest.skip(f"Test database is not available: {exc}")
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(database):
+    """A session on a database emptied before each test."""
+    with database.begin() as connection:
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+    session = SessionLocal()
+    session.add(User(username="admin", password_hash=get_password_hash("admin123"), role=UserRole.OWNER))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """A TestClient authenticated as the owner."""
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        test_client.headers["Authorization"] = f"Bearer {create_access_token({'sub': 'admin'})}"
+        yield test_client
@@ -0,0 +1,73 @@
+"""
+Task messages held until an employee checks in are released only for tasks
+that are still open and assigned to them; the rest are cancelled.
+"""
+from datetime import date
+
+from app.models import Employee, Notification, NotificationStatus, NotificationType
+from app.services.notifications import coalesce_notifications
+
+
+def create_task(client, employee: Employee, title: str) -> str:
+    response = client.post("/api/tasks/", json={
+        "title": title,
+        "task_type": "one_time",
+        "priority": "medium",
+        "assigned_to": str(employee.id),
+        "due_date": date.today().isoformat(),
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def statuses(db, employee: Employee) -> dict:
+    db.expire_all()
+    return {
+        str(notification.task_id): notification.status
+        for notification in db.query(Notification).filter(
+            Notification.recipient_employee_id == employee.id,
+            Notification.notification_type == NotificationType.TASK_ASSIGNED,
+        )
+    }
+
+
+def test_check_in_releases_only_open_assigned_tasks(db, client):
+    employee, other = Employee(name="Absent employee"), Employee(name="Other employee")
+    db.add_all([employee, other])
+    db.commit()
+
+    kept = create_task(client, employee, "Still open")
+    completed = create_task(client, employee, "Completed meanwhile")
+    reassigned = create_task(client, employee, "Reassigned meanwhile")
+    assert set(statuses(db, employee).values()) == {NotificationStatus.DEFERRED}
+
+    assert client.post(f"/api/tasks/{completed}/complete").status_code == 200
+    assert client.post(f"/api/tasks/{reassigned}/assign", params={"employee_id": str(other.id)}).status_code == 200
+
+    response = client.post("/api/attendance/mark", json={
+        "employee_id": str(employee.id),
+        "status": "present",
+        "date": date.today().isoformat(),
+    })
+    assert response.status_code == 201, response.text
+    assert statuses(db, employee) == {
+        kept: NotificationStatus.PENDING,
+        completed: NotificationStatus.CANCELLED,
+        reassigned: NotificationStatus.CANCELLED,
+    }
+
+
+def test_deferred_messages_expire_with_their_task(db, client):
+    employee = Employee(name="Absent employee")
+    db.add(employee)
+    db.commit()
+
+    kept = create_task(client, employee, "Still open")
+    completed = create_task(client, employee, "Completed meanwhile")
+    assert client.post(f"/api/tasks/{completed}/complete").status_code == 200
+
+    coalesce_notifications(db)
+    assert statuses(db, employee) == {
+        kept: NotificationStatus.DEFERRED,
+        completed: NotificationStatus.CANCELLED,
+    }
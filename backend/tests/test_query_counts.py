@@ -0,0 +1,53 @@
+"""
+The list endpoints load labels with selectinload and everything else with
+raiseload('*'), so the number of queries they run doesn't grow with the
+number of rows, and a lazy load during serialization fails the request.
+
+QueryCountMiddleware counts each request's queries with count_queries() and
+reports them in X-Query-Count; the TestClient runs the app in another thread,
+so the count is read from the header rather than a counter around the call.
+"""
+from datetime import time
+
+import pytest
+
+from app.core.config import settings
+from app.models import Employee, EmployeeLabel, RecurrenceType, Routine
+
+N = 5
+
+
+def seed(db, count: int, batch: str) -> None:
+    """Add `count` employees and routines, each with two of four new labels."""
+    labels = [EmployeeLabel(name=f"{batch} label {i}") for i in range(4)]
+    db.add_all(labels)
+    for i in range(count):
+        db.add(Employee(name=f"{batch} employee {i}", labels=labels[i % 2::2]))
+        db.add(Routine(
+            title=f"{batch} routine {i}",
+            recurrence_type=RecurrenceType.DAILY,
+            recurrence_time=time(9, 0),
+            labels=labels[i % 2::2],
+        ))
+    db.commit()
+
+
+def queries_for(client, path: str, expected_rows: int) -> int:
+    """Request `path` and return how many queries it ran."""
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert len(body) == expected_rows
+    assert all(len(row["labels"]) == 2 for row in body)
+    return int(response.headers["X-Query-Count"])
+
+
+@pytest.mark.parametrize("path", ["/api/employees/", "/api/routines/"])
+def test_list_query_count_is_constant(db, client, path, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_COUNT_HEADER", True)
+    seed(db, N, "first")
+    queries = queries_for(client, path, N)
+    assert queries > 0
+
+    seed(db, N, "second")
+    assert queries_for(client, path, 2 * N) == queries
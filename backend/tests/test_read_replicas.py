@@ -0,0 +1,81 @@
+"""
+Read-your-writes across a primary and a streaming replica.
+
+A write hands the client a write marker; reads that carry it go to the
+primary while the replica lags behind the write, and reads without it go to
+the replica. Replay is paused on the replica to hold it behind, which needs
+a superuser connection.
+"""
+import time
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.database import WRITE_MARKER_HEADER, engine, replica_engines, write_marker_lsn
+from app.models import Employee
+
+pytestmark = pytest.mark.skipif(not replica_engines, reason="TEST_DB_REPLICA_HOSTS is not set")
+
+
+def wait_for_replay(timeout: float = 10.0) -> None:
+    """Wait until the replica has replayed everything written to the primary so far."""
+    with engine.connect() as primary:
+        lsn = primary.execute(text("SELECT pg_current_wal_lsn()")).scalar()
+    deadline = time.monotonic() + timeout
+    with replica_engines[0].connect() as replica:
+        while not replica.execute(
+            text("SELECT pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn)"), {"lsn": lsn}
+        ).scalar():
+            assert time.monotonic() < deadline, "replica did not catch up"
+            time.sleep(0.05)
+
+
+@pytest.fixture
+def paused_replica(db):
+    """Hold the replica at the current state of the primary."""
+    wait_for_replay()
+    with replica_engines[0].connect() as replica:
+        replica.execute(text("SELECT pg_wal_replay_pause()"))
+    try:
+        yield
+    finally:
+        with replica_engines[0].connect() as replica:
+            replica.execute(text("SELECT pg_wal_replay_resume()"))
+
+
+def fresh_client(client, **headers) -> TestClient:
+    """Another client with the same credentials and no cookies."""
+    other = TestClient(client.app)
+    other.headers.update({"Authorization": client.headers["Authorization"], **headers})
+    return other
+
+
+def test_reads_follow_the_write_marker(db, client, paused_replica):
+    employee = Employee(name="Replica employee")
+    db.add(employee)
+    db.commit()
+
+    response = client.post("/api/tasks/", json={
+        "title": "Written on the primary",
+        "task_type": "one_time",
+        "priority": "medium",
+        "assigned_to": str(employee.id),
+        "due_date": date.today().isoformat(),
+    })
+    assert response.status_code == 201, response.text
+    task_id = response.json()["id"]
+    marker = response.headers[WRITE_MARKER_HEADER]
+    assert write_marker_lsn(marker) is not None
+
+    # The writer's cookie and the echoed header both read from the primary
+    assert client.get(f"/api/tasks/{task_id}").status_code == 200
+    assert fresh_client(client, **{WRITE_MARKER_HEADER: marker}).get(f"/api/tasks/{task_id}").status_code == 200
+
+    # Without a marker, or with a tampered one, reads go to the paused replica
+    assert fresh_client(client).get(f"/api/tasks/{task_id}").status_code == 404
+    rest = marker.partition(".")[2]
+    tampered = f"FF/0.{rest}"
+    assert write_marker_lsn(tampered) is None
+    assert fresh_client(client, **{WRITE_MARKER_HEADER: tampered}).get(f"/api/tasks/{task_id}").status_code == 404
@@ -0,0 +1,22 @@
+"""
+The daily report is cached with an ETag derived from its content, so any
+change to what it renders, labels included, gives clients a new body.
+"""
+from app.models import Employee, EmployeeLabel
+
+
+def test_label_rename_changes_the_daily_report(db, client):
+    label = EmployeeLabel(name="Counter")
+    db.add(Employee(name="Labelled employee", labels=[label]))
+    db.commit()
+
+    first = client.get("/api/reports/daily")
+    assert first.status_code == 200
+    assert "Counter" in str(first.json()["attendance"])
+
+    assert client.put(f"/api/labels/{label.id}", json={"name": "Workshop"}).status_code == 200
+
+    second = client.get("/api/reports/daily", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert "Workshop" in str(second.json()["attendance"])
+    assert second.headers["ETag"] != first.headers["ETag"]
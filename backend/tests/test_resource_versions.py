@@ -0,0 +1,69 @@
+"""
+Resource versions are bumped in a short transaction after the change
+commits, so writers don't queue behind each other on the version rows.
+"""
+from sqlalchemy import text
+
+from app.core.database import SessionLocal, engine
+from app.models import Employee, Resource
+from app.services.resource_versions import get_resource_versions
+
+
+def test_version_rows_stay_unlocked_until_commit(db):
+    db.add(Employee(name="Existing employee"))
+    db.commit()
+    (before,) = get_resource_versions(db, Resource.EMPLOYEES)
+    assert before > 0
+
+    writer = SessionLocal()
+    try:
+        writer.add(Employee(name="New employee"))
+        writer.flush()
+
+        # Another writer can take the version rows while the first is still open
+        with engine.begin() as connection:
+            connection.execute(text("SET LOCAL lock_timeout = '1s'"))
+            connection.execute(text("SELECT * FROM resource_versions FOR UPDATE NOWAIT")).all()
+        assert get_resource_versions(db, Resource.EMPLOYEES) == (before,)
+
+        writer.commit()
+    finally:
+        writer.close()
+
+    db.rollback()
+    assert get_resource_versions(db, Resource.EMPLOYEES) == (before + 1,)
+
+
+def test_rolled_back_changes_are_not_counted(db):
+    (before,) = get_resource_versions(db, Resource.EMPLOYEES)
+
+    writer = SessionLocal()
+    try:
+        writer.add(Employee(name="Discarded employee"))
+        writer.flush()
+        writer.rollback()
+        writer.commit()
+    finally:
+        writer.close()
+
+    assert get_resource_versions(db, Resource.EMPLOYEES) == (before,)
+
+
+def test_cached_dashboard_etag_follows_the_body(db, client):
+    first = client.get("/api/dashboard/stats")
+    assert first.status_code == 200
+
+    # A commit whose version bump hasn't landed yet still changes the ETag
+    writer = SessionLocal()
+    try:
+        writer.add(Employee(name="New employee"))
+        writer.flush()
+        writer.info.pop("changed_resources")
+        writer.commit()
+    finally:
+        writer.close()
+
+    second = client.get("/api/dashboard/stats", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.json()["attendance"]["total_employees"] == first.json()["attendance"]["total_employees"] + 1
+    assert second.headers["ETag"] != first.headers["ETag"]
@@ -0,0 +1,54 @@
+"""
+A task edit on a day the refresh is about to recompute is never lost: the
+writer holds the day row until it commits, and the refresh waits for it.
+"""
+import threading
+import time
+from datetime import date, timedelta
+
+from app.core.database import SessionLocal
+from app.models import Task, TaskDailyRollup, TaskStatus
+from app.services.rollups import append_rollup_days, refresh_rollups
+
+
+def refresh_in_background() -> threading.Thread:
+    def refresh() -> None:
+        session = SessionLocal()
+        try:
+            refresh_rollups(session)
+        finally:
+            session.close()
+
+    thread = threading.Thread(target=refresh)
+    thread.start()
+    return thread
+
+
+def test_refresh_waits_for_writers_on_a_dirty_day(db, client):
+    day = date.today() - timedelta(days=3)
+    response = client.post("/api/tasks/", json={"title": "Edited late", "due_date": day.isoformat()})
+    assert response.status_code == 201, response.text
+    task_id = response.json()["id"]
+
+    # Freshly appended days start dirty
+    append_rollup_days(db, date.today() - timedelta(days=1))
+
+    writer = SessionLocal()
+    try:
+        task = writer.get(Task, task_id)
+        task.status = TaskStatus.COMPLETED
+        writer.flush()
+
+        refresh = refresh_in_background()
+        time.sleep(0.5)
+        assert refresh.is_alive()
+        writer.commit()
+    finally:
+        writer.close()
+    refresh.join(10)
+
+    statuses = {
+        row.status
+        for row in db.query(TaskDailyRollup).filter(TaskDailyRollup.day == day)
+    }
+    assert statuses == {TaskStatus.COMPLETED}
@@ -6,6 +6,8 @@ class APIClient {
   private client: AxiosInstance;
   private accessToken: string | null = null;
   private refreshToken: string | null = null;
+  // Write marker from the last successful write, so reads see that write
+  private lastWrite: string | null = null;
 
   constructor() {
     this.client = axios.create({
@@ -21,6 +23,9 @@ class APIClient {
         if (this.accessToken && config.headers) {
           config.headers.Authorization = `Bearer ${this.accessToken}`;
         }
+        if (this.lastWrite && config.headers) {
+          config.headers["X-Last-Write"] = this.lastWrite;
+        }
         return config;
       },
       (error) => {
@@ -31,6 +36,10 @@ class APIClient {
     // Response interceptor for token refresh
     this.client.interceptors.response.use(
       (response) => {
+        const lastWrite = response.headers["x-last-write"];
+        if (lastWrite) {
+          this.lastWrite = lastWrite;
+        }
         return response;
       },
       async (error) => {